@@ -1,15 +1,27 @@
 #!/usr/bin/env python3
 import argparse
 import datetime
+import hashlib
 import json
 import os
 import re
+import struct
 from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_SOURCE_DIR = ROOT / "docs" / "source_texts"
 DEFAULT_OUTPUT_JSON = ROOT / "data" / "source_texts_index.json"
+DEFAULT_SEARCH_OUTPUT = ROOT / "data" / "source_texts_search.bin"
+DEFAULT_META_OUTPUT = ROOT / "data" / "source_texts_meta.json"
+DEFAULT_BLOB_OUTPUT = ROOT / "data" / "source_texts_blob.utf8"
+DEFAULT_MANIFEST = ROOT / "data" / "source_texts_manifest.json"
+# Bump when parsing or sectioning rules change so cached sources are re-sectioned.
+INDEXER_VERSION = 2
+SECTION_FIELDS = ["section_id", "heading", "order", "char_start", "char_end", "offset", "length"]
+SEARCH_INDEX_MAGIC = b"SOLSRCH2"
+# Must match SOURCE_SEARCH_TOKEN_PATTERN in src/webserver.py.
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
 
 
 def slugify(text):
@@ -115,6 +127,7 @@ def extract_sections(text):
 
     sections = []
     slug_counts = {}
+    used_ids = set()
     for order, (start, end) in enumerate(zip(section_starts, section_starts[1:]), start=1):
         chunk_lines = lines[start:end]
         if not chunk_lines:
@@ -125,6 +138,13 @@ def extract_sections(text):
         slug_counts[heading_slug] += 1
         if slug_counts[heading_slug] > 1:
             heading_slug = f"{heading_slug}_{slug_counts[heading_slug]}"
+        # A numbered repeat can collide with a heading that already ends in that number.
+        candidate, suffix = heading_slug, 2
+        while candidate in used_ids:
+            candidate = f"{heading_slug}_{suffix}"
+            suffix += 1
+        heading_slug = candidate
+        used_ids.add(heading_slug)
 
         char_start = offsets[start]
         char_end = offsets[end] if end < len(offsets) else len(text)
@@ -150,8 +170,7 @@ def path_for_output(path, source_dir):
         return str(Path("external") / path.relative_to(source_dir))
 
 
-def index_sources(source_dir, metadata_path):
-    sources = []
+def load_metadata_map(metadata_path):
     metadata_map = {}
     if metadata_path.exists():
         meta_list = json.loads(metadata_path.read_text(encoding="utf-8"))
@@ -159,35 +178,262 @@ def index_sources(source_dir, metadata_path):
             filename = entry.get("filename")
             if filename:
                 metadata_map[filename] = entry
+    return metadata_map
+
+
+def index_source_file(path, source_dir, metadata):
+    raw = path.read_text(encoding="utf-8", errors="replace")
+    raw = normalize_text(raw)
+    meta, body = split_header(raw)
+    if "<html" in body.lower() and "</html>" in body.lower():
+        body = html_to_text(body)
+        body = normalize_text(body)
+    sections = extract_sections(body)
+
+    source_id = slugify(path.stem)
+    title = path.stem.replace("_", " ").title()
+    if metadata and metadata.get("title"):
+        title = metadata["title"]
+    return {
+        "source_id": source_id,
+        "title": title,
+        "file": path_for_output(path, source_dir),
+        "source_urls": meta.get("sources") or [],
+        "retrieved": meta.get("retrieved"),
+        "notes": meta.get("notes"),
+        "metadata": metadata or {},
+        "section_count": len(sections),
+        "sections": sections,
+    }
+
+
+def manifest_entry(path, metadata):
+    metadata_json = json.dumps(metadata or {}, sort_keys=True, ensure_ascii=False)
+    return {
+        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+        "metadata_sha256": hashlib.sha256(metadata_json.encode("utf-8")).hexdigest(),
+    }
+
+
+def index_sources_incremental(source_dir, metadata_path, previous_sources=(), previous_manifest=None):
+    """Index every ``*.txt`` in ``source_dir``, copying unchanged sources from the previous run.
+
+    A source is reused when its file hash, its ``book_metadata.json`` entry and
+    the indexer version all match ``previous_manifest``; only the other files
+    are read and re-sectioned. Returns the sources, the new manifest and the
+    names of the re-indexed files.
+    """
+    metadata_map = load_metadata_map(metadata_path)
+    previous_manifest = previous_manifest or {}
+    previous_files = {}
+    if previous_manifest.get("indexer_version") == INDEXER_VERSION:
+        previous_files = previous_manifest.get("files") or {}
+    previous_by_file = {source.get("file"): source for source in previous_sources}
+
+    sources = []
+    files = {}
+    reindexed = []
     txt_files = sorted(p for p in source_dir.glob("*.txt") if p.is_file())
     for path in txt_files:
-        raw = path.read_text(encoding="utf-8", errors="replace")
-        raw = normalize_text(raw)
-        meta, body = split_header(raw)
-        if "<html" in body.lower() and "</html>" in body.lower():
-            body = html_to_text(body)
-            body = normalize_text(body)
-        sections = extract_sections(body)
-
-        source_id = slugify(path.stem)
-        title = path.stem.replace("_", " ").title()
         metadata = metadata_map.get(path.name)
-        if metadata and metadata.get("title"):
-            title = metadata["title"]
-        sources.append(
+        entry = manifest_entry(path, metadata)
+        cached = previous_by_file.get(path_for_output(path, source_dir))
+        if cached is not None and previous_files.get(path.name) == entry:
+            sources.append(cached)
+        else:
+            sources.append(index_source_file(path, source_dir, metadata))
+            reindexed.append(path.name)
+        files[path.name] = entry
+    return sources, {"indexer_version": INDEXER_VERSION, "files": files}, reindexed
+
+
+def index_sources(source_dir, metadata_path):
+    sources, _manifest, _reindexed = index_sources_incremental(source_dir, metadata_path)
+    return sources
+
+
+def load_previous_index(output_json, manifest_path):
+    try:
+        payload = json.loads(output_json.read_text(encoding="utf-8"))
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload, manifest
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def encode_varint(value, out):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def source_fingerprint(source):
+    digest = hashlib.sha256()
+    for section in source.get("sections", []):
+        for value in (section["section_id"], section.get("heading") or "", section.get("text") or ""):
+            digest.update(value.encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def encode_search_segment(sections):
+    postings = {}
+    lengths = []
+    for doc_id, section in enumerate(sections):
+        tokens = tokenize(section.get("text") or "")
+        lengths.append(len(tokens))
+        for position, token in enumerate(tokens):
+            postings.setdefault(token, {}).setdefault(doc_id, []).append(position)
+
+    dictionary = bytearray()
+    blob = bytearray()
+    for term in sorted(postings):
+        start = len(blob)
+        previous_doc = 0
+        for doc_id, positions in postings[term].items():
+            encode_varint(doc_id - previous_doc, blob)
+            previous_doc = doc_id
+            encoded_positions = bytearray()
+            previous_position = 0
+            for position in positions:
+                encode_varint(position - previous_position, encoded_positions)
+                previous_position = position
+            encode_varint(len(positions), blob)
+            encode_varint(len(encoded_positions), blob)
+            blob += encoded_positions
+        term_bytes = term.encode("utf-8")
+        encode_varint(len(term_bytes), dictionary)
+        dictionary += term_bytes
+        encode_varint(len(postings[term]), dictionary)
+        encode_varint(len(blob) - start, dictionary)
+    return bytes(dictionary), bytes(blob), lengths
+
+
+def read_search_segments(data):
+    """Map source fingerprint -> (segment bytes, header entry, section lengths) in an existing index."""
+    if not data or not data.startswith(SEARCH_INDEX_MAGIC):
+        return {}
+    start = len(SEARCH_INDEX_MAGIC) + 4
+    (header_length,) = struct.unpack_from("<I", data, len(SEARCH_INDEX_MAGIC))
+    header = json.loads(data[start : start + header_length].decode("utf-8"))
+    offset = start + header_length
+    doc_base = 0
+    segments = {}
+    for entry in header["sources"]:
+        end = offset + entry["dictionary_bytes"] + entry["postings_bytes"]
+        lengths = [row[3] for row in header["docs"][doc_base : doc_base + entry["doc_count"]]]
+        segments[entry["fingerprint"]] = (data[offset:end], entry, lengths)
+        offset = end
+        doc_base += entry["doc_count"]
+    return segments
+
+
+def build_search_index(sources, generated, previous=None):
+    """Encode an inverted index (term -> section postings with positions), one segment per source.
+
+    Layout: magic, a length-prefixed JSON header with the section table and a
+    per-source segment table, then the segments in source order. A segment is
+    a dictionary entry per term (term, document frequency, postings byte
+    length) in sorted order, followed by the postings: the section number
+    delta (local to the source), the term frequency and the byte length of the
+    position deltas that follow, so term-only queries can skip positions.
+
+    Segments whose sections are unchanged are copied from ``previous`` (the
+    bytes of an earlier index) instead of being re-tokenized.
+    """
+    previous_segments = read_search_segments(previous)
+    docs = []
+    header_sources = []
+    body = bytearray()
+    for source_index, source in enumerate(sources):
+        sections = source.get("sections", [])
+        fingerprint = source_fingerprint(source)
+        cached = previous_segments.get(fingerprint)
+        if cached is not None:
+            segment, entry, lengths = cached
+            dictionary_bytes, postings_bytes = entry["dictionary_bytes"], entry["postings_bytes"]
+        else:
+            dictionary, postings, lengths = encode_search_segment(sections)
+            segment = dictionary + postings
+            dictionary_bytes, postings_bytes = len(dictionary), len(postings)
+        for section, length in zip(sections, lengths):
+            docs.append([source_index, section["section_id"], section.get("heading"), length])
+        header_sources.append(
             {
-                "source_id": source_id,
-                "title": title,
-                "file": path_for_output(path, source_dir),
-                "source_urls": meta.get("sources") or [],
-                "retrieved": meta.get("retrieved"),
-                "notes": meta.get("notes"),
-                "metadata": metadata or {},
-                "section_count": len(sections),
-                "sections": sections,
+                "source_id": source["source_id"],
+                "title": source.get("title"),
+                "fingerprint": fingerprint,
+                "doc_count": len(sections),
+                "dictionary_bytes": dictionary_bytes,
+                "postings_bytes": postings_bytes,
             }
         )
-    return sources
+        body += segment
+
+    header = {
+        "version": 2,
+        "generated": generated,
+        "doc_count": len(docs),
+        "avg_length": sum(row[3] for row in docs) / len(docs) if docs else 0.0,
+        "sources": header_sources,
+        "docs": docs,
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return SEARCH_INDEX_MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes + bytes(body)
+
+
+def build_split_index(sources, generated, blob_name):
+    """Split the index into a metadata/offset table and one flat UTF-8 blob of section texts.
+
+    Each section row carries the byte ``offset`` and ``length`` of its text in
+    the blob, so readers can memory-map the blob and slice single sections.
+    """
+    blob = bytearray()
+    meta_sources = []
+    for source in sources:
+        rows = []
+        for section in source.get("sections", []):
+            text = (section.get("text") or "").encode("utf-8")
+            rows.append(
+                [
+                    section["section_id"],
+                    section.get("heading"),
+                    section.get("order"),
+                    section.get("char_start"),
+                    section.get("char_end"),
+                    len(blob),
+                    len(text),
+                ]
+            )
+            blob += text
+        meta_source = {key: value for key, value in source.items() if key != "sections"}
+        meta_source["sections"] = rows
+        meta_sources.append(meta_source)
+    meta = {
+        "version": 1,
+        "generated": generated,
+        "blob": blob_name,
+        "blob_bytes": len(blob),
+        "source_count": len(meta_sources),
+        "section_fields": SECTION_FIELDS,
+        "sources": meta_sources,
+    }
+    return meta, bytes(blob)
+
+
+def write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    if isinstance(data, bytes):
+        tmp_path.write_bytes(data)
+    else:
+        tmp_path.write_text(data, encoding="utf-8")
+    os.replace(tmp_path, path)
 
 
 def main():
@@ -208,26 +454,105 @@ def main():
         default=DEFAULT_OUTPUT_JSON,
         help="Output JSON path (default: data/source_texts_index.json).",
     )
+    parser.add_argument(
+        "--search-output",
+        type=Path,
+        default=DEFAULT_SEARCH_OUTPUT,
+        help="Binary full-text search index path (default: data/source_texts_search.bin).",
+    )
+    parser.add_argument(
+        "--meta-output",
+        type=Path,
+        default=DEFAULT_META_OUTPUT,
+        help="Section metadata/offset table path (default: data/source_texts_meta.json).",
+    )
+    parser.add_argument(
+        "--blob-output",
+        type=Path,
+        default=DEFAULT_BLOB_OUTPUT,
+        help="Flat UTF-8 section text blob path (default: data/source_texts_blob.utf8).",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=DEFAULT_MANIFEST,
+        help="Per-file content hash manifest used to skip unchanged sources (default: data/source_texts_manifest.json).",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the manifest and re-section every source file.",
+    )
+    parser.add_argument(
+        "--from-index",
+        action="store_true",
+        help="Rebuild the derived files from the existing --output JSON instead of re-reading the source directory.",
+    )
     args = parser.parse_args()
 
     source_dir = args.source_dir.expanduser().resolve()
     output_json = args.output.expanduser().resolve()
+    search_output = args.search_output.expanduser().resolve()
+    meta_output = args.meta_output.expanduser().resolve()
+    blob_output = args.blob_output.expanduser().resolve()
+    manifest_path = args.manifest.expanduser().resolve()
     metadata_path = source_dir / "book_metadata.json"
 
-    if not source_dir.exists() or not source_dir.is_dir():
-        raise SystemExit(f"Source directory not found: {source_dir}")
+    if args.from_index:
+        if not output_json.exists():
+            raise SystemExit(f"Index not found: {output_json}")
+        payload = json.loads(output_json.read_text(encoding="utf-8"))
+    else:
+        if not source_dir.exists() or not source_dir.is_dir():
+            raise SystemExit(f"Source directory not found: {source_dir}")
+
+        previous = None if args.full else load_previous_index(output_json, manifest_path)
+        previous_payload, previous_manifest = previous or ({}, {})
+        previous_sources = previous_payload.get("sources") or []
+        sources, manifest, reindexed = index_sources_incremental(
+            source_dir, metadata_path, previous_sources, previous_manifest
+        )
+        derived_outputs = (search_output, meta_output, blob_output)
+        if (
+            previous is not None
+            and not reindexed
+            and [source["file"] for source in sources] == [source.get("file") for source in previous_sources]
+            and all(path.exists() for path in derived_outputs)
+        ):
+            print(f"{output_json} is up to date with {source_dir}")
+            return
+
+        payload = {
+            "generated": datetime.date.today().isoformat(),
+            "source_count": len(sources),
+            "sources": sources,
+        }
+        write_atomic(output_json, json.dumps(payload, indent=2, ensure_ascii=False))
+        print(
+            f"Wrote {output_json} from {source_dir} "
+            f"(re-indexed {len(reindexed)} of {len(sources)} files: {', '.join(reindexed) or 'none'})"
+        )
 
-    output_json.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "generated": datetime.date.today().isoformat(),
-        "source_count": 0,
-        "sources": [],
-    }
-    payload["sources"] = index_sources(source_dir, metadata_path)
-    payload["source_count"] = len(payload["sources"])
+    previous_search = None
+    if not args.full and search_output.exists():
+        previous_search = search_output.read_bytes()
+    write_atomic(search_output, build_search_index(payload["sources"], payload.get("generated"), previous_search))
+    print(f"Wrote {search_output}")
 
-    output_json.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"Wrote {output_json} from {source_dir}")
+    meta, blob = build_split_index(
+        payload["sources"],
+        payload.get("generated"),
+        os.path.relpath(blob_output, meta_output.parent),
+    )
+    # The blob goes first so the table never points past the end of an older blob.
+    write_atomic(blob_output, blob)
+    write_atomic(meta_output, json.dumps(meta, ensure_ascii=False, separators=(",", ":")))
+    print(f"Wrote {meta_output} and {blob_output}")
+
+    if not args.from_index:
+        # Written last: if anything above fails, the next run re-indexes instead of trusting stale output.
+        write_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+        print(f"Wrote {manifest_path}")
 
 
 if __name__ == "__main__":
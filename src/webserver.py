@@ -10,27 +10,40 @@ latest generated dataset. Intended for local use and the Docker container.
 from __future__ import annotations
 
 import argparse
+import base64
 import csv
 import hashlib
 import hmac
+import io
 import json
 import math
+import mmap
 import os
+import queue
+import random
 import re
+import sqlite3
+import ssl
+import struct
 import tempfile
 import threading
 import time
+import wave
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from functools import partial
 from http import HTTPStatus
+from http.client import HTTPConnection, HTTPException, HTTPMessage, HTTPResponse, HTTPSConnection
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from posixpath import normpath
-from typing import Any
-from urllib.parse import parse_qs, quote, unquote, urlparse
+from typing import Any, Iterator
+from urllib.parse import parse_qs, quote, unquote, urljoin, urlparse
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.request import getproxies, proxy_bypass
 from xml.sax.saxutils import escape as xml_escape
 from zoneinfo import ZoneInfo
 
@@ -55,13 +68,34 @@ DEFAULT_EXTERNAL_PSALMS_PATH = (
 )
 DEFAULT_LOCAL_PSALMS_PATH = LOCAL_SOURCE_TEXTS_DIR / "Psalms.txt"
 PSALM_NUMBER_MAP_PATH = REPO_ROOT / "data" / "psalm_number_map.csv"
+SOURCE_SEARCH_INDEX_PATH_ENV = "SOLOMONIC_SOURCE_SEARCH_INDEX_PATH"
+DEFAULT_SOURCE_SEARCH_INDEX_PATH = REPO_ROOT / "data" / "source_texts_search.bin"
+SOURCE_SEARCH_INDEX_MAGIC = b"SOLSRCH2"
+# Must match TOKEN_PATTERN in scripts/index_source_texts.py.
+SOURCE_SEARCH_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+SOURCE_SEARCH_DEFAULT_LIMIT = 20
+SOURCE_SEARCH_MAX_LIMIT = 100
+SOURCE_SEARCH_BM25_K1 = 1.2
+SOURCE_SEARCH_BM25_B = 0.75
+SOURCE_SEARCH_SNIPPET_CHARS = 220
+_SOURCE_SEARCH_INDEXES: dict[str, tuple[float, "_SourceSearchIndex"]] = {}
+_SOURCE_SEARCH_INDEXES_LOCK = threading.Lock()
+SOURCE_TEXTS_META_PATH_ENV = "SOLOMONIC_SOURCE_TEXTS_META_PATH"
+SOURCE_SECTIONS_DEFAULT_LIMIT = 50
+SOURCE_SECTIONS_MAX_LIMIT = 500
+DEFAULT_SOURCE_TEXTS_META_PATH = REPO_ROOT / "data" / "source_texts_meta.json"
+_SOURCE_TEXT_STORES: dict[str, tuple[float, "_SourceTextStore"]] = {}
+_SOURCE_TEXT_STORES_LOCK = threading.Lock()
 DEFAULT_PSALM_SOURCE_MODE = "pericope_first"
 VALID_PSALM_SOURCE_MODES = {
     "pericope_first",
     "file_first",
     "pericope_only",
     "file_only",
+    "race",
 }
+SOURCE_RACE_BUDGET_MS_ENV = "SOLOMONIC_SOURCE_RACE_BUDGET_MS"
+DEFAULT_SOURCE_RACE_BUDGET_MS = 300
 DEFAULT_PSALM_LOOKUP_NUMBERING = "auto"
 VALID_PSALM_LOOKUP_NUMBERINGS = {"auto", "vulgate", "hebrew"}
 SCRIPTURE_CHAPTER_LINE_RE = re.compile(r"(?im)^\s*chapter\s+(\d+)\b")
@@ -137,9 +171,13 @@ DEFAULT_CLOCK_LATITUDE = float(os.environ.get("SOLOMONIC_CLOCK_LATITUDE", "41.87
 DEFAULT_CLOCK_LONGITUDE = float(os.environ.get("SOLOMONIC_CLOCK_LONGITUDE", "-87.6298"))
 PERICOPE_HISTORY_SESSIONS_API_PATH = "/api/pericope/history-sessions"
 CLIENT_ERRORS_API_PATH = "/api/client-errors"
+CLIENT_ERRORS_TOP_API_PATH = "/api/client-errors/top"
 VIBEVOICE_TTS_JOBS_API_PATH = "/api/vibevoice/tts/jobs"
 VIBEVOICE_AUDIO_API_PATH = "/api/vibevoice/audio"
 VIBEVOICE_HEALTH_API_PATH = "/api/vibevoice/health"
+VIBEVOICE_CACHED_AUDIO_API_PATH = "/api/vibevoice/cached-audio"
+SOURCES_API_PATH = "/api/sources"
+SOURCE_SEARCH_API_PATH = "/api/sources/search"
 VIBEVOICE_API_BASE_ENV = "SOLOMONIC_VIBEVOICE_API_BASE"
 VIBEVOICE_FALLBACK_API_BASE_ENV = "SOLOMONIC_VIBEVOICE_FALLBACK_API_BASE"
 VIBEVOICE_API_TOKEN_ENV = "SOLOMONIC_VIBEVOICE_API_TOKEN"
@@ -152,6 +190,63 @@ DEFAULT_VIBEVOICE_PROJECT_ID = "solomonic-seals"
 DEFAULT_VIBEVOICE_SPEAKER = "Carter"
 DEFAULT_VIBEVOICE_FALLBACK_SPEAKER = "en-US-AdamMultilingualNeural"
 MAX_VIBEVOICE_TEXT_LENGTH = 6000
+MAX_VIBEVOICE_CHUNKED_TEXT_LENGTH = 40000
+VIBEVOICE_CHUNK_CHARS_ENV = "SOLOMONIC_VIBEVOICE_CHUNK_CHARS"
+DEFAULT_VIBEVOICE_CHUNK_CHARS = 1200
+STREAM_CHUNK_BYTES_ENV = "SOLOMONIC_STREAM_CHUNK_BYTES"
+DEFAULT_STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_PASSTHROUGH_HEADERS = (
+    "Content-Length",
+    "Content-Range",
+    "Accept-Ranges",
+    "ETag",
+    "Last-Modified",
+    "Cache-Control",
+)
+VIBEVOICE_AUDIO_CACHE_DIR_ENV = "SOLOMONIC_VIBEVOICE_AUDIO_CACHE_DIR"
+VIBEVOICE_AUDIO_CACHE_MAX_BYTES_ENV = "SOLOMONIC_VIBEVOICE_AUDIO_CACHE_MAX_BYTES"
+DEFAULT_VIBEVOICE_AUDIO_CACHE_DIR = Path("/var/lib/solomonic-clock/vibevoice_audio")
+DEFAULT_VIBEVOICE_AUDIO_CACHE_MAX_BYTES = 512 * 1024 * 1024
+VIBEVOICE_PRIMARY_CACHE_ENGINE = "voice-gateway"
+VIBEVOICE_FALLBACK_CACHE_ENGINE = "azure-speech"
+VIBEVOICE_PENDING_JOB_TTL_SECONDS = 60 * 60
+VIBEVOICE_PENDING_JOB_MAX_ENTRIES = 1024
+_VIBEVOICE_AUDIO_CACHES: dict[str, "_AudioFileCache"] = {}
+_VIBEVOICE_AUDIO_CACHES_LOCK = threading.Lock()
+_VIBEVOICE_PENDING_JOBS: _TTLCache | None = None
+_VIBEVOICE_PENDING_JOBS_LOCK = threading.Lock()
+_VIBEVOICE_CHUNKED_JOBS: _TTLCache | None = None
+TTS_PRESYNTH_TIMEZONES_ENV = "SOLOMONIC_TTS_PRESYNTH_TIMEZONES"
+TTS_PRESYNTH_LEAD_MINUTES_ENV = "SOLOMONIC_TTS_PRESYNTH_LEAD_MINUTES"
+TTS_PRESYNTH_CONCURRENCY_ENV = "SOLOMONIC_TTS_PRESYNTH_CONCURRENCY"
+DEFAULT_TTS_PRESYNTH_LEAD_MINUTES = 30
+DEFAULT_TTS_PRESYNTH_CONCURRENCY = 2
+TTS_PRESYNTH_CHECK_SECONDS = 60.0
+TTS_PRESYNTH_JOB_TIMEOUT_SECONDS = 10 * 60
+TTS_PRESYNTH_RETRY_SECONDS = 5 * 60.0
+TTS_PRESYNTH_MAX_RETRY_SECONDS = 60 * 60.0
+_TTS_PRESYNTH_RUNS: dict[str, dict[str, Any]] = {}
+_TTS_PRESYNTH_LOCK = threading.Lock()
+_TTS_PRESYNTH_STARTED = False
+VIBEVOICE_JOB_POLL_MS_ENV = "SOLOMONIC_VIBEVOICE_JOB_POLL_MS"
+DEFAULT_VIBEVOICE_JOB_POLL_MS = 1500
+VIBEVOICE_JOB_MAX_WAIT_SECONDS = 30
+VIBEVOICE_JOB_IDLE_SECONDS = 120.0
+VIBEVOICE_JOB_RETENTION_SECONDS = 300.0
+VIBEVOICE_TERMINAL_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+_VIBEVOICE_JOB_TRACKER: _VibeVoiceJobTracker | None = None
+_VIBEVOICE_JOB_TRACKER_LOCK = threading.Lock()
+VIBEVOICE_HEALTH_INTERVAL_SECONDS_ENV = "SOLOMONIC_VIBEVOICE_HEALTH_INTERVAL_SECONDS"
+VIBEVOICE_HEALTH_JITTER_ENV = "SOLOMONIC_VIBEVOICE_HEALTH_JITTER"
+VIBEVOICE_HEALTH_PATH_ENV = "SOLOMONIC_VIBEVOICE_HEALTH_PATH"
+DEFAULT_VIBEVOICE_HEALTH_INTERVAL_SECONDS = 30.0
+DEFAULT_VIBEVOICE_HEALTH_JITTER = 0.2
+DEFAULT_VIBEVOICE_HEALTH_PATH = "/health"
+VIBEVOICE_HEALTH_PROBE_TIMEOUT_SECONDS = 5.0
+VIBEVOICE_HEALTH_DOWN_AFTER = 2
+VIBEVOICE_HEALTH_HISTORY_SIZE = 20
+_VIBEVOICE_HEALTH_MONITOR: _VibeVoiceHealthMonitor | None = None
+_VIBEVOICE_HEALTH_MONITOR_LOCK = threading.Lock()
 KEY_OF_SOLOMON_SOURCE = "key_of_solomon_esotericarchives.txt"
 KEY_OF_SOLOMON_BOOK = "Key of Solomon, Book II"
 SOLOMONIC_PENTACLE_PLANETS = ("Saturn", "Jupiter", "Mars", "Sun", "Venus", "Mercury", "Moon")
@@ -174,9 +269,80 @@ _PSALM_LOOKUP_NUMBERING: str | None = None
 _PSALM_NUMBER_MAP: dict[int, list["PsalmReferenceSpan"]] | None = None
 _PSALM_NUMBER_MAP_ERROR: str | None = None
 _AUTHOR_TEXTS_DIR_CACHE: dict[str, Path] | None = None
+UPSTREAM_POOL_SIZE_ENV = "SOLOMONIC_UPSTREAM_POOL_SIZE"
+UPSTREAM_POOL_IDLE_SECONDS_ENV = "SOLOMONIC_UPSTREAM_POOL_IDLE_SECONDS"
+UPSTREAM_CONNECT_TIMEOUT_ENV = "SOLOMONIC_UPSTREAM_CONNECT_TIMEOUT"
+DEFAULT_UPSTREAM_POOL_SIZE = 8
+DEFAULT_UPSTREAM_POOL_IDLE_SECONDS = 30.0
+DEFAULT_UPSTREAM_CONNECT_TIMEOUT = 3.0
+MAX_UPSTREAM_REDIRECTS = 5
+_UPSTREAM_POOLS: dict[tuple[str, str, int, str], "_UpstreamConnectionPool"] = {}
+_UPSTREAM_POOLS_LOCK = threading.Lock()
+UPSTREAM_STATUS_API_PATH = "/api/upstream/status"
+UPSTREAM_BREAKER_FAILURES_ENV = "SOLOMONIC_UPSTREAM_BREAKER_FAILURES"
+UPSTREAM_BREAKER_COOLDOWN_SECONDS_ENV = "SOLOMONIC_UPSTREAM_BREAKER_COOLDOWN_SECONDS"
+DEFAULT_UPSTREAM_BREAKER_FAILURES = 3
+DEFAULT_UPSTREAM_BREAKER_COOLDOWN_SECONDS = 30.0
+_UPSTREAM_BREAKERS: dict[str, "_CircuitBreaker"] = {}
+_UPSTREAM_BREAKERS_LOCK = threading.Lock()
+UPSTREAM_WORKERS_ENV = "SOLOMONIC_UPSTREAM_WORKERS"
+DEFAULT_UPSTREAM_WORKERS = 16
+_UPSTREAM_EXECUTOR: ThreadPoolExecutor | None = None
+BACKGROUND_WORKERS_ENV = "SOLOMONIC_BACKGROUND_WORKERS"
+DEFAULT_BACKGROUND_WORKERS = 8
+_BACKGROUND_EXECUTOR: ThreadPoolExecutor | None = None
+_BACKGROUND_EXECUTOR_LOCK = threading.Lock()
+_UPSTREAM_EXECUTOR_LOCK = threading.Lock()
+PERICOPE_HEDGE_MODE_ENV = "SOLOMONIC_PERICOPE_HEDGE_MODE"
+PERICOPE_HEDGE_DELAY_MS_ENV = "SOLOMONIC_PERICOPE_HEDGE_DELAY_MS"
+DEFAULT_PERICOPE_HEDGE_MODE = "off"
+VALID_PERICOPE_HEDGE_MODES = {"off", "hedged", "parallel"}
+DEFAULT_PERICOPE_HEDGE_DELAY_MS = 250
+_BOOK_PARTIAL_RESOLVED: dict[str, int] = {}
+_BOOK_PARTIAL_RESOLVED_LOCK = threading.Lock()
+_SOURCE_RACE_STATS: dict[str, dict[str, int]] = {}
+_SOURCE_RACE_STATS_LOCK = threading.Lock()
+PSALM_REFRESH_SECONDS_ENV = "SOLOMONIC_PSALM_REFRESH_SECONDS"
+PSALM_RETRY_SECONDS_ENV = "SOLOMONIC_PSALM_RETRY_SECONDS"
+DEFAULT_PSALM_REFRESH_SECONDS = 6 * 60 * 60
+DEFAULT_PSALM_RETRY_SECONDS = 60
+_PSALM_LOOKUP_LOCK = threading.Lock()
+_PSALM_REMOTE_LOCK = threading.Lock()
+_PSALM_REMOTE_FUTURE: Future | None = None
+_PSALM_REMOTE_LOOKUP: dict[int, dict[int, str]] | None = None
+_PSALM_REMOTE_SOURCE: str | None = None
+_PSALM_REMOTE_LOADED_AT: str | None = None
+_PSALM_REMOTE_ERROR: str | None = None
+_PSALM_REMOTE_FAILED_AT: float | None = None
+_PSALM_REMOTE_READY = threading.Event()
+_PSALM_REFRESHER_STARTED = False
+BOOK_PARTIAL_CACHE_PATH_ENV = "SOLOMONIC_BOOK_PARTIAL_CACHE_PATH"
+BOOK_PARTIAL_CACHE_TTL_SECONDS_ENV = "SOLOMONIC_BOOK_PARTIAL_CACHE_TTL_SECONDS"
+BOOK_PARTIAL_CACHE_STALE_SECONDS_ENV = "SOLOMONIC_BOOK_PARTIAL_CACHE_STALE_SECONDS"
+BOOK_PARTIAL_CACHE_MAX_BYTES_ENV = "SOLOMONIC_BOOK_PARTIAL_CACHE_MAX_BYTES"
+DEFAULT_BOOK_PARTIAL_CACHE_PATH = Path("/var/lib/solomonic-clock/book_partial_cache.sqlite3")
+DEFAULT_BOOK_PARTIAL_CACHE_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_BOOK_PARTIAL_CACHE_STALE_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_BOOK_PARTIAL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_RESPONSE_CACHES: dict[str, "_SqliteResponseCache"] = {}
+_RESPONSE_CACHES_LOCK = threading.Lock()
+_BOOK_PARTIAL_REVALIDATING: set[str] = set()
+_BOOK_PARTIAL_REVALIDATING_LOCK = threading.Lock()
+PERICOPE_HISTORY_WORKERS_ENV = "SOLOMONIC_PERICOPE_HISTORY_WORKERS"
+PERICOPE_HISTORY_DEADLINE_MS_ENV = "SOLOMONIC_PERICOPE_HISTORY_DEADLINE_MS"
+PERICOPE_HISTORY_DETAIL_TTL_SECONDS_ENV = "SOLOMONIC_PERICOPE_HISTORY_DETAIL_TTL_SECONDS"
+DEFAULT_PERICOPE_HISTORY_WORKERS = 6
+DEFAULT_PERICOPE_HISTORY_DEADLINE_MS = 4000
+DEFAULT_PERICOPE_HISTORY_DETAIL_TTL_SECONDS = 120.0
+PERICOPE_HISTORY_DETAIL_CACHE_MAX_ENTRIES = 2048
+_PERICOPE_HISTORY_DETAIL_CACHE: _TTLCache | None = None
+_PERICOPE_HISTORY_DETAIL_CACHE_LOCK = threading.Lock()
 GUIDED_PROMPTS_API_KEY_ENV = "SOLOMONIC_GUIDED_PROMPTS_API_KEY"
 GUIDED_PROMPTS_AUTH_HEADER = "X-Solomonic-Clock-Key"
+OPERATOR_API_KEY_ENV = "SOLOMONIC_OPERATOR_API_KEY"
+OPERATOR_AUTH_HEADER = "X-Solomonic-Operator-Key"
 HISTORY_SYNC_API_PATH = "/api/history/sync"
+HISTORY_SYNC_PROTOCOL = "delta-v1"
 HISTORY_CLIENT_HEADER = "X-TrueVine-History-Client"
 HISTORY_KEY_HEADER = "X-TrueVine-History-Key"
 DEV_AUTH_SUB_HEADER = "X-Dev-Auth-Sub"
@@ -188,8 +354,31 @@ DEFAULT_CLIENT_ERRORS_STORE_PATH = Path("/var/lib/solomonic-clock/client_errors.
 MAX_HISTORY_ENTRIES_PER_CLIENT = 400
 MAX_HISTORY_REFLECTION_LENGTH = 4000
 MAX_HISTORY_LAUNCHES_PER_ENTRY = 12
-_HISTORY_STORE_LOCK = threading.Lock()
-_CLIENT_ERRORS_STORE_LOCK = threading.Lock()
+HISTORY_DB_PATH_ENV = "SOLOMONIC_HISTORY_DB_PATH"
+HISTORY_STORE_BACKEND_ENV = "SOLOMONIC_HISTORY_STORE_BACKEND"
+HISTORY_SHARD_DIR_ENV = "SOLOMONIC_HISTORY_SHARD_DIR"
+VALID_HISTORY_STORE_BACKENDS = {"sqlite", "sharded"}
+DEFAULT_HISTORY_STORE_BACKEND = "sqlite"
+HISTORY_SHARD_COUNT = 256
+_HISTORY_STORES: dict[str, "_SqliteHistoryStore | _ShardedHistoryStore"] = {}
+_HISTORY_STORES_LOCK = threading.Lock()
+CLIENT_ERRORS_QUEUE_SIZE_ENV = "SOLOMONIC_CLIENT_ERRORS_QUEUE_SIZE"
+CLIENT_ERRORS_BATCH_SIZE_ENV = "SOLOMONIC_CLIENT_ERRORS_BATCH_SIZE"
+CLIENT_ERRORS_FLUSH_MS_ENV = "SOLOMONIC_CLIENT_ERRORS_FLUSH_MS"
+CLIENT_ERRORS_MAX_BYTES_ENV = "SOLOMONIC_CLIENT_ERRORS_MAX_BYTES"
+CLIENT_ERRORS_KEEP_FILES_ENV = "SOLOMONIC_CLIENT_ERRORS_KEEP_FILES"
+DEFAULT_CLIENT_ERRORS_QUEUE_SIZE = 2048
+DEFAULT_CLIENT_ERRORS_BATCH_SIZE = 256
+DEFAULT_CLIENT_ERRORS_FLUSH_MS = 500
+DEFAULT_CLIENT_ERRORS_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_CLIENT_ERRORS_KEEP_FILES = 7
+CLIENT_ERRORS_SAMPLE_EVERY = 10
+CLIENT_ERRORS_AGGREGATE_SECONDS_ENV = "SOLOMONIC_CLIENT_ERRORS_AGGREGATE_SECONDS"
+DEFAULT_CLIENT_ERRORS_AGGREGATE_SECONDS = 60.0
+CLIENT_ERRORS_MAX_FINGERPRINTS = 1000
+_CLIENT_ERRORS_FLUSH = object()
+_CLIENT_ERROR_WRITER: _ClientErrorLogWriter | None = None
+_CLIENT_ERROR_WRITER_LOCK = threading.Lock()
 DEFAULT_SITE_URL = "https://truevineos.cloud"
 SITE_URL_ENV = "SOLOMONIC_SITE_URL"
 APP_VERSION_ENV = "SOLOMONIC_APP_VERSION"
@@ -218,8 +407,29 @@ SEMVER_RE = re.compile(
     r"(?:-((?:0|[1-9A-Za-z-][0-9A-Za-z-]*)(?:\.(?:0|[1-9A-Za-z-][0-9A-Za-z-]*))*))?"
     r"(?:\+([0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$"
 )
+AUTH_USERINFO_CACHE_MAX_ENTRIES_ENV = "SOLOMONIC_AUTH_USERINFO_CACHE_MAX_ENTRIES"
+AUTH_USERINFO_NEGATIVE_TTL_SECONDS_ENV = "SOLOMONIC_AUTH_USERINFO_NEGATIVE_TTL_SECONDS"
+AUTH_USERINFO_SWEEP_SECONDS_ENV = "SOLOMONIC_AUTH_USERINFO_SWEEP_SECONDS"
+DEFAULT_AUTH_USERINFO_CACHE_MAX_ENTRIES = 4096
+DEFAULT_AUTH_USERINFO_NEGATIVE_TTL_SECONDS = 10.0
+DEFAULT_AUTH_USERINFO_SWEEP_SECONDS = 60.0
+AUTH_TOKEN_VERIFICATION_ENV = "SOLOMONIC_AUTH_TOKEN_VERIFICATION"
+AUTH_JWKS_URL_ENV = "SOLOMONIC_AUTH_JWKS_URL"
+AUTH_AUDIENCE_ENV = "SOLOMONIC_AUTH_AUDIENCE"
+AUTH_JWKS_MIN_REFRESH_SECONDS_ENV = "SOLOMONIC_AUTH_JWKS_MIN_REFRESH_SECONDS"
+VALID_AUTH_TOKEN_VERIFICATION_MODES = {"userinfo", "jwks"}
+DEFAULT_AUTH_TOKEN_VERIFICATION = "userinfo"
+DEFAULT_AUTH_JWKS_MIN_REFRESH_SECONDS = 30.0
+JWT_CLOCK_SKEW_SECONDS = 30
+_AUTH_JWKS_LOCK = threading.Lock()
+_AUTH_JWKS_URL: str | None = None
+_AUTH_JWKS_KEYS: list[tuple[str | None, str, tuple[int, int]]] = []
+_AUTH_JWKS_FETCHED_AT: float | None = None
+_AUTH_JWKS_FAILED_AT: float | None = None
+JWT_ACCESS_TOKEN_TYPES = frozenset({"bearer", "at+jwt", "application/at+jwt"})
+JWT_HEADER_TYPES = frozenset({"jwt", "at+jwt", "application/at+jwt"})
 _AUTH_USERINFO_CACHE_LOCK = threading.Lock()
-_AUTH_USERINFO_CACHE: dict[str, dict[str, Any]] = {}
+_AUTH_USERINFO_CACHE: _TTLCache | None = None
 PUBLIC_PAGE_TEMPLATES = {
     "/": (REPO_ROOT / "web" / "index.html", "/"),
     "/clock": (REPO_ROOT / "web" / "clock_visualizer.html", "/clock"),
@@ -679,7 +889,574 @@ def _resolve_pericope_web_base_url() -> str:
     return api_base
 
 
+@dataclass(frozen=True)
+class UpstreamResponse:
+    url: str
+    status: int
+    reason: str
+    headers: HTTPMessage
+    body: bytes
+
+
+class _UpstreamConnectionPool:
+    """Keep-alive connections to one upstream origin, shared across handler threads.
+
+    With a ``proxy`` URL, HTTPS origins are reached through a CONNECT tunnel and
+    plain HTTP requests are sent to the proxy in absolute form, as urllib does.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        *,
+        max_size: int,
+        idle_seconds: float,
+        proxy: str = "",
+    ) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.proxy = proxy
+        self.proxy_headers: dict[str, str] = {}
+        if proxy:
+            parsed_proxy = urlparse(proxy)
+            self._proxy_host = parsed_proxy.hostname or ""
+            self._proxy_port = parsed_proxy.port or 80
+            if parsed_proxy.username is not None:
+                credentials = f"{unquote(parsed_proxy.username)}:{unquote(parsed_proxy.password or '')}"
+                token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                self.proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+        self.max_size = max(0, max_size)
+        self.idle_seconds = max(0.0, idle_seconds)
+        self._idle: list[tuple[HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    @property
+    def forwards_through_proxy(self) -> bool:
+        """Plain HTTP via a proxy: requests carry the absolute URL and proxy credentials."""
+        return bool(self.proxy) and self.scheme == "http"
+
+    def new_connection(self, connect_timeout: float) -> HTTPConnection:
+        host, port = (self._proxy_host, self._proxy_port) if self.proxy else (self.host, self.port)
+        if self.scheme == "https":
+            connection: HTTPConnection = HTTPSConnection(
+                host,
+                port,
+                timeout=connect_timeout,
+                context=ssl.create_default_context(),
+            )
+            if self.proxy:
+                connection.set_tunnel(self.host, self.port, headers=self.proxy_headers or None)
+        else:
+            connection = HTTPConnection(host, port, timeout=connect_timeout)
+        with self._lock:
+            self.created += 1
+        return connection
+
+    def _evict_expired_locked(self, now: float) -> None:
+        fresh: list[tuple[HTTPConnection, float]] = []
+        for connection, released_at in self._idle:
+            if now - released_at > self.idle_seconds:
+                connection.close()
+                self.evicted += 1
+            else:
+                fresh.append((connection, released_at))
+        self._idle = fresh
+
+    def acquire(self, connect_timeout: float) -> tuple[HTTPConnection, bool]:
+        with self._lock:
+            self._evict_expired_locked(time.monotonic())
+            if self._idle:
+                connection, _released_at = self._idle.pop()
+                self.reused += 1
+                return connection, True
+        return self.new_connection(connect_timeout), False
+
+    def release(self, connection: HTTPConnection) -> None:
+        with self._lock:
+            self._evict_expired_locked(time.monotonic())
+            if connection.sock is not None and len(self._idle) < self.max_size:
+                self._idle.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _released_at in idle:
+            connection.close()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "origin": f"{self.scheme}://{self.host}:{self.port}",
+                "proxied": bool(self.proxy),
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+                "created": self.created,
+                "reused": self.reused,
+                "evicted": self.evicted,
+            }
+
+
+def _resolve_upstream_proxy(scheme: str, host: str) -> str:
+    """The proxy URL urllib would use for ``host`` (HTTP_PROXY/HTTPS_PROXY/NO_PROXY), or ``""``."""
+    proxy = getproxies().get(scheme, "")
+    if not proxy or proxy_bypass(host):
+        return ""
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _get_upstream_pool(scheme: str, host: str, port: int, proxy: str = "") -> _UpstreamConnectionPool:
+    key = (scheme, host, port, proxy)
+    with _UPSTREAM_POOLS_LOCK:
+        pool = _UPSTREAM_POOLS.get(key)
+        if pool is None:
+            pool = _UpstreamConnectionPool(
+                scheme,
+                host,
+                port,
+                max_size=_env_int(UPSTREAM_POOL_SIZE_ENV, DEFAULT_UPSTREAM_POOL_SIZE),
+                idle_seconds=_env_float(UPSTREAM_POOL_IDLE_SECONDS_ENV, DEFAULT_UPSTREAM_POOL_IDLE_SECONDS),
+                proxy=proxy,
+            )
+            _UPSTREAM_POOLS[key] = pool
+        return pool
+
+
+def _reset_upstream_pools() -> None:
+    with _UPSTREAM_POOLS_LOCK:
+        pools = list(_UPSTREAM_POOLS.values())
+        _UPSTREAM_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _open_pooled_response(
+    url: str,
+    *,
+    method: str,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+    read_body: bool = True,
+) -> tuple[_UpstreamConnectionPool, HTTPConnection, HTTPResponse, bytes]:
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    if scheme not in {"http", "https"} or not parsed.hostname:
+        raise URLError(f"Unsupported upstream URL: {url}")
+
+    port = parsed.port or (443 if scheme == "https" else 80)
+    pool = _get_upstream_pool(scheme, parsed.hostname, port, _resolve_upstream_proxy(scheme, parsed.hostname))
+    target = parsed.path or "/"
+    if parsed.query:
+        target = f"{target}?{parsed.query}"
+    if pool.forwards_through_proxy:
+        target = f"{scheme}://{parsed.netloc.rpartition('@')[2]}{target}"
+        headers = {**headers, **pool.proxy_headers}
+    connect_timeout = min(timeout, _env_float(UPSTREAM_CONNECT_TIMEOUT_ENV, DEFAULT_UPSTREAM_CONNECT_TIMEOUT))
+
+    # A pooled socket may have been closed by the upstream while idle; retry once on a fresh one.
+    for attempt in range(2):
+        if attempt == 0:
+            connection, reused = pool.acquire(connect_timeout)
+        else:
+            connection, reused = pool.new_connection(connect_timeout), False
+        try:
+            if connection.sock is None:
+                connection.timeout = connect_timeout
+                connection.connect()
+            connection.sock.settimeout(timeout)
+            connection.request(method, target, body=body, headers=headers)
+            response = connection.getresponse()
+            payload = response.read() if read_body else b""
+        except (ConnectionResetError, BrokenPipeError, HTTPException) as exc:
+            connection.close()
+            if reused and attempt == 0:
+                continue
+            raise URLError(exc) from exc
+        except OSError as exc:
+            connection.close()
+            raise URLError(exc) from exc
+        return pool, connection, response, payload
+
+    raise URLError(f"Upstream connection failed: {url}")  # pragma: no cover - loop always returns or raises
+
+
+def _send_pooled_request(
+    url: str,
+    *,
+    method: str,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+) -> UpstreamResponse:
+    pool, connection, response, payload = _open_pooled_response(
+        url,
+        method=method,
+        body=body,
+        headers=headers,
+        timeout=timeout,
+    )
+    if response.will_close:
+        connection.close()
+    else:
+        pool.release(connection)
+    return UpstreamResponse(
+        url=url,
+        status=response.status,
+        reason=response.reason,
+        headers=response.headers,
+        body=payload,
+    )
+
+
+def _upstream_request(
+    url: str,
+    *,
+    method: str = "GET",
+    data: bytes | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 20.0,
+) -> UpstreamResponse:
+    """Issue an upstream HTTP call over the shared keep-alive pool.
+
+    Mirrors ``urlopen`` error semantics so callers keep their handling: non-2xx
+    responses raise ``HTTPError`` (with a readable body) and transport failures
+    raise ``URLError``. Redirects are followed the way urllib does.
+    """
+    current_url = url
+    current_method = method.upper()
+    current_body = data
+    request_headers = {"Connection": "keep-alive", **(headers or {})}
+
+    for _hop in range(MAX_UPSTREAM_REDIRECTS + 1):
+        response = _send_pooled_request(
+            current_url,
+            method=current_method,
+            body=current_body,
+            headers=request_headers,
+            timeout=timeout,
+        )
+        location = response.headers.get("Location")
+        if response.status in {301, 302, 303, 307, 308} and location:
+            if current_method not in {"GET", "HEAD"} and response.status in {307, 308}:
+                raise HTTPError(
+                    current_url, response.status, response.reason, response.headers, io.BytesIO(response.body)
+                )
+            if current_method not in {"GET", "HEAD"}:
+                current_method = "GET"
+                current_body = None
+                request_headers = {
+                    key: value for key, value in request_headers.items() if key.lower() != "content-type"
+                }
+            current_url = urljoin(current_url, location)
+            continue
+
+        if response.status >= 400:
+            raise HTTPError(
+                current_url, response.status, response.reason, response.headers, io.BytesIO(response.body)
+            )
+        return response
+
+    raise URLError(f"Too many upstream redirects for {url}")
+
+
+class _UpstreamStream:
+    """An upstream response whose body is read incrementally.
+
+    The pooled connection goes back to the pool only when the body was read to
+    the end; a stream closed part-way (a listener seeking or leaving) drops it.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        pool: _UpstreamConnectionPool,
+        connection: HTTPConnection,
+        response: HTTPResponse,
+    ) -> None:
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self._pool = pool
+        self._connection = connection
+        self._response = response
+        self._closed = False
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        while True:
+            chunk = self._response.read1(chunk_size)
+            if not chunk:
+                # read1 leaves a drained Content-Length body open; read() finalizes it.
+                self._response.read()
+                return
+            yield chunk
+
+    def read(self) -> bytes:
+        return self._response.read()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._response.length == 0 and not self._response.isclosed():
+            # HEAD, 204 and 304 answers have no body; reading finalizes them so the connection can be reused.
+            self._response.read()
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool.release(self._connection)
+        else:
+            self._response.close()
+            self._connection.close()
+
+
+def _open_upstream_stream(
+    url: str,
+    *,
+    method: str = "GET",
+    headers: dict[str, str] | None = None,
+    timeout: float = 20.0,
+) -> _UpstreamStream:
+    """Like ``_upstream_request`` for GET/HEAD, but leaves the body unread.
+
+    The caller must ``close()`` the returned stream. ``timeout`` bounds each
+    socket read rather than the whole transfer.
+    """
+    current_url = url
+    request_headers = {"Connection": "keep-alive", **(headers or {})}
+
+    for _hop in range(MAX_UPSTREAM_REDIRECTS + 1):
+        pool, connection, response, _payload = _open_pooled_response(
+            current_url,
+            method=method,
+            body=None,
+            headers=request_headers,
+            timeout=timeout,
+            read_body=False,
+        )
+        stream = _UpstreamStream(current_url, pool, connection, response)
+        location = response.headers.get("Location")
+        if response.status in {301, 302, 303, 307, 308} and location:
+            stream.close()
+            current_url = urljoin(current_url, location)
+            continue
+
+        if response.status >= 400:
+            try:
+                detail = stream.read()
+            finally:
+                stream.close()
+            raise HTTPError(current_url, response.status, response.reason, response.headers, io.BytesIO(detail))
+        return stream
+
+    raise URLError(f"Too many upstream redirects for {url}")
+
+
+def _build_upstream_pool_stats() -> list[dict[str, Any]]:
+    with _UPSTREAM_POOLS_LOCK:
+        pools = list(_UPSTREAM_POOLS.values())
+    return [pool.stats() for pool in pools]
+
+
+class _CircuitBreaker:
+    """Closed/open/half-open failure gate for one upstream URL."""
+
+    def __init__(self, name: str, *, failure_threshold: int, cooldown_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = max(0.0, cooldown_seconds)
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.total_successes = 0
+        self.short_circuited = 0
+        self.opened_at: float | None = None
+        self.last_error: str | None = None
+        self.last_failure_at: str | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - float(self.opened_at or 0.0) < self.cooldown_seconds:
+                    self.short_circuited += 1
+                    return False
+                self.state = "half_open"
+                self._trial_in_flight = False
+            # Half-open lets exactly one trial request through until it settles.
+            if self._trial_in_flight:
+                self.short_circuited += 1
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self.total_successes += 1
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self.last_error = _to_snippet(error, 240)
+            self.last_failure_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            retry_in = None
+            if self.state == "open" and self.opened_at is not None:
+                retry_in = round(max(0.0, self.cooldown_seconds - (time.monotonic() - self.opened_at)), 3)
+            return {
+                "upstream": self.name,
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "cooldown_seconds": self.cooldown_seconds,
+                "retry_in_seconds": retry_in,
+                "total_failures": self.total_failures,
+                "total_successes": self.total_successes,
+                "short_circuited": self.short_circuited,
+                "last_error": self.last_error,
+                "last_failure_at": self.last_failure_at,
+            }
+
+
+def _get_upstream_breaker(name: str) -> _CircuitBreaker:
+    with _UPSTREAM_BREAKERS_LOCK:
+        breaker = _UPSTREAM_BREAKERS.get(name)
+        if breaker is None:
+            breaker = _CircuitBreaker(
+                name,
+                failure_threshold=_env_int(UPSTREAM_BREAKER_FAILURES_ENV, DEFAULT_UPSTREAM_BREAKER_FAILURES),
+                cooldown_seconds=_env_float(
+                    UPSTREAM_BREAKER_COOLDOWN_SECONDS_ENV,
+                    DEFAULT_UPSTREAM_BREAKER_COOLDOWN_SECONDS,
+                ),
+            )
+            _UPSTREAM_BREAKERS[name] = breaker
+        return breaker
+
+
+def _reset_upstream_breakers() -> None:
+    with _UPSTREAM_BREAKERS_LOCK:
+        _UPSTREAM_BREAKERS.clear()
+
+
+def _is_upstream_health_failure(error: Exception) -> bool:
+    # 4xx answers come from a live upstream; only transport errors and 5xx trip the breaker.
+    if isinstance(error, HTTPError):
+        return error.code >= 500
+    return isinstance(error, (URLError, OSError))
+
+
+def _guarded_upstream_request(url: str, **kwargs: Any) -> UpstreamResponse:
+    breaker = _get_upstream_breaker(url)
+    if not breaker.allow_request():
+        raise URLError("circuit open")
+    try:
+        response = _upstream_request(url, **kwargs)
+    except Exception as exc:
+        if _is_upstream_health_failure(exc):
+            breaker.record_failure(str(exc))
+        else:
+            breaker.record_success()
+        raise
+    breaker.record_success()
+    return response
+
+
+def _post_pericope_book_partial(url: str, payload: dict[str, Any]) -> dict[str, Any] | None:
+    response = _guarded_upstream_request(
+        url,
+        method="POST",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        timeout=20,
+    )
+    decoded = json.loads(response.body.decode("utf-8"))
+    return decoded if isinstance(decoded, dict) else None
+
+
+def _build_upstream_status_payload(*, detailed: bool = False) -> dict[str, Any]:
+    """Summarize upstream health; URLs, paths and error strings only when ``detailed``."""
+    with _UPSTREAM_BREAKERS_LOCK:
+        breakers = list(_UPSTREAM_BREAKERS.values())
+    snapshots = [breaker.snapshot() for breaker in breakers]
+    book_partial_urls = _resolve_pericope_book_partial_urls()
+    states = {snapshot["upstream"]: snapshot["state"] for snapshot in snapshots}
+    available = [url for url in book_partial_urls if states.get(url, "closed") != "open"]
+    pools = _build_upstream_pool_stats()
+    book_partial_cache = _build_book_partial_cache_stats()
+    psalm_lookup = _build_psalm_lookup_status()
+    token_verification = _build_auth_token_verification_status()
+    resolved: dict[str, int] | int = _build_book_partial_resolved_stats()
+    if not detailed:
+        book_partial_urls, available = len(book_partial_urls), len(available)
+        resolved = sum(resolved.values())
+        snapshots = [_omit_keys(snapshot, "upstream", "last_error") for snapshot in snapshots]
+        pools = [_omit_keys(pool, "origin") for pool in pools]
+        book_partial_cache = {
+            **_omit_keys(book_partial_cache, "path", "error"),
+            "healthy": "error" not in book_partial_cache,
+        }
+        remote = psalm_lookup["remote"]
+        psalm_lookup = {
+            **_omit_keys(psalm_lookup, "source"),
+            "remote": {**_omit_keys(remote, "last_error"), "has_error": remote["last_error"] is not None},
+        }
+        token_verification = {
+            **_omit_keys(token_verification, "jwks_url"),
+            "jwks_configured": bool(token_verification["jwks_url"]),
+        }
+    return {
+        "service": "solomonic_clock",
+        "status": "ok" if available else "degraded",
+        "pericope_book_partial": {
+            "configured": book_partial_urls,
+            "available": available,
+            "resolved": resolved,
+        },
+        "breakers": snapshots,
+        "pools": pools,
+        "source_race": _build_source_race_stats(),
+        "book_partial_cache": book_partial_cache,
+        "psalm_lookup": psalm_lookup,
+        "single_flight": _SINGLE_FLIGHT.stats(),
+        "userinfo_cache": _build_auth_userinfo_cache_stats(),
+        "token_verification": token_verification,
+        "detailed": detailed,
+        "checked_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+    }
+
+
+def _omit_keys(mapping: dict[str, Any], *keys: str) -> dict[str, Any]:
+    return {key: value for key, value in mapping.items() if key not in keys}
+
+
 def _load_external_author_text_dirs() -> dict[str, Path]:
+    if _AUTHOR_TEXTS_DIR_CACHE is not None:
+        return _AUTHOR_TEXTS_DIR_CACHE
+    return _SINGLE_FLIGHT.do(("author_text_dirs",), _read_external_author_text_dirs)
+
+
+def _read_external_author_text_dirs() -> dict[str, Path]:
     global _AUTHOR_TEXTS_DIR_CACHE
 
     if _AUTHOR_TEXTS_DIR_CACHE is not None:
@@ -887,6 +1664,200 @@ def _build_local_book_partial_payload(
     )
 
 
+def _resolve_pericope_hedge_mode() -> str:
+    mode = str(os.environ.get(PERICOPE_HEDGE_MODE_ENV, DEFAULT_PERICOPE_HEDGE_MODE) or "").strip().lower()
+    return mode if mode in VALID_PERICOPE_HEDGE_MODES else DEFAULT_PERICOPE_HEDGE_MODE
+
+
+def _get_upstream_executor() -> ThreadPoolExecutor:
+    global _UPSTREAM_EXECUTOR
+
+    with _UPSTREAM_EXECUTOR_LOCK:
+        if _UPSTREAM_EXECUTOR is None:
+            _UPSTREAM_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max(2, _env_int(UPSTREAM_WORKERS_ENV, DEFAULT_UPSTREAM_WORKERS)),
+                thread_name_prefix="solomonic-upstream",
+            )
+        return _UPSTREAM_EXECUTOR
+
+
+def _get_background_executor() -> ThreadPoolExecutor:
+    global _BACKGROUND_EXECUTOR
+
+    with _BACKGROUND_EXECUTOR_LOCK:
+        if _BACKGROUND_EXECUTOR is None:
+            _BACKGROUND_EXECUTOR = ThreadPoolExecutor(
+                max_workers=max(2, _env_int(BACKGROUND_WORKERS_ENV, DEFAULT_BACKGROUND_WORKERS)),
+                thread_name_prefix="solomonic-background",
+            )
+        return _BACKGROUND_EXECUTOR
+
+
+def _run_in_background(fn: Any, *args: Any) -> Future:
+    """Run ``fn`` on the small background pool and expose the outcome as a Future.
+
+    Used for orchestration work that itself waits on the shared upstream
+    executor, so it can never starve that pool. Nothing running on this pool
+    waits for another task on it.
+    """
+    return _get_background_executor().submit(fn, *args)
+
+
+class _SingleFlight:
+    """Coalesce concurrent calls that share a key onto one in-flight computation.
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running wait for and share its result or exception. Nothing is cached
+    once the call settles.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Any, Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key: Any, fn: Any, *args: Any) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+            }
+
+
+_SINGLE_FLIGHT = _SingleFlight()
+
+
+def _resolve_source_race_budget() -> float:
+    return max(0.0, _env_int(SOURCE_RACE_BUDGET_MS_ENV, DEFAULT_SOURCE_RACE_BUDGET_MS) / 1000.0)
+
+
+def _record_source_race(kind: str, winner: str) -> None:
+    with _SOURCE_RACE_STATS_LOCK:
+        counts = _SOURCE_RACE_STATS.setdefault(kind, {"pericope": 0, "local": 0})
+        counts[winner] = counts.get(winner, 0) + 1
+
+
+def _build_source_race_stats() -> dict[str, dict[str, int]]:
+    with _SOURCE_RACE_STATS_LOCK:
+        return {kind: dict(counts) for kind, counts in _SOURCE_RACE_STATS.items()}
+
+
+def _attempt_book_partial_url(
+    url: str,
+    payload: dict[str, Any],
+    target: BookPartialTarget,
+) -> tuple[dict[str, Any] | None, str | None]:
+    try:
+        decoded = _post_pericope_book_partial(url, payload)
+    except Exception as exc:  # pragma: no cover - depends on runtime network/service state
+        return None, f"{url}: {exc}"
+
+    if decoded is None:
+        return None, f"{url}: invalid JSON payload"
+
+    content = decoded.get("content")
+    if not isinstance(content, str) or not content.strip():
+        return None, f"{url}: missing content"
+
+    result = dict(decoded)
+    result.setdefault("author_slug", target.author_slug)
+    result.setdefault("book", target.book)
+    result.setdefault("source", target.source)
+    result.setdefault("chapter", target.chapter or "Unknown Chapter")
+    result.setdefault("start_position", target.start_position)
+    result.setdefault("end_position", target.end_position)
+    result.setdefault("reference", target.reference or target.book)
+    result["resolved_via"] = "pericope"
+    return result, None
+
+
+def _record_book_partial_resolved(url: str) -> None:
+    with _BOOK_PARTIAL_RESOLVED_LOCK:
+        _BOOK_PARTIAL_RESOLVED[url] = _BOOK_PARTIAL_RESOLVED.get(url, 0) + 1
+
+
+def _build_book_partial_resolved_stats() -> dict[str, int]:
+    with _BOOK_PARTIAL_RESOLVED_LOCK:
+        return dict(_BOOK_PARTIAL_RESOLVED)
+
+
+def _fetch_book_partial_hedged(
+    urls: list[str],
+    payload: dict[str, Any],
+    target: BookPartialTarget,
+    *,
+    hedge_delay: float,
+) -> tuple[dict[str, Any] | None, list[str]]:
+    """Start the next URL whenever the current ones are slow or failed; first valid body wins.
+
+    Losing attempts that have not started are cancelled. Attempts already on the
+    wire cannot be interrupted, so their results are simply discarded.
+    """
+    executor = _get_upstream_executor()
+    remaining = list(urls)
+    pending: dict[Future, str] = {}
+    errors: list[str] = []
+
+    def launch_next() -> None:
+        url = remaining.pop(0)
+        pending[executor.submit(_attempt_book_partial_url, url, payload, target)] = url
+
+    launch_next()
+    next_launch_at = time.monotonic() + hedge_delay
+    while pending or remaining:
+        if not pending:
+            launch_next()
+            next_launch_at = time.monotonic() + hedge_delay
+            continue
+
+        wait_for = max(0.0, next_launch_at - time.monotonic()) if remaining else None
+        done, _not_done = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+        for future in done:
+            url = pending.pop(future)
+            result, error = future.result()
+            if result is not None:
+                for loser in pending:
+                    loser.cancel()
+                _record_book_partial_resolved(url)
+                return result, errors
+            if error:
+                errors.append(error)
+
+        if remaining and time.monotonic() >= next_launch_at:
+            launch_next()
+            next_launch_at = time.monotonic() + hedge_delay
+
+    return None, errors
+
+
 def _fetch_book_partial_from_pericope(
     target: BookPartialTarget,
 ) -> tuple[dict[str, Any] | None, str | None]:
@@ -899,45 +1870,261 @@ def _fetch_book_partial_from_pericope(
         "end_position": target.end_position,
     }
 
+    urls = _resolve_pericope_book_partial_urls()
     errors: list[str] = []
-    for url in _resolve_pericope_book_partial_urls():
-        try:
-            request = Request(
-                url,
-                data=json.dumps(payload).encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            with urlopen(request, timeout=20) as response:
-                body = response.read()
-            decoded = json.loads(body.decode("utf-8"))
-            if not isinstance(decoded, dict):
-                errors.append(f"{url}: invalid JSON payload")
-                continue
-
-            content = decoded.get("content")
-            if not isinstance(content, str) or not content.strip():
-                errors.append(f"{url}: missing content")
-                continue
-
-            result = dict(decoded)
-            result.setdefault("author_slug", target.author_slug)
-            result.setdefault("book", target.book)
-            result.setdefault("source", target.source)
-            result.setdefault("chapter", target.chapter or "Unknown Chapter")
-            result.setdefault("start_position", target.start_position)
-            result.setdefault("end_position", target.end_position)
-            result.setdefault("reference", target.reference or target.book)
-            result["resolved_via"] = "pericope"
+    hedge_mode = _resolve_pericope_hedge_mode()
+    if hedge_mode != "off" and len(urls) > 1:
+        hedge_delay = 0.0 if hedge_mode == "parallel" else max(
+            0.0,
+            _env_int(PERICOPE_HEDGE_DELAY_MS_ENV, DEFAULT_PERICOPE_HEDGE_DELAY_MS) / 1000.0,
+        )
+        result, errors = _fetch_book_partial_hedged(urls, payload, target, hedge_delay=hedge_delay)
+        if result is not None:
+            result["hedge_mode"] = hedge_mode
             return result, None
-        except Exception as exc:  # pragma: no cover - depends on runtime network/service state
-            errors.append(f"{url}: {exc}")
+    else:
+        for url in urls:
+            result, error = _attempt_book_partial_url(url, payload, target)
+            if result is not None:
+                _record_book_partial_resolved(url)
+                return result, None
+            if error:
+                errors.append(error)
 
     if not errors:
         return None, "Pericope book_partial unavailable."
     return None, "Unable to reach Pericope book_partial. Tried: " + " | ".join(errors[:3])
 
 
+class _SqliteResponseCache:
+    """Content-addressed JSON response cache in SQLite with TTL and size-bounded LRU eviction."""
+
+    def __init__(self, path: Path, *, max_bytes: int) -> None:
+        self.path = path
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.path), timeout=5)
+        if not self._schema_ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                " key TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS response_cache_last_access ON response_cache (last_access)"
+            )
+            connection.commit()
+            self._schema_ready = True
+        return connection
+
+    def get(self, key: str) -> tuple[dict[str, Any], float] | None:
+        """Return the cached payload and its age in seconds, refreshing its LRU position."""
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT payload, stored_at FROM response_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                connection.execute("UPDATE response_cache SET last_access = ? WHERE key = ?", (now, key))
+                connection.commit()
+            finally:
+                connection.close()
+        try:
+            payload = json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+        return payload, max(0.0, now - float(row[1]))
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        size = len(encoded.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, payload, size, stored_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, encoded, size, now, now),
+                )
+                self._evict_locked(connection)
+                connection.commit()
+            finally:
+                connection.close()
+
+    def _evict_locked(self, connection: sqlite3.Connection) -> None:
+        total = int(connection.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        doomed: list[tuple[str]] = []
+        for key, size in connection.execute("SELECT key, size FROM response_cache ORDER BY last_access ASC"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= int(size)
+        connection.executemany("DELETE FROM response_cache WHERE key = ?", doomed)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            connection = self._connect()
+            try:
+                entries, total = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache"
+                ).fetchone()
+            finally:
+                connection.close()
+        return {"path": str(self.path), "entries": int(entries), "bytes": int(total), "max_bytes": self.max_bytes}
+
+
+def _resolve_book_partial_cache_path() -> Path:
+    configured = os.environ.get(BOOK_PARTIAL_CACHE_PATH_ENV, "").strip()
+    if configured:
+        return Path(configured)
+    try:
+        _ensure_parent_dir(DEFAULT_BOOK_PARTIAL_CACHE_PATH)
+        return DEFAULT_BOOK_PARTIAL_CACHE_PATH
+    except OSError:
+        return Path(tempfile.gettempdir()) / "solomonic-clock-book_partial_cache.sqlite3"
+
+
+def _get_book_partial_cache() -> _SqliteResponseCache | None:
+    max_bytes = _env_int(BOOK_PARTIAL_CACHE_MAX_BYTES_ENV, DEFAULT_BOOK_PARTIAL_CACHE_MAX_BYTES)
+    if max_bytes <= 0:
+        return None
+    path = _resolve_book_partial_cache_path()
+    with _RESPONSE_CACHES_LOCK:
+        cache = _RESPONSE_CACHES.get(str(path))
+        if cache is None or cache.max_bytes != max_bytes:
+            _ensure_parent_dir(path)
+            cache = _SqliteResponseCache(path, max_bytes=max_bytes)
+            _RESPONSE_CACHES[str(path)] = cache
+        return cache
+
+
+def _build_book_partial_cache_stats() -> dict[str, Any]:
+    try:
+        cache = _get_book_partial_cache()
+        if cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **cache.stats()}
+    except (OSError, sqlite3.Error) as exc:
+        return {"enabled": True, "error": str(exc)}
+
+
+def _book_partial_cache_key(target: BookPartialTarget) -> str:
+    identity = [
+        target.author_slug,
+        target.book,
+        target.source,
+        target.chapter,
+        target.start_position,
+        target.end_position,
+    ]
+    return hashlib.sha256(json.dumps(identity, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _revalidate_book_partial(cache: _SqliteResponseCache, key: str, target: BookPartialTarget) -> None:
+    try:
+        payload, _error = _fetch_book_partial_from_pericope(target)
+        if payload is not None:
+            cache.put(key, payload)
+    finally:
+        with _BOOK_PARTIAL_REVALIDATING_LOCK:
+            _BOOK_PARTIAL_REVALIDATING.discard(key)
+
+
+def _fetch_book_partial_cached(
+    target: BookPartialTarget,
+) -> tuple[dict[str, Any] | None, str | None]:
+    try:
+        cache = _get_book_partial_cache()
+        key = _book_partial_cache_key(target)
+        cached = cache.get(key) if cache is not None else None
+    except (OSError, sqlite3.Error):
+        cache = None
+        cached = None
+
+    ttl = _env_int(BOOK_PARTIAL_CACHE_TTL_SECONDS_ENV, DEFAULT_BOOK_PARTIAL_CACHE_TTL_SECONDS)
+    stale_window = _env_int(BOOK_PARTIAL_CACHE_STALE_SECONDS_ENV, DEFAULT_BOOK_PARTIAL_CACHE_STALE_SECONDS)
+    if cache is not None and cached is not None:
+        payload, age = cached
+        if age <= ttl:
+            payload["cache_status"] = "hit"
+            return payload, None
+        if age <= ttl + stale_window:
+            # Serve the stale copy now and refresh it once in the background.
+            with _BOOK_PARTIAL_REVALIDATING_LOCK:
+                start_refresh = key not in _BOOK_PARTIAL_REVALIDATING
+                _BOOK_PARTIAL_REVALIDATING.add(key)
+            if start_refresh:
+                _run_in_background(_revalidate_book_partial, cache, key, target)
+            payload["cache_status"] = "stale"
+            return payload, None
+
+    def fetch_and_store() -> tuple[dict[str, Any] | None, str | None]:
+        payload, error = _fetch_book_partial_from_pericope(target)
+        if payload is not None and cache is not None:
+            try:
+                cache.put(key, payload)
+            except (OSError, sqlite3.Error):
+                pass
+            payload["cache_status"] = "miss"
+        return payload, error
+
+    # Concurrent misses for the same target share one upstream fetch; each caller
+    # gets its own copy because the payload is decorated further downstream.
+    payload, error = _SINGLE_FLIGHT.do(("book_partial", _book_partial_cache_key(target)), fetch_and_store)
+    return (dict(payload) if payload is not None else None), error
+
+
+def _race_book_partial_sources(
+    target: BookPartialTarget,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Start Pericope and the local corpus together; Pericope wins only inside the budget."""
+    started = time.monotonic()
+    budget = _resolve_source_race_budget()
+    remote_future = _run_in_background(_fetch_book_partial_cached, target)
+    local_payload, local_error = _build_local_book_partial_payload(target)
+
+    # Without a local answer there is nothing to cap latency with, so wait for Pericope.
+    wait_for = max(0.0, budget - (time.monotonic() - started)) if local_payload is not None else None
+    try:
+        remote_payload, remote_error = remote_future.result(timeout=wait_for)
+    except FuturesTimeoutError:
+        remote_payload = None
+        remote_error = f"Pericope book_partial did not answer within {int(budget * 1000)} ms."
+
+    winner_payload = remote_payload if remote_payload is not None else local_payload
+    if winner_payload is None:
+        return None, local_error or remote_error
+
+    winner = "pericope" if remote_payload is not None else "local"
+    _record_source_race("book_partial", winner)
+    if winner == "local" and remote_error:
+        winner_payload["resolution_warning"] = remote_error
+    winner_payload["source_race"] = {
+        "winner": winner,
+        "budget_ms": int(budget * 1000),
+        "elapsed_ms": int((time.monotonic() - started) * 1000),
+    }
+    return winner_payload, None
+
+
 def _parse_scripture_reference(
     reference: str,
 ) -> tuple[str | None, int | None, str | None]:
@@ -1235,7 +2422,15 @@ def _build_book_partial_payload(
                 error = fallback_error or payload.get("_psalm_lookup_error") or error
         return None, error or "Unable to resolve book_partial target.", status
 
-    remote_payload, remote_error = _fetch_book_partial_from_pericope(target)
+    if _resolve_psalm_source_mode() == "race":
+        raced_payload, race_error = _race_book_partial_sources(target)
+        if raced_payload is None:
+            return None, race_error or "Unable to expand requested text.", HTTPStatus.NOT_FOUND
+        raced_payload["requested_reference"] = requested_reference
+        raced_payload["kind"] = kind
+        return raced_payload, None, HTTPStatus.OK
+
+    remote_payload, remote_error = _fetch_book_partial_cached(target)
     if remote_payload is not None:
         remote_payload["requested_reference"] = requested_reference
         remote_payload["kind"] = kind
@@ -1262,6 +2457,16 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
 def _clean_release_text(value: Any) -> str:
     return re.sub(r"\s+", " ", str(value or "")).strip()
 
@@ -1319,16 +2524,8 @@ def _load_psalm_lookup_from_pericope() -> tuple[dict[int, dict[int, str]] | None
     errors: list[str] = []
     for url in _resolve_pericope_book_partial_urls():
         try:
-            request = Request(
-                url,
-                data=json.dumps(payload).encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-                method="POST",
-            )
-            with urlopen(request, timeout=20) as response:
-                body = response.read()
-            decoded = json.loads(body.decode("utf-8"))
-            content = decoded.get("content") if isinstance(decoded, dict) else None
+            decoded = _post_pericope_book_partial(url, payload)
+            content = decoded.get("content") if decoded is not None else None
             if not isinstance(content, str) or not content.strip():
                 errors.append(f"{url}: missing content")
                 continue
@@ -1355,6 +2552,101 @@ def _load_psalm_lookup_from_pericope() -> tuple[dict[int, dict[int, str]] | None
     return None, "Unable to load Psalms from Pericope book_partial."
 
 
+def _refresh_psalm_remote_lookup() -> tuple[dict[int, dict[int, str]] | None, str | None]:
+    global _PSALM_REMOTE_ERROR
+    global _PSALM_REMOTE_FAILED_AT
+    global _PSALM_REMOTE_LOADED_AT
+    global _PSALM_REMOTE_LOOKUP
+    global _PSALM_REMOTE_SOURCE
+
+    lookup, source_or_error = _load_psalm_lookup_from_pericope()
+    with _PSALM_REMOTE_LOCK:
+        if lookup is not None:
+            _PSALM_REMOTE_LOOKUP = lookup
+            _PSALM_REMOTE_SOURCE = source_or_error
+            _PSALM_REMOTE_LOADED_AT = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+            _PSALM_REMOTE_ERROR = None
+            _PSALM_REMOTE_FAILED_AT = None
+            _PSALM_REMOTE_READY.set()
+        else:
+            _PSALM_REMOTE_ERROR = source_or_error
+            _PSALM_REMOTE_FAILED_AT = time.monotonic()
+    return lookup, source_or_error
+
+
+def _get_psalm_remote_future() -> Future:
+    """Single-flight handle on the Pericope Psalm load; concurrent callers share one fetch."""
+    global _PSALM_REMOTE_FUTURE
+
+    with _PSALM_REMOTE_LOCK:
+        future = _PSALM_REMOTE_FUTURE
+        if future is not None:
+            if not future.done():
+                return future
+            recently_failed = (
+                _PSALM_REMOTE_FAILED_AT is not None
+                and time.monotonic() - _PSALM_REMOTE_FAILED_AT
+                < _env_int(PSALM_RETRY_SECONDS_ENV, DEFAULT_PSALM_RETRY_SECONDS)
+            )
+            if recently_failed:
+                return future
+        future = _run_in_background(_refresh_psalm_remote_lookup)
+        _PSALM_REMOTE_FUTURE = future
+        return future
+
+
+def _psalm_refresh_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            _get_psalm_remote_future().result()
+        except Exception as exc:  # pragma: no cover - keep the refresher alive
+            print(f"[psalm-refresh] {exc}")
+
+
+def _start_psalm_lookup_refresher() -> None:
+    """Warm the Pericope Psalm lookup at startup and refresh it on an interval."""
+    global _PSALM_REFRESHER_STARTED
+
+    if _resolve_psalm_source_mode() == "file_only":
+        return
+    with _PSALM_REMOTE_LOCK:
+        if _PSALM_REFRESHER_STARTED:
+            return
+        _PSALM_REFRESHER_STARTED = True
+
+    _get_psalm_remote_future()
+    interval = _env_int(PSALM_REFRESH_SECONDS_ENV, DEFAULT_PSALM_REFRESH_SECONDS)
+    if interval > 0:
+        threading.Thread(
+            target=_psalm_refresh_loop,
+            args=(float(interval),),
+            name="solomonic-psalm-refresher",
+            daemon=True,
+        ).start()
+
+
+def _build_psalm_lookup_status() -> dict[str, Any]:
+    with _PSALM_REMOTE_LOCK:
+        future = _PSALM_REMOTE_FUTURE
+        remote = {
+            "ready": _PSALM_REMOTE_READY.is_set(),
+            "loading": bool(future is not None and not future.done()),
+            "loaded_at": _PSALM_REMOTE_LOADED_AT,
+            "last_error": _PSALM_REMOTE_ERROR,
+        }
+    serving = None
+    if _PSALM_LOOKUP is not None:
+        serving = "file" if _PSALM_LOOKUP_PATH is not None else "pericope"
+    return {
+        "mode": _resolve_psalm_source_mode(),
+        "serving": serving,
+        "source": _PSALM_LOOKUP_SOURCE,
+        "remote": remote,
+        "refresh_seconds": _env_int(PSALM_REFRESH_SECONDS_ENV, DEFAULT_PSALM_REFRESH_SECONDS),
+    }
+
+
 def _parse_psalm_text(raw_text: str) -> dict[int, dict[int, str]]:
     lookup: dict[int, dict[int, str]] = {}
     chapter_num: int | None = None
@@ -1407,7 +2699,14 @@ def _load_psalm_lookup_from_file(
     return parsed, str(path), mtime
 
 
-def _load_psalm_lookup() -> tuple[dict[int, dict[int, str]] | None, str | None]:
+def _install_psalm_lookup(
+    lookup: dict[int, dict[int, str]],
+    *,
+    path: Path | None,
+    mtime: float | None,
+    source: str | None,
+    mode: str,
+) -> dict[int, dict[int, str]]:
     global _PSALM_LOOKUP
     global _PSALM_LOOKUP_MTIME
     global _PSALM_LOOKUP_MODE
@@ -1415,49 +2714,58 @@ def _load_psalm_lookup() -> tuple[dict[int, dict[int, str]] | None, str | None]:
     global _PSALM_LOOKUP_PATH
     global _PSALM_LOOKUP_SOURCE
 
+    numbering = _infer_psalm_lookup_numbering(lookup, source)
+    with _PSALM_LOOKUP_LOCK:
+        _PSALM_LOOKUP = lookup
+        _PSALM_LOOKUP_PATH = path
+        _PSALM_LOOKUP_MTIME = mtime
+        _PSALM_LOOKUP_SOURCE = source
+        _PSALM_LOOKUP_MODE = mode
+        _PSALM_LOOKUP_NUMBERING = numbering
+    return lookup
+
+
+def _load_psalm_lookup() -> tuple[dict[int, dict[int, str]] | None, str | None]:
     mode = _resolve_psalm_source_mode()
     path = _resolve_psalm_path()
+    return _SINGLE_FLIGHT.do(("psalm_lookup", mode, str(path)), _load_psalm_lookup_for, mode, path)
+
+
+def _load_psalm_lookup_for(
+    mode: str,
+    path: Path | None,
+) -> tuple[dict[int, dict[int, str]] | None, str | None]:
+    def load_from_pericope(wait: float | None) -> tuple[dict[int, dict[int, str]] | None, str | None]:
+        """Use the background-loaded remote copy, waiting at most ``wait`` seconds (None blocks)."""
+        remote_lookup = _PSALM_REMOTE_LOOKUP
+        if remote_lookup is not None:
+            if _PSALM_LOOKUP is remote_lookup and _PSALM_LOOKUP_MODE == mode:
+                return remote_lookup, None
+            return _install_psalm_lookup(
+                remote_lookup,
+                path=None,
+                mtime=None,
+                source=_PSALM_REMOTE_SOURCE,
+                mode=mode,
+            ), None
+
+        future = _get_psalm_remote_future()
+        try:
+            pericope_lookup, pericope_source_or_error = future.result(timeout=wait)
+        except FuturesTimeoutError:
+            return None, None
+        if pericope_lookup is None:
+            return None, pericope_source_or_error
+        return _install_psalm_lookup(
+            pericope_lookup,
+            path=None,
+            mtime=None,
+            source=pericope_source_or_error,
+            mode=mode,
+        ), None
 
-    def load_from_pericope() -> tuple[dict[int, dict[int, str]] | None, str | None]:
-        nonlocal mode
-        global _PSALM_LOOKUP
-        global _PSALM_LOOKUP_MTIME
-        global _PSALM_LOOKUP_MODE
+    def load_from_file() -> tuple[dict[int, dict[int, str]] | None, str | None]:
         global _PSALM_LOOKUP_NUMBERING
-        global _PSALM_LOOKUP_PATH
-        global _PSALM_LOOKUP_SOURCE
-
-        if _PSALM_LOOKUP is not None and _PSALM_LOOKUP_PATH is None and _PSALM_LOOKUP_MODE == mode:
-            if _PSALM_LOOKUP_NUMBERING is None:
-                _PSALM_LOOKUP_NUMBERING = _infer_psalm_lookup_numbering(
-                    _PSALM_LOOKUP,
-                    _PSALM_LOOKUP_SOURCE,
-                )
-            return _PSALM_LOOKUP, None
-
-        pericope_lookup, pericope_source_or_error = _load_psalm_lookup_from_pericope()
-        if pericope_lookup is None:
-            return None, pericope_source_or_error
-
-        _PSALM_LOOKUP = pericope_lookup
-        _PSALM_LOOKUP_PATH = None
-        _PSALM_LOOKUP_MTIME = None
-        _PSALM_LOOKUP_SOURCE = pericope_source_or_error
-        _PSALM_LOOKUP_MODE = mode
-        _PSALM_LOOKUP_NUMBERING = _infer_psalm_lookup_numbering(
-            _PSALM_LOOKUP,
-            _PSALM_LOOKUP_SOURCE,
-        )
-        return _PSALM_LOOKUP, None
-
-    def load_from_file() -> tuple[dict[int, dict[int, str]] | None, str | None]:
-        nonlocal path, mode
-        global _PSALM_LOOKUP
-        global _PSALM_LOOKUP_MTIME
-        global _PSALM_LOOKUP_MODE
-        global _PSALM_LOOKUP_NUMBERING
-        global _PSALM_LOOKUP_PATH
-        global _PSALM_LOOKUP_SOURCE
 
         if path is None:
             return None, "No local Psalms text file found for fallback."
@@ -1484,38 +2792,48 @@ def _load_psalm_lookup() -> tuple[dict[int, dict[int, str]] | None, str | None]:
         if file_lookup is None:
             return None, file_source_or_error
 
-        _PSALM_LOOKUP = file_lookup
-        _PSALM_LOOKUP_PATH = path
-        _PSALM_LOOKUP_MTIME = loaded_mtime
-        _PSALM_LOOKUP_SOURCE = file_source_or_error
-        _PSALM_LOOKUP_MODE = mode
-        _PSALM_LOOKUP_NUMBERING = _infer_psalm_lookup_numbering(
-            _PSALM_LOOKUP,
-            _PSALM_LOOKUP_SOURCE,
-        )
-        return _PSALM_LOOKUP, None
+        return _install_psalm_lookup(
+            file_lookup,
+            path=path,
+            mtime=loaded_mtime,
+            source=file_source_or_error,
+            mode=mode,
+        ), None
 
     if mode == "pericope_only":
-        return load_from_pericope()
+        return load_from_pericope(None)
 
     if mode == "file_only":
         return load_from_file()
 
     errors: list[str] = []
 
-    if mode == "pericope_first":
-        lookup, error = load_from_pericope()
+    if mode in {"pericope_first", "race"}:
+        # pericope_first never waits on the network while a local copy can answer; the
+        # background load swaps Pericope in once it lands. race waits up to its budget.
+        wait = _resolve_source_race_budget() if mode == "race" else 0.0
+        lookup, error = load_from_pericope(wait)
         if lookup is not None:
+            if mode == "race":
+                _record_source_race("psalm_lookup", "pericope")
             return lookup, None
         if error:
             errors.append(error)
 
         lookup, error = load_from_file()
         if lookup is not None:
+            if mode == "race":
+                _record_source_race("psalm_lookup", "local")
             return lookup, None
         if error:
             errors.append(error)
 
+        lookup, error = load_from_pericope(None)
+        if lookup is not None:
+            return lookup, None
+        if error and error not in errors:
+            errors.append(error)
+
     if mode == "file_first":
         lookup, error = load_from_file()
         if lookup is not None:
@@ -1523,7 +2841,7 @@ def _load_psalm_lookup() -> tuple[dict[int, dict[int, str]] | None, str | None]:
         if error:
             errors.append(error)
 
-        lookup, error = load_from_pericope()
+        lookup, error = load_from_pericope(None)
         if lookup is not None:
             return lookup, None
         if error:
@@ -1619,6 +2937,25 @@ def _resolve_auth_userinfo_url() -> str:
     return f"{_resolve_auth_issuer()}/protocol/openid-connect/userinfo"
 
 
+def _resolve_auth_token_verification() -> str:
+    raw = str(os.environ.get(AUTH_TOKEN_VERIFICATION_ENV, DEFAULT_AUTH_TOKEN_VERIFICATION) or "").strip().lower()
+    if raw in VALID_AUTH_TOKEN_VERIFICATION_MODES:
+        return raw
+    return DEFAULT_AUTH_TOKEN_VERIFICATION
+
+
+def _resolve_auth_jwks_url() -> str:
+    configured = str(os.environ.get(AUTH_JWKS_URL_ENV, "") or "").strip()
+    if configured:
+        return configured
+    return f"{_resolve_auth_issuer()}/protocol/openid-connect/certs"
+
+
+def _resolve_auth_audience() -> str:
+    configured = str(os.environ.get(AUTH_AUDIENCE_ENV, "") or "").strip()
+    return configured or _resolve_auth_client_id()
+
+
 def _auth_disabled() -> bool:
     return _is_truthy(os.environ.get(AUTH_DISABLED_ENV, "false"))
 
@@ -1661,29 +2998,151 @@ def _build_dev_fake_auth_claims(headers: Any) -> dict[str, Any] | None:
     }
 
 
+class _TTLCache:
+    """Size-bounded LRU map whose entries also expire after a per-entry TTL.
+
+    Expired entries are dropped when read and by a sweep that runs at most once
+    per ``sweep_interval`` from inside ``get``/``set``.
+    """
+
+    def __init__(self, *, max_entries: int, sweep_interval: float) -> None:
+        self.max_entries = max(1, max_entries)
+        self.sweep_interval = max(0.0, sweep_interval)
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _sweep_locked(self, now: float) -> None:
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+        expired = [key for key, (expires_at, _value) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self.expirations += len(expired)
+
+    def get(self, key: str) -> Any | None:
+        now = time.monotonic()
+        with self._lock:
+            self._sweep_locked(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._sweep_locked(now)
+            self._entries[key] = (now + max(0.0, ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def _get_auth_userinfo_cache() -> _TTLCache:
+    global _AUTH_USERINFO_CACHE
+
+    with _AUTH_USERINFO_CACHE_LOCK:
+        if _AUTH_USERINFO_CACHE is None:
+            _AUTH_USERINFO_CACHE = _TTLCache(
+                max_entries=_env_int(AUTH_USERINFO_CACHE_MAX_ENTRIES_ENV, DEFAULT_AUTH_USERINFO_CACHE_MAX_ENTRIES),
+                sweep_interval=_env_float(AUTH_USERINFO_SWEEP_SECONDS_ENV, DEFAULT_AUTH_USERINFO_SWEEP_SECONDS),
+            )
+        return _AUTH_USERINFO_CACHE
+
+
+def _reset_auth_userinfo_cache() -> None:
+    global _AUTH_USERINFO_CACHE
+
+    with _AUTH_USERINFO_CACHE_LOCK:
+        _AUTH_USERINFO_CACHE = None
+
+
+def _build_auth_userinfo_cache_stats() -> dict[str, Any]:
+    return _get_auth_userinfo_cache().stats()
+
+
 def _verify_userinfo_token(token: str) -> dict[str, Any]:
     token = str(token or "").strip()
     if not token:
         raise ValueError("Missing bearer token.")
 
     token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
-    now = time.time()
-    with _AUTH_USERINFO_CACHE_LOCK:
-        cached = _AUTH_USERINFO_CACHE.get(token_hash)
-        if cached and float(cached.get("exp", 0.0)) > now:
-            return dict(cached.get("claims") or {})
-
-    request = Request(
-        _resolve_auth_userinfo_url(),
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-        },
-    )
+    cached = _get_auth_userinfo_cache().get(token_hash)
+    if cached is not None:
+        if cached.get("rejected"):
+            raise ValueError(str(cached["rejected"]))
+        return dict(cached.get("claims") or {})
+
+    # Parallel requests carrying the same token share one userinfo round trip.
+    return dict(_SINGLE_FLIGHT.do(("userinfo", token_hash), _fetch_userinfo_claims, token, token_hash))
+
+
+class _UserinfoRejected(ValueError):
+    """The auth server or the local token checks rejected the token itself."""
+
+
+def _fetch_userinfo_claims(token: str, token_hash: str) -> dict[str, Any]:
+    cache = _get_auth_userinfo_cache()
+    verify_locally = _resolve_auth_token_verification() == "jwks"
+    try:
+        payload = _verify_jwt_locally(token) if verify_locally else _request_userinfo_claims(token)
+    except _UserinfoRejected as exc:
+        # Remember rejections briefly so a client retrying a bad token does not
+        # reach Keycloak on every request. Outages are never cached.
+        negative_ttl = _env_float(AUTH_USERINFO_NEGATIVE_TTL_SECONDS_ENV, DEFAULT_AUTH_USERINFO_NEGATIVE_TTL_SECONDS)
+        if negative_ttl > 0:
+            cache.set(token_hash, {"rejected": str(exc)}, negative_ttl)
+        raise
+
+    if verify_locally:
+        cache_ttl = max(0.0, min(300.0, float(payload["exp"]) - time.time()))
+    else:
+        cache_ttl = max(30.0, min(300.0, float(payload.get("expires_in", 120) or 120)))
+    cache.set(token_hash, {"claims": payload}, cache_ttl)
+    return payload
+
+
+def _request_userinfo_claims(token: str) -> dict[str, Any]:
     try:
-        with urlopen(request, timeout=5) as response:
-            payload = json.loads(response.read().decode("utf-8"))
+        response = _upstream_request(
+            _resolve_auth_userinfo_url(),
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/json",
+            },
+            timeout=5,
+        )
+        payload = json.loads(response.body.decode("utf-8"))
     except HTTPError as exc:
+        if exc.code in {HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}:
+            raise _UserinfoRejected(f"Userinfo rejected token ({exc.code}).") from exc
         raise ValueError(f"Userinfo rejected token ({exc.code}).") from exc
     except URLError as exc:
         raise ValueError(f"Userinfo unavailable: {exc.reason}") from exc
@@ -1695,23 +3154,270 @@ def _verify_userinfo_token(token: str) -> dict[str, Any]:
 
     subject = str(payload.get("sub", "") or "").strip()
     if not subject:
-        raise ValueError("Userinfo response did not include sub.")
+        raise _UserinfoRejected("Userinfo response did not include sub.")
 
     issuer = str(payload.get("iss", "") or "").strip()
     expected_issuer = _resolve_auth_issuer()
     if issuer and issuer.rstrip("/") != expected_issuer.rstrip("/"):
-        raise ValueError("Userinfo issuer did not match the configured realm.")
-
-    cache_ttl = max(30.0, min(300.0, float(payload.get("expires_in", 120) or 120)))
-    with _AUTH_USERINFO_CACHE_LOCK:
-        _AUTH_USERINFO_CACHE[token_hash] = {
-            "exp": now + cache_ttl,
-            "claims": payload,
-        }
+        raise _UserinfoRejected("Userinfo issuer did not match the configured realm.")
 
     return payload
 
 
+# DER DigestInfo prefix for SHA-256, used by RSASSA-PKCS1-v1_5 (RFC 8017 section 9.2).
+_RSA_SHA256_DIGEST_INFO = bytes.fromhex("3031300d060960864801650304020105000420")
+
+# NIST P-256 domain parameters (FIPS 186-4 D.1.2.3).
+_P256_P = 0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF
+_P256_A = _P256_P - 3
+_P256_B = 0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B
+_P256_N = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+_P256_G = (
+    0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+    0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5,
+)
+
+
+def _b64url_decode(value: str) -> bytes:
+    value = str(value or "")
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _b64url_int(value: str) -> int:
+    return int.from_bytes(_b64url_decode(value), "big")
+
+
+def _rsa_sha256_verify(public_key: tuple[int, int], message: bytes, signature: bytes) -> bool:
+    modulus, exponent = public_key
+    size = (modulus.bit_length() + 7) // 8
+    if len(signature) != size:
+        return False
+    signature_int = int.from_bytes(signature, "big")
+    if signature_int >= modulus:
+        return False
+    encoded = pow(signature_int, exponent, modulus).to_bytes(size, "big")
+    digest_info = _RSA_SHA256_DIGEST_INFO + hashlib.sha256(message).digest()
+    if size < len(digest_info) + 11:
+        return False
+    expected = b"\x00\x01" + b"\xff" * (size - len(digest_info) - 3) + b"\x00" + digest_info
+    return hmac.compare_digest(encoded, expected)
+
+
+def _p256_add(
+    left: tuple[int, int] | None,
+    right: tuple[int, int] | None,
+) -> tuple[int, int] | None:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left[0] == right[0]:
+        if (left[1] + right[1]) % _P256_P == 0:
+            return None
+        slope = (3 * left[0] * left[0] + _P256_A) * pow(2 * left[1], -1, _P256_P) % _P256_P
+    else:
+        slope = (right[1] - left[1]) * pow(right[0] - left[0], -1, _P256_P) % _P256_P
+    x = (slope * slope - left[0] - right[0]) % _P256_P
+    return x, (slope * (left[0] - x) - left[1]) % _P256_P
+
+
+def _p256_mul(scalar: int, point: tuple[int, int] | None) -> tuple[int, int] | None:
+    result: tuple[int, int] | None = None
+    addend = point
+    while scalar:
+        if scalar & 1:
+            result = _p256_add(result, addend)
+        addend = _p256_add(addend, addend)
+        scalar >>= 1
+    return result
+
+
+def _p256_on_curve(point: tuple[int, int]) -> bool:
+    x, y = point
+    if not (0 <= x < _P256_P and 0 <= y < _P256_P):
+        return False
+    return (y * y - (x * x * x + _P256_A * x + _P256_B)) % _P256_P == 0
+
+
+def _es256_verify(public_key: tuple[int, int], message: bytes, signature: bytes) -> bool:
+    # JWS carries ECDSA signatures as the raw 32-byte r and s values (RFC 7518 section 3.4).
+    if len(signature) != 64 or not _p256_on_curve(public_key):
+        return False
+    r = int.from_bytes(signature[:32], "big")
+    s = int.from_bytes(signature[32:], "big")
+    if not (1 <= r < _P256_N and 1 <= s < _P256_N):
+        return False
+    digest = int.from_bytes(hashlib.sha256(message).digest(), "big")
+    inverse = pow(s, -1, _P256_N)
+    point = _p256_add(
+        _p256_mul(digest * inverse % _P256_N, _P256_G),
+        _p256_mul(r * inverse % _P256_N, public_key),
+    )
+    return point is not None and point[0] % _P256_N == r
+
+
+def _parse_jwks_keys(payload: Any) -> list[tuple[str | None, str, tuple[int, int]]]:
+    keys: list[tuple[str | None, str, tuple[int, int]]] = []
+    entries = payload.get("keys") if isinstance(payload, dict) else None
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict) or entry.get("use", "sig") != "sig":
+            continue
+        kid = str(entry["kid"]) if entry.get("kid") is not None else None
+        try:
+            if entry.get("kty") == "RSA" and entry.get("n") and entry.get("e"):
+                keys.append((kid, "RS256", (_b64url_int(entry["n"]), _b64url_int(entry["e"]))))
+            elif entry.get("kty") == "EC" and entry.get("crv") == "P-256" and entry.get("x") and entry.get("y"):
+                keys.append((kid, "ES256", (_b64url_int(entry["x"]), _b64url_int(entry["y"]))))
+        except (TypeError, ValueError):
+            continue
+    return keys
+
+
+def _download_auth_jwks(url: str) -> list[tuple[str | None, str, tuple[int, int]]]:
+    try:
+        response = _upstream_request(url, headers={"Accept": "application/json"}, timeout=5)
+        payload = json.loads(response.body.decode("utf-8"))
+    except HTTPError as exc:
+        raise ValueError(f"JWKS unavailable ({exc.code}).") from exc
+    except URLError as exc:
+        raise ValueError(f"JWKS unavailable: {exc.reason}") from exc
+    except Exception as exc:  # pragma: no cover - unexpected decode/network failures
+        raise ValueError(f"JWKS lookup failed: {exc}") from exc
+    return _parse_jwks_keys(payload)
+
+
+def _refresh_auth_jwks(url: str) -> list[tuple[str | None, str, tuple[int, int]]]:
+    global _AUTH_JWKS_URL, _AUTH_JWKS_KEYS, _AUTH_JWKS_FETCHED_AT, _AUTH_JWKS_FAILED_AT
+
+    try:
+        keys = _download_auth_jwks(url)
+    except ValueError:
+        with _AUTH_JWKS_LOCK:
+            if _AUTH_JWKS_URL != url:
+                _AUTH_JWKS_URL = url
+                _AUTH_JWKS_KEYS = []
+                _AUTH_JWKS_FETCHED_AT = None
+            _AUTH_JWKS_FAILED_AT = time.monotonic()
+        raise
+
+    with _AUTH_JWKS_LOCK:
+        _AUTH_JWKS_URL = url
+        _AUTH_JWKS_KEYS = keys
+        _AUTH_JWKS_FETCHED_AT = time.monotonic()
+        _AUTH_JWKS_FAILED_AT = None
+    return keys
+
+
+def _reset_auth_jwks() -> None:
+    global _AUTH_JWKS_URL, _AUTH_JWKS_KEYS, _AUTH_JWKS_FETCHED_AT, _AUTH_JWKS_FAILED_AT
+
+    with _AUTH_JWKS_LOCK:
+        _AUTH_JWKS_URL = None
+        _AUTH_JWKS_KEYS = []
+        _AUTH_JWKS_FETCHED_AT = None
+        _AUTH_JWKS_FAILED_AT = None
+
+
+def _find_auth_jwks_keys(kid: str | None, alg: str) -> list[tuple[int, int]]:
+    """Return candidate keys for ``kid``, refetching the JWKS once on an unknown key id."""
+    url = _resolve_auth_jwks_url()
+
+    def matching(keys: list[tuple[str | None, str, tuple[int, int]]]) -> list[tuple[int, int]]:
+        return [key for key_id, key_alg, key in keys if key_alg == alg and (kid is None or key_id == kid)]
+
+    with _AUTH_JWKS_LOCK:
+        current = _AUTH_JWKS_URL == url
+        keys = list(_AUTH_JWKS_KEYS) if current else []
+        fetched_at = _AUTH_JWKS_FETCHED_AT if current else None
+        failed_at = _AUTH_JWKS_FAILED_AT if current else None
+
+    found = matching(keys)
+    if found:
+        return found
+
+    # Rotation shows up as an unknown kid. Refetch, but not more often than the
+    # minimum interval, so forged key ids cannot turn into a JWKS request flood.
+    # A failed fetch starts the same interval, so an outage is not hammered either.
+    min_refresh = _env_float(AUTH_JWKS_MIN_REFRESH_SECONDS_ENV, DEFAULT_AUTH_JWKS_MIN_REFRESH_SECONDS)
+    if failed_at is not None and time.monotonic() - failed_at < min_refresh:
+        raise ValueError("JWKS unavailable; waiting before the next fetch.")
+    if fetched_at is not None and time.monotonic() - fetched_at < min_refresh:
+        return []
+    return matching(_SINGLE_FLIGHT.do(("jwks", url), _refresh_auth_jwks, url))
+
+
+def _verify_jwt_locally(token: str) -> dict[str, Any]:
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise _UserinfoRejected("Bearer token is not a JWT.")
+    try:
+        header = json.loads(_b64url_decode(parts[0]))
+        claims = json.loads(_b64url_decode(parts[1]))
+        signature = _b64url_decode(parts[2])
+    except ValueError as exc:
+        raise _UserinfoRejected("Bearer token is not a well-formed JWT.") from exc
+    if not isinstance(header, dict) or not isinstance(claims, dict):
+        raise _UserinfoRejected("Bearer token is not a well-formed JWT.")
+
+    alg = str(header.get("alg") or "")
+    if alg not in {"RS256", "ES256"}:
+        raise _UserinfoRejected(f"Unsupported token algorithm {alg or 'none'}.")
+    # ID and refresh tokens are signed by the same keys; only access tokens may authenticate.
+    header_type = header.get("typ")
+    if header_type is not None and str(header_type).lower() not in JWT_HEADER_TYPES:
+        raise _UserinfoRejected("Bearer token is not an access token.")
+    token_type = claims.get("typ")
+    if token_type is not None and str(token_type).lower() not in JWT_ACCESS_TOKEN_TYPES:
+        raise _UserinfoRejected("Bearer token is not an access token.")
+    kid = str(header["kid"]) if header.get("kid") is not None else None
+    keys = _find_auth_jwks_keys(kid, alg)
+    if not keys:
+        raise _UserinfoRejected("Token signing key is not in the realm JWKS.")
+
+    verify = _rsa_sha256_verify if alg == "RS256" else _es256_verify
+    signing_input = f"{parts[0]}.{parts[1]}".encode("ascii")
+    if not any(verify(key, signing_input, signature) for key in keys):
+        raise _UserinfoRejected("Token signature is invalid.")
+
+    now = time.time()
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)) or now > exp + JWT_CLOCK_SKEW_SECONDS:
+        raise _UserinfoRejected("Token has expired.")
+    nbf = claims.get("nbf")
+    if isinstance(nbf, (int, float)) and now + JWT_CLOCK_SKEW_SECONDS < nbf:
+        raise _UserinfoRejected("Token is not valid yet.")
+
+    issuer = str(claims.get("iss", "") or "").strip()
+    if issuer.rstrip("/") != _resolve_auth_issuer().rstrip("/"):
+        raise _UserinfoRejected("Token issuer did not match the configured realm.")
+
+    # Keycloak access tokens name the requesting client in azp and often carry
+    # only "account" in aud, so either one may satisfy the audience check.
+    audience = _resolve_auth_audience()
+    token_audience = claims.get("aud")
+    audiences = token_audience if isinstance(token_audience, list) else [token_audience]
+    if audience not in audiences and claims.get("azp") != audience:
+        raise _UserinfoRejected("Token audience did not include this client.")
+
+    if not str(claims.get("sub", "") or "").strip():
+        raise _UserinfoRejected("Token did not include sub.")
+    return claims
+
+
+def _build_auth_token_verification_status() -> dict[str, Any]:
+    with _AUTH_JWKS_LOCK:
+        fetched_at = _AUTH_JWKS_FETCHED_AT
+        failed_at = _AUTH_JWKS_FAILED_AT
+        key_count = len(_AUTH_JWKS_KEYS)
+    return {
+        "mode": _resolve_auth_token_verification(),
+        "jwks_url": _resolve_auth_jwks_url(),
+        "jwks_keys": key_count,
+        "jwks_age_seconds": round(time.monotonic() - fetched_at, 1) if fetched_at is not None else None,
+        "jwks_failed_seconds_ago": round(time.monotonic() - failed_at, 1) if failed_at is not None else None,
+    }
+
+
 def _extract_history_actor(headers: Any) -> tuple[dict[str, Any] | None, HTTPStatus, str | None]:
     bearer = _extract_bearer_token(headers)
     if bearer:
@@ -1758,16 +3464,16 @@ def _fetch_pericope_json(path: str, token: str, *, timeout: float = 6.0) -> dict
     if not clean_path.startswith("/"):
         clean_path = f"/{clean_path}"
 
-    request = Request(
-        f"{_resolve_pericope_api_base_url().rstrip('/')}{clean_path}",
-        headers={
-            "Authorization": f"Bearer {clean_token}",
-            "Accept": "application/json",
-        },
-    )
     try:
-        with urlopen(request, timeout=timeout) as response:
-            payload = json.loads(response.read().decode("utf-8"))
+        response = _upstream_request(
+            f"{_resolve_pericope_api_base_url().rstrip('/')}{clean_path}",
+            headers={
+                "Authorization": f"Bearer {clean_token}",
+                "Accept": "application/json",
+            },
+            timeout=timeout,
+        )
+        payload = json.loads(response.body.decode("utf-8"))
     except HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace").strip()
         raise ValueError(
@@ -1863,15 +3569,15 @@ def _fetch_vibevoice_json(
         headers["Content-Type"] = "application/json"
         method = "POST"
 
-    request = Request(
-        f"{(base_url or _resolve_vibevoice_api_base_url()).rstrip('/')}{clean_path}",
-        data=body,
-        headers=headers,
-        method=method,
-    )
     try:
-        with urlopen(request, timeout=timeout) as response:
-            response_payload = json.loads(response.read().decode("utf-8"))
+        response = _upstream_request(
+            f"{(base_url or _resolve_vibevoice_api_base_url()).rstrip('/')}{clean_path}",
+            method=method,
+            data=body,
+            headers=headers,
+            timeout=timeout,
+        )
+        response_payload = json.loads(response.body.decode("utf-8"))
     except HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace").strip()
         raise ValueError(
@@ -1912,7 +3618,191 @@ def _build_vibevoice_fallback_payload(request_payload: dict[str, Any]) -> dict[s
     return fallback_payload
 
 
-def _fetch_vibevoice_audio(audio_url: str) -> tuple[bytes, str]:
+def _resolve_vibevoice_health_routes() -> list[tuple[str, str]]:
+    primary_base_url = _resolve_vibevoice_api_base_url()
+    fallback_base_url = _resolve_vibevoice_fallback_api_base_url()
+    routes = [("primary", primary_base_url)] if primary_base_url else []
+    if fallback_base_url and fallback_base_url != primary_base_url:
+        routes.append(("fallback", fallback_base_url))
+    return routes
+
+
+class _VibeVoiceHealthMonitor:
+    """Last known reachability of the primary and fallback voice routes.
+
+    A background thread probes every configured route once per interval, with
+    random jitter so several proxies do not probe the gateway in step, and real
+    job submissions report their outcome as well. Readers only look at memory:
+    the health endpoint serves the snapshot and job submission skips a route
+    that has failed ``down_after`` times in a row. The snapshot carries states,
+    timestamps and latencies; error messages are only logged.
+    """
+
+    def __init__(self, *, interval: float, jitter: float, down_after: int = VIBEVOICE_HEALTH_DOWN_AFTER) -> None:
+        self.interval = max(0.0, interval)
+        self.jitter = min(1.0, max(0.0, jitter))
+        self.down_after = max(1, down_after)
+        self._routes: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.probes = 0
+
+    def record(self, role: str, ok: bool, latency_ms: float, error: str = "") -> None:
+        checked_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+        with self._lock:
+            route = self._routes.setdefault(
+                role,
+                {"consecutive_failures": 0, "history": deque(maxlen=VIBEVOICE_HEALTH_HISTORY_SIZE)},
+            )
+            route["history"].append({"ok": ok, "latency_ms": round(latency_ms, 1)})
+            route["checked_at"] = checked_at
+            was_down = self._state_locked(route) == "down"
+            if ok:
+                route["consecutive_failures"] = 0
+                route["last_ok_at"] = checked_at
+            else:
+                route["consecutive_failures"] += 1
+                route["last_failure_at"] = checked_at
+            is_down = self._state_locked(route) == "down"
+        # Error details go to the server log only; the snapshot is served publicly.
+        if is_down and not was_down:
+            print(f"[vibevoice-health] {role} is down: {_to_snippet(error, 240)}")
+        elif was_down and not is_down:
+            print(f"[vibevoice-health] {role} recovered")
+
+    def _state_locked(self, route: dict[str, Any] | None) -> str:
+        if route is None:
+            return "unknown"
+        return "down" if route["consecutive_failures"] >= self.down_after else "up"
+
+    def state(self, role: str) -> str:
+        with self._lock:
+            return self._state_locked(self._routes.get(role))
+
+    def is_down(self, role: str) -> bool:
+        return self.state(role) == "down"
+
+    def probe(self, role: str, base_url: str) -> None:
+        path = str(os.environ.get(VIBEVOICE_HEALTH_PATH_ENV, "") or DEFAULT_VIBEVOICE_HEALTH_PATH).strip()
+        if not path.startswith("/"):
+            path = f"/{path}"
+        started = time.monotonic()
+        ok, error = True, ""
+        try:
+            _upstream_request(
+                f"{base_url}{path}",
+                headers={"Accept": "application/json"},
+                timeout=VIBEVOICE_HEALTH_PROBE_TIMEOUT_SECONDS,
+            )
+        except Exception as exc:
+            # Any answer below 500 means the route is reachable, even without a health path.
+            if _is_upstream_health_failure(exc):
+                ok, error = False, str(exc)
+        with self._lock:
+            self.probes += 1
+        self.record(role, ok, (time.monotonic() - started) * 1000.0, error)
+
+    def probe_all(self) -> None:
+        executor = _get_upstream_executor()
+        futures = [executor.submit(self.probe, role, base_url) for role, base_url in _resolve_vibevoice_health_routes()]
+        for future in futures:
+            try:
+                future.result()
+            except Exception:  # pragma: no cover - a failed probe is retried next interval
+                continue
+
+    def next_delay(self) -> float:
+        return self.interval * (1.0 + random.uniform(-self.jitter, self.jitter))
+
+    def start(self) -> bool:
+        if self.interval <= 0:
+            return False
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="solomonic-vibevoice-health", daemon=True)
+                self._thread.start()
+        return True
+
+    def close(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        delay = random.uniform(0.0, self.interval * self.jitter)
+        while not self._stop.wait(delay):
+            self.probe_all()
+            delay = self.next_delay()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            routes = {}
+            for role, route in self._routes.items():
+                latencies = [entry["latency_ms"] for entry in route["history"] if entry["ok"]]
+                routes[role] = {
+                    "state": self._state_locked(route),
+                    "consecutive_failures": route["consecutive_failures"],
+                    "checked_at": route.get("checked_at"),
+                    "last_ok_at": route.get("last_ok_at"),
+                    "last_failure_at": route.get("last_failure_at"),
+                    "latency_ms": latencies[-1] if latencies else None,
+                    "avg_latency_ms": round(sum(latencies) / len(latencies), 1) if latencies else None,
+                }
+            return {
+                "running": self._thread is not None and not self._stop.is_set(),
+                "interval_seconds": self.interval,
+                "jitter": self.jitter,
+                "down_after": self.down_after,
+                "probes": self.probes,
+                "routes": routes,
+            }
+
+
+def _get_vibevoice_health_monitor() -> _VibeVoiceHealthMonitor:
+    global _VIBEVOICE_HEALTH_MONITOR
+
+    with _VIBEVOICE_HEALTH_MONITOR_LOCK:
+        if _VIBEVOICE_HEALTH_MONITOR is None:
+            _VIBEVOICE_HEALTH_MONITOR = _VibeVoiceHealthMonitor(
+                interval=_env_float(VIBEVOICE_HEALTH_INTERVAL_SECONDS_ENV, DEFAULT_VIBEVOICE_HEALTH_INTERVAL_SECONDS),
+                jitter=_env_float(VIBEVOICE_HEALTH_JITTER_ENV, DEFAULT_VIBEVOICE_HEALTH_JITTER),
+            )
+        return _VIBEVOICE_HEALTH_MONITOR
+
+
+def _reset_vibevoice_health_monitor() -> None:
+    global _VIBEVOICE_HEALTH_MONITOR
+
+    with _VIBEVOICE_HEALTH_MONITOR_LOCK:
+        monitor, _VIBEVOICE_HEALTH_MONITOR = _VIBEVOICE_HEALTH_MONITOR, None
+    if monitor is not None:
+        monitor.close()
+
+
+def _start_vibevoice_health_monitor() -> None:
+    if not _resolve_vibevoice_health_routes():
+        return
+    _get_vibevoice_health_monitor().start()
+
+
+def _fetch_vibevoice_route_json(role: str, path: str, **kwargs: Any) -> dict[str, Any]:
+    """``_fetch_vibevoice_json`` that reports the route's reachability to the health monitor."""
+    started = time.monotonic()
+    try:
+        response_payload = _fetch_vibevoice_json(path, **kwargs)
+    except ValueError as exc:
+        if _is_vibevoice_service_unavailable(exc):
+            _get_vibevoice_health_monitor().record(role, False, (time.monotonic() - started) * 1000.0, str(exc))
+        raise
+    _get_vibevoice_health_monitor().record(role, True, (time.monotonic() - started) * 1000.0)
+    return response_payload
+
+
+def _open_vibevoice_audio_stream(
+    audio_url: str,
+    *,
+    method: str = "GET",
+    range_headers: dict[str, str] | None = None,
+) -> _UpstreamStream:
     headers = {
         "Accept": "audio/wav,audio/*;q=0.9,*/*;q=0.1",
         **(
@@ -1920,6 +3810,7 @@ def _fetch_vibevoice_audio(audio_url: str) -> tuple[bytes, str]:
             if _resolve_vibevoice_api_token()
             else {}
         ),
+        **(range_headers or {}),
     }
     last_error: Exception | None = None
     for base_url in dict.fromkeys((
@@ -1928,10 +3819,8 @@ def _fetch_vibevoice_audio(audio_url: str) -> tuple[bytes, str]:
     )):
         if not base_url:
             continue
-        request = Request(f"{base_url}{audio_url}", headers=headers)
         try:
-            with urlopen(request, timeout=60) as response:
-                return response.read(), response.headers.get_content_type() or "audio/wav"
+            return _open_upstream_stream(f"{base_url}{audio_url}", method=method, headers=headers, timeout=60)
         except URLError as exc:
             last_error = exc
             continue
@@ -1949,12 +3838,469 @@ def _vibevoice_error_status(error: ValueError) -> HTTPStatus:
     return HTTPStatus.BAD_GATEWAY
 
 
+class _AudioFileCache:
+    """Content-addressed synthesized audio on disk with a SQLite index and size-bounded LRU eviction."""
+
+    def __init__(self, root: Path, *, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.root / "index.sqlite3"), timeout=5)
+        if not self._schema_ready:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS audio_cache ("
+                " key TEXT PRIMARY KEY,"
+                " content_type TEXT NOT NULL,"
+                " engine TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS audio_cache_last_access ON audio_cache (last_access)")
+            connection.commit()
+            self._schema_ready = True
+        return connection
+
+    def path_for(self, key: str) -> Path:
+        return self.root / f"{key}.audio"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the entry's metadata, refreshing its LRU position, or None when absent."""
+        with self._lock:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT content_type, engine, size FROM audio_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                if not self.path_for(key).is_file():
+                    connection.execute("DELETE FROM audio_cache WHERE key = ?", (key,))
+                    connection.commit()
+                    return None
+                connection.execute("UPDATE audio_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+                connection.commit()
+            finally:
+                connection.close()
+        return {"key": key, "content_type": row[0], "engine": row[1], "size": int(row[2]), "path": self.path_for(key)}
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            connection = self._connect()
+            try:
+                row = connection.execute("SELECT 1 FROM audio_cache WHERE key = ?", (key,)).fetchone()
+            finally:
+                connection.close()
+        return row is not None
+
+    def put_file(self, key: str, source: Path, *, content_type: str, engine: str) -> bool:
+        """Move ``source`` into the cache under ``key``; returns False when it is too large to keep."""
+        size = source.stat().st_size
+        if size > self.max_bytes:
+            source.unlink(missing_ok=True)
+            return False
+        now = time.time()
+        with self._lock:
+            os.replace(source, self.path_for(key))
+            connection = self._connect()
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO audio_cache (key, content_type, engine, size, stored_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, content_type, engine, size, now, now),
+                )
+                self._evict_locked(connection)
+                connection.commit()
+            finally:
+                connection.close()
+        return True
+
+    def _evict_locked(self, connection: sqlite3.Connection) -> None:
+        total = int(connection.execute("SELECT COALESCE(SUM(size), 0) FROM audio_cache").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        doomed: list[tuple[str]] = []
+        for key, size in connection.execute("SELECT key, size FROM audio_cache ORDER BY last_access ASC"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= int(size)
+        connection.executemany("DELETE FROM audio_cache WHERE key = ?", doomed)
+        for (key,) in doomed:
+            self.path_for(key).unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            connection = self._connect()
+            try:
+                entries, total = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM audio_cache"
+                ).fetchone()
+            finally:
+                connection.close()
+        return {"path": str(self.root), "entries": int(entries), "bytes": int(total), "max_bytes": self.max_bytes}
+
+
+def _resolve_vibevoice_audio_cache_dir() -> Path:
+    configured = os.environ.get(VIBEVOICE_AUDIO_CACHE_DIR_ENV, "").strip()
+    if configured:
+        return Path(configured)
+    try:
+        DEFAULT_VIBEVOICE_AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        return DEFAULT_VIBEVOICE_AUDIO_CACHE_DIR
+    except OSError:
+        return Path(tempfile.gettempdir()) / "solomonic-clock-vibevoice_audio"
+
+
+def _get_vibevoice_audio_cache() -> _AudioFileCache | None:
+    max_bytes = _env_int(VIBEVOICE_AUDIO_CACHE_MAX_BYTES_ENV, DEFAULT_VIBEVOICE_AUDIO_CACHE_MAX_BYTES)
+    if max_bytes <= 0:
+        return None
+    root = _resolve_vibevoice_audio_cache_dir()
+    with _VIBEVOICE_AUDIO_CACHES_LOCK:
+        cache = _VIBEVOICE_AUDIO_CACHES.get(str(root))
+        if cache is None or cache.max_bytes != max_bytes:
+            root.mkdir(parents=True, exist_ok=True)
+            cache = _AudioFileCache(root, max_bytes=max_bytes)
+            _VIBEVOICE_AUDIO_CACHES[str(root)] = cache
+        return cache
+
+
+def _build_vibevoice_audio_cache_stats() -> dict[str, Any]:
+    try:
+        cache = _get_vibevoice_audio_cache()
+        if cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **cache.stats()}
+    except (OSError, sqlite3.Error) as exc:
+        return {"enabled": True, "error": str(exc)}
+
+
+def _get_vibevoice_pending_jobs() -> _TTLCache:
+    global _VIBEVOICE_PENDING_JOBS
+
+    with _VIBEVOICE_PENDING_JOBS_LOCK:
+        if _VIBEVOICE_PENDING_JOBS is None:
+            _VIBEVOICE_PENDING_JOBS = _TTLCache(
+                max_entries=VIBEVOICE_PENDING_JOB_MAX_ENTRIES,
+                sweep_interval=60.0,
+            )
+        return _VIBEVOICE_PENDING_JOBS
+
+
+def _reset_vibevoice_audio_cache() -> None:
+    global _VIBEVOICE_PENDING_JOBS, _VIBEVOICE_CHUNKED_JOBS
+
+    with _VIBEVOICE_AUDIO_CACHES_LOCK:
+        _VIBEVOICE_AUDIO_CACHES.clear()
+    with _VIBEVOICE_PENDING_JOBS_LOCK:
+        _VIBEVOICE_PENDING_JOBS = None
+        _VIBEVOICE_CHUNKED_JOBS = None
+
+
+def _vibevoice_audio_cache_key(text: str, speaker_name: str, cfg_scale: Any, engine: str) -> str:
+    try:
+        normalized_cfg: Any = round(float(cfg_scale), 3)
+    except (TypeError, ValueError):
+        normalized_cfg = str(cfg_scale)
+    identity = [text, speaker_name, normalized_cfg, engine]
+    return hashlib.sha256(json.dumps(identity, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _build_cached_vibevoice_job(key: str, entry: dict[str, Any]) -> dict[str, Any]:
+    audio_url = f"{VIBEVOICE_CACHED_AUDIO_API_PATH}/{key}"
+    return {
+        "job_id": f"cache-{key}",
+        "status": "completed",
+        "audio_url": audio_url,
+        "proxy_audio_url": audio_url,
+        "proxy_route": "cache",
+        "engine": entry["engine"],
+        "proxy_engine": entry["engine"],
+        "cache_status": "hit",
+    }
+
+
+def _lookup_cached_vibevoice_job(key: str) -> dict[str, Any] | None:
+    try:
+        cache = _get_vibevoice_audio_cache()
+        entry = cache.get(key) if cache is not None else None
+    except (OSError, sqlite3.Error):
+        return None
+    return _build_cached_vibevoice_job(key, entry) if entry is not None else None
+
+
+def _remember_vibevoice_job(response_payload: dict[str, Any], key: str) -> dict[str, Any]:
+    """Tie a submitted job to its cache key so its audio is kept once it completes."""
+    job_id = str(response_payload.get("job_id") or "").strip()
+    if job_id:
+        _get_vibevoice_pending_jobs().set(job_id, key, VIBEVOICE_PENDING_JOB_TTL_SECONDS)
+    response_payload["cache_status"] = "miss"
+    _capture_vibevoice_audio(response_payload)
+    _get_vibevoice_job_tracker().track(response_payload)
+    return response_payload
+
+
+def _store_vibevoice_audio(key: str, audio_url: str, engine: str) -> bool:
+    cache = _get_vibevoice_audio_cache()
+    if cache is None or cache.contains(key):
+        return False
+
+    stream = _open_vibevoice_audio_stream(audio_url)
+    handle, temp_name = tempfile.mkstemp(dir=str(cache.root), suffix=".partial")
+    temp_path = Path(temp_name)
+    try:
+        written = 0
+        with os.fdopen(handle, "wb") as output:
+            for chunk in stream.iter_chunks(_env_int(STREAM_CHUNK_BYTES_ENV, DEFAULT_STREAM_CHUNK_BYTES)):
+                written += len(chunk)
+                if written > cache.max_bytes:
+                    return False
+                output.write(chunk)
+        content_type = stream.headers.get("Content-Type") or "audio/wav"
+        return cache.put_file(key, temp_path, content_type=content_type, engine=engine)
+    finally:
+        stream.close()
+        temp_path.unlink(missing_ok=True)
+
+
+def _capture_vibevoice_audio(response_payload: dict[str, Any]) -> Future | None:
+    """Copy a completed job's audio into the cache in the background."""
+    if response_payload.get("status") != "completed":
+        return None
+    job_id = str(response_payload.get("job_id") or "").strip()
+    key = _get_vibevoice_pending_jobs().get(job_id) if job_id else None
+    audio_url = str(response_payload.get("audio_url") or "").strip()
+    if key is None or not audio_url.startswith("/files/") or ".." in audio_url:
+        return None
+    engine = str(response_payload.get("proxy_engine") or response_payload.get("engine") or "").strip()
+
+    def store() -> bool:
+        try:
+            return bool(_SINGLE_FLIGHT.do(("vibevoice_audio", key), _store_vibevoice_audio, key, audio_url, engine))
+        except (OSError, sqlite3.Error, URLError, HTTPException, ValueError):
+            return False
+
+    return _run_in_background(store)
+
+
+def _split_tts_text(text: str, max_chars: int) -> list[str]:
+    """Split ``text`` at sentence boundaries into chunks of at most ``max_chars``.
+
+    The first chunk is kept to half the budget so the listener hears audio sooner.
+    Sentences longer than a chunk are split between words.
+    """
+    max_chars = max(40, max_chars)
+    pieces: list[str] = []
+    for sentence in re.split(r"(?<=[.!?;:])\s+", text.strip()):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            pieces.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            pieces.append(sentence)
+
+    chunks: list[str] = []
+    current = ""
+    for piece in pieces:
+        limit = max(40, max_chars // 2) if not chunks else max_chars
+        if current and len(current) + 1 + len(piece) > limit:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _get_vibevoice_chunked_jobs() -> _TTLCache:
+    global _VIBEVOICE_CHUNKED_JOBS
+
+    with _VIBEVOICE_PENDING_JOBS_LOCK:
+        if _VIBEVOICE_CHUNKED_JOBS is None:
+            _VIBEVOICE_CHUNKED_JOBS = _TTLCache(
+                max_entries=VIBEVOICE_PENDING_JOB_MAX_ENTRIES,
+                sweep_interval=60.0,
+            )
+        return _VIBEVOICE_CHUNKED_JOBS
+
+
+def _submit_chunked_vibevoice_job(
+    text: str,
+    speaker_name: str,
+    cfg_scale: Any,
+    cache_key: str,
+) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    """Synthesize long text as parallel per-chunk jobs behind one composite job id.
+
+    Concurrent requests for the same text share one submission. When some
+    chunks cannot be submitted, the composite is still registered with the
+    ones that were, so a retry only resubmits the failed chunks.
+    """
+    payload, error, status = _SINGLE_FLIGHT.do(
+        ("vibevoice_chunked", cache_key),
+        _start_chunked_vibevoice_job,
+        text,
+        speaker_name,
+        cfg_scale,
+        cache_key,
+    )
+    return (dict(payload) if payload is not None else None), error, status
+
+
+def _start_chunked_vibevoice_job(
+    text: str,
+    speaker_name: str,
+    cfg_scale: Any,
+    cache_key: str,
+) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    job_id = f"chunked-{cache_key[:40]}"
+    registry = _get_vibevoice_chunked_jobs()
+    chunk_chars = _env_int(VIBEVOICE_CHUNK_CHARS_ENV, DEFAULT_VIBEVOICE_CHUNK_CHARS)
+    chunks = _split_tts_text(text, min(chunk_chars, MAX_VIBEVOICE_TEXT_LENGTH))
+    children: list[str | None] = [None] * len(chunks)
+    existing = registry.get(job_id)
+    if existing is not None:
+        payload, error, status = _build_chunked_vibevoice_job_payload(job_id)
+        if payload is not None and payload.get("status") != "failed":
+            return payload, None, HTTPStatus.ACCEPTED
+        if payload is not None and payload["chunk_count"] == len(chunks):
+            for chunk in payload["chunks"]:
+                if chunk["status"] not in VIBEVOICE_TERMINAL_JOB_STATUSES - {"completed"}:
+                    children[chunk["index"]] = chunk["job_id"]
+
+    futures = {
+        index: _get_upstream_executor().submit(_submit_vibevoice_text_job, chunks[index], speaker_name, cfg_scale)
+        for index, child in enumerate(children)
+        if child is None
+    }
+    errors: dict[int, str] = {}
+    failure: tuple[str | None, HTTPStatus] | None = None
+    for index, future in futures.items():
+        payload, error, status = future.result()
+        if payload is None:
+            errors[index] = error or "VibeVoice chunk submission failed."
+            failure = failure or (error, status)
+            continue
+        children[index] = str(payload.get("job_id") or "")
+
+    registry.set(job_id, {"key": cache_key, "children": children, "errors": errors}, VIBEVOICE_PENDING_JOB_TTL_SECONDS)
+    if failure is not None:
+        return None, failure[0], failure[1]
+    payload, error, status = _build_chunked_vibevoice_job_payload(job_id)
+    if payload is None:
+        return None, error, status
+    _get_vibevoice_job_tracker().track(payload)
+    return payload, None, HTTPStatus.ACCEPTED
+
+
+def _build_chunked_vibevoice_job_payload(job_id: str) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    entry = _get_vibevoice_chunked_jobs().get(job_id)
+    if entry is None:
+        return None, "Chunked VibeVoice job has expired.", HTTPStatus.NOT_FOUND
+
+    tracker = _get_vibevoice_job_tracker()
+    chunks: list[dict[str, Any]] = []
+    for index, child_id in enumerate(entry["children"]):
+        if child_id is None:
+            chunks.append({"index": index, "job_id": None, "status": "failed", "detail": entry["errors"].get(index)})
+            continue
+        child = tracker.get(child_id)
+        if child is None:
+            child, error, _status = _build_vibevoice_job_status_payload(child_id)
+            child = child or {"job_id": child_id, "status": "failed", "detail": error}
+        chunk = {"index": index, "job_id": child_id, "status": str(child.get("status") or "")}
+        for field in ("proxy_audio_url", "audio_url", "detail"):
+            if child.get(field):
+                chunk[field] = child[field]
+        chunks.append(chunk)
+
+    done = sum(1 for chunk in chunks if chunk["status"] == "completed")
+    if any(chunk["status"] in VIBEVOICE_TERMINAL_JOB_STATUSES - {"completed"} for chunk in chunks):
+        status = "failed"
+    elif done == len(chunks):
+        status = "completed"
+    else:
+        status = "running"
+    payload: dict[str, Any] = {
+        "job_id": job_id,
+        "status": status,
+        "revision": f"{status}:{done}/{len(chunks)}",
+        "proxy_route": "chunked",
+        "chunk_count": len(chunks),
+        "chunks": chunks,
+    }
+    if status == "failed":
+        payload["detail"] = next((chunk.get("detail") for chunk in chunks if chunk.get("detail")), "A chunk failed.")
+    if status == "completed":
+        cached_job = _lookup_cached_vibevoice_job(entry["key"])
+        if cached_job is not None:
+            payload["proxy_audio_url"] = cached_job["proxy_audio_url"]
+            payload["audio_url"] = cached_job["audio_url"]
+        else:
+            _run_in_background(_assemble_chunked_vibevoice_audio, entry, chunks)
+    return payload, None, HTTPStatus.OK
+
+
+def _assemble_chunked_vibevoice_audio(entry: dict[str, Any], chunks: list[dict[str, Any]]) -> bool:
+    """Join completed chunk WAVs, in order, into one cache entry for the full text."""
+
+    def assemble() -> bool:
+        cache = _get_vibevoice_audio_cache()
+        if cache is None or cache.contains(entry["key"]):
+            return False
+        pending = _get_vibevoice_pending_jobs()
+        paths: list[Path] = []
+        for chunk in chunks:
+            child_id = chunk["job_id"]
+            child_key = child_id.removeprefix("cache-") if child_id.startswith("cache-") else pending.get(child_id)
+            if child_key is None:
+                return False
+            if not cache.contains(child_key):
+                _store_vibevoice_audio(child_key, str(chunk.get("audio_url") or ""), "")
+            child_entry = cache.get(child_key)
+            if child_entry is None:
+                return False
+            paths.append(child_entry["path"])
+
+        handle, temp_name = tempfile.mkstemp(dir=str(cache.root), suffix=".partial")
+        os.close(handle)
+        temp_path = Path(temp_name)
+        try:
+            with wave.open(str(temp_path), "wb") as output:
+                for index, path in enumerate(paths):
+                    with wave.open(str(path), "rb") as segment:
+                        if index == 0:
+                            output.setparams(segment.getparams())
+                        elif segment.getparams()[:3] != output.getparams()[:3]:
+                            return False
+                        output.writeframes(segment.readframes(segment.getnframes()))
+            return cache.put_file(entry["key"], temp_path, content_type="audio/wav", engine="chunked")
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    try:
+        return bool(_SINGLE_FLIGHT.do(("vibevoice_assemble", entry["key"]), assemble))
+    except (OSError, EOFError, wave.Error, sqlite3.Error, URLError, HTTPException, ValueError):
+        return False
+
+
 def _build_vibevoice_job_payload(payload: dict[str, Any]) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
     text = re.sub(r"\s+", " ", str(payload.get("text", "") or "")).strip()
     if not text:
         return None, "Missing required field: text.", HTTPStatus.BAD_REQUEST
-    if len(text) > MAX_VIBEVOICE_TEXT_LENGTH:
-        text = text[:MAX_VIBEVOICE_TEXT_LENGTH].rsplit(" ", 1)[0].strip() or text[:MAX_VIBEVOICE_TEXT_LENGTH]
+    if len(text) > MAX_VIBEVOICE_CHUNKED_TEXT_LENGTH:
+        text = (
+            text[:MAX_VIBEVOICE_CHUNKED_TEXT_LENGTH].rsplit(" ", 1)[0].strip()
+            or text[:MAX_VIBEVOICE_CHUNKED_TEXT_LENGTH]
+        )
 
     speaker_name = str(
         payload.get("speaker_name")
@@ -1963,7 +4309,26 @@ def _build_vibevoice_job_payload(payload: dict[str, Any]) -> tuple[dict[str, Any
     ).strip()
     if not speaker_name:
         speaker_name = DEFAULT_VIBEVOICE_SPEAKER
+    cfg_scale = payload.get("cfg_scale", 1.5)
+
+    chunk_chars = min(
+        MAX_VIBEVOICE_TEXT_LENGTH,
+        _env_int(VIBEVOICE_CHUNK_CHARS_ENV, DEFAULT_VIBEVOICE_CHUNK_CHARS),
+    )
+    if chunk_chars > 0 and len(text) > chunk_chars:
+        cache_key = _vibevoice_audio_cache_key(text, speaker_name, cfg_scale, VIBEVOICE_PRIMARY_CACHE_ENGINE)
+        cached_job = _lookup_cached_vibevoice_job(cache_key)
+        if cached_job is not None:
+            return cached_job, None, HTTPStatus.OK
+        return _submit_chunked_vibevoice_job(text, speaker_name, cfg_scale, cache_key)
+    return _submit_vibevoice_text_job(text, speaker_name, cfg_scale)
+
 
+def _submit_vibevoice_text_job(
+    text: str,
+    speaker_name: str,
+    cfg_scale: Any,
+) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
     project_id = str(os.environ.get(VIBEVOICE_PROJECT_ID_ENV, "") or DEFAULT_VIBEVOICE_PROJECT_ID).strip()
     request_payload = {
         "project_id": project_id,
@@ -1975,33 +4340,78 @@ def _build_vibevoice_job_payload(payload: dict[str, Any]) -> tuple[dict[str, Any
                 "text": text,
             }
         ],
-        "cfg_scale": payload.get("cfg_scale", 1.5),
+        "cfg_scale": cfg_scale,
         "output_subdir": "audio/vibevoice",
     }
 
+    # Daily content is the same for everyone, so most requests are answered from disk.
+    cache_key = _vibevoice_audio_cache_key(
+        text, speaker_name, request_payload["cfg_scale"], VIBEVOICE_PRIMARY_CACHE_ENGINE
+    )
+    cached_job = _lookup_cached_vibevoice_job(cache_key)
+    if cached_job is not None:
+        return cached_job, None, HTTPStatus.OK
+
+    # Go straight to the fallback while the monitor has the primary down and the fallback alive.
+    monitor = _get_vibevoice_health_monitor()
+    skipped_primary = (
+        len(_resolve_vibevoice_health_routes()) > 1 and monitor.is_down("primary") and not monitor.is_down("fallback")
+    )
+    if skipped_primary:
+        try:
+            return _submit_vibevoice_fallback_job(text, request_payload)
+        except ValueError:
+            pass  # The primary may have recovered since the last probe.
+
     try:
-        response_payload = _fetch_vibevoice_json("/v1/tts/jobs", payload=request_payload, timeout=20)
-        return _annotate_vibevoice_response(response_payload, "primary"), None, HTTPStatus.ACCEPTED
+        response_payload = _fetch_vibevoice_route_json("primary", "/v1/tts/jobs", payload=request_payload, timeout=20)
+        response_payload = _annotate_vibevoice_response(response_payload, "primary")
+        return _remember_vibevoice_job(response_payload, cache_key), None, HTTPStatus.ACCEPTED
     except ValueError as exc:
-        if _should_try_vibevoice_fallback(exc):
+        if not skipped_primary and _should_try_vibevoice_fallback(exc):
             try:
-                response_payload = _fetch_vibevoice_json(
-                    "/v1/tts/jobs",
-                    payload=_build_vibevoice_fallback_payload(request_payload),
-                    timeout=20,
-                    base_url=_resolve_vibevoice_fallback_api_base_url(),
-                )
-                return _annotate_vibevoice_response(response_payload, "fallback"), None, HTTPStatus.ACCEPTED
+                return _submit_vibevoice_fallback_job(text, request_payload)
             except ValueError:
                 pass
         return None, str(exc), _vibevoice_error_status(exc)
 
 
+def _submit_vibevoice_fallback_job(
+    text: str,
+    request_payload: dict[str, Any],
+) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    fallback_payload = _build_vibevoice_fallback_payload(request_payload)
+    fallback_key = _vibevoice_audio_cache_key(
+        text, fallback_payload["speaker_name"], fallback_payload["cfg_scale"], VIBEVOICE_FALLBACK_CACHE_ENGINE
+    )
+    cached_job = _lookup_cached_vibevoice_job(fallback_key)
+    if cached_job is not None:
+        return cached_job, None, HTTPStatus.OK
+    response_payload = _fetch_vibevoice_route_json(
+        "fallback",
+        "/v1/tts/jobs",
+        payload=fallback_payload,
+        timeout=20,
+        base_url=_resolve_vibevoice_fallback_api_base_url(),
+    )
+    response_payload = _annotate_vibevoice_response(response_payload, "fallback")
+    return _remember_vibevoice_job(response_payload, fallback_key), None, HTTPStatus.ACCEPTED
+
+
 def _build_vibevoice_job_status_payload(job_id: str) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
     clean_job_id = str(job_id or "").strip()
     if not re.fullmatch(r"[A-Za-z0-9_.:-]+", clean_job_id):
         return None, "Invalid VibeVoice job id.", HTTPStatus.BAD_REQUEST
 
+    if clean_job_id.startswith("chunked-"):
+        return _build_chunked_vibevoice_job_payload(clean_job_id)
+
+    if clean_job_id.startswith("cache-"):
+        cached_job = _lookup_cached_vibevoice_job(clean_job_id.removeprefix("cache-"))
+        if cached_job is None:
+            return None, "Cached VibeVoice audio is no longer available.", HTTPStatus.NOT_FOUND
+        return cached_job, None, HTTPStatus.OK
+
     try:
         base_url = (
             _resolve_vibevoice_fallback_api_base_url()
@@ -2010,16 +4420,396 @@ def _build_vibevoice_job_status_payload(job_id: str) -> tuple[dict[str, Any] | N
         )
         route = "fallback" if base_url == _resolve_vibevoice_fallback_api_base_url() else "primary"
         response_payload = _fetch_vibevoice_json(f"/v1/tts/jobs/{clean_job_id}", timeout=10, base_url=base_url)
-        return _annotate_vibevoice_response(response_payload, route), None, HTTPStatus.OK
+        response_payload = _annotate_vibevoice_response(response_payload, route)
+        _capture_vibevoice_audio(response_payload)
+        return response_payload, None, HTTPStatus.OK
     except ValueError as exc:
         return None, str(exc), _vibevoice_error_status(exc)
 
 
-def _build_vibevoice_health_payload() -> dict[str, Any]:
+class _VibeVoiceJobTracker:
+    """Shared upstream status polling for in-flight TTS jobs.
+
+    One scheduler thread polls every tracked job once per interval on the shared
+    upstream executor, however many listeners are waiting on it. Listeners block
+    on a condition until the job's status moves on. Finished jobs are kept for a
+    while so late listeners still get the result; jobs nobody has asked about
+    for ``idle_seconds`` stop being polled.
+    """
+
+    def __init__(self, *, poll_interval: float, idle_seconds: float) -> None:
+        self.poll_interval = max(0.01, poll_interval)
+        self.idle_seconds = max(self.poll_interval, idle_seconds)
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.upstream_polls = 0
+        self.poll_errors = 0
+
+    def track(self, payload: dict[str, Any]) -> None:
+        job_id = str(payload.get("job_id") or "").strip()
+        if not job_id:
+            return
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                self._jobs[job_id] = {"payload": dict(payload), "seen_at": time.monotonic(), "waiters": 0}
+            else:
+                self._update_locked(job, payload)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="solomonic-tts-jobs", daemon=True)
+                self._thread.start()
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job["seen_at"] = time.monotonic()
+            return dict(job["payload"])
+
+    def wait(self, job_id: str, since_status: str, timeout: float) -> dict[str, Any] | None:
+        """Block until the job leaves ``since_status`` or finishes, up to ``timeout`` seconds.
+
+        Chunked jobs report a ``revision`` (status plus finished chunks) that is
+        compared instead of the status, so listeners wake as each chunk lands.
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job["waiters"] += 1
+            try:
+                while True:
+                    status = str(job["payload"].get("status") or "")
+                    revision = str(job["payload"].get("revision") or status)
+                    remaining = deadline - time.monotonic()
+                    if revision != since_status or status in VIBEVOICE_TERMINAL_JOB_STATUSES or remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            finally:
+                job["waiters"] -= 1
+                job["seen_at"] = time.monotonic()
+            return dict(job["payload"])
+
+    def _update_locked(self, job: dict[str, Any], payload: dict[str, Any]) -> None:
+        if payload != job["payload"]:
+            job["payload"] = dict(payload)
+            if str(payload.get("status") or "") in VIBEVOICE_TERMINAL_JOB_STATUSES:
+                job["finished_at"] = time.monotonic()
+            self._condition.notify_all()
+
+    def _poll(self, job_id: str) -> None:
+        payload, error, status = _build_vibevoice_job_status_payload(job_id)
+        with self._condition:
+            self.upstream_polls += 1
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            if payload is not None:
+                self._update_locked(job, payload)
+                return
+            self.poll_errors += 1
+            if status in {HTTPStatus.BAD_REQUEST, HTTPStatus.NOT_FOUND}:
+                self._update_locked(job, {"job_id": job_id, "status": "failed", "detail": error or "Unknown job."})
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.poll_interval)
+            now = time.monotonic()
+            with self._condition:
+                if self._closed:
+                    return
+                for job_id, job in list(self._jobs.items()):
+                    finished_at = job.get("finished_at")
+                    if job["waiters"]:
+                        continue
+                    if finished_at is not None and now - finished_at > VIBEVOICE_JOB_RETENTION_SECONDS:
+                        del self._jobs[job_id]
+                    elif finished_at is None and now - job["seen_at"] > self.idle_seconds:
+                        del self._jobs[job_id]
+                due = [job_id for job_id, job in self._jobs.items() if "finished_at" not in job]
+            futures = [_get_upstream_executor().submit(self._poll, job_id) for job_id in due]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:  # pragma: no cover - a failed poll is retried next interval
+                    with self._condition:
+                        self.poll_errors += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "tracked": len(self._jobs),
+                "in_flight": sum(1 for job in self._jobs.values() if "finished_at" not in job),
+                "listeners": sum(job["waiters"] for job in self._jobs.values()),
+                "upstream_polls": self.upstream_polls,
+                "poll_errors": self.poll_errors,
+                "poll_interval_ms": int(self.poll_interval * 1000),
+            }
+
+
+def _get_vibevoice_job_tracker() -> _VibeVoiceJobTracker:
+    global _VIBEVOICE_JOB_TRACKER
+
+    with _VIBEVOICE_JOB_TRACKER_LOCK:
+        if _VIBEVOICE_JOB_TRACKER is None:
+            _VIBEVOICE_JOB_TRACKER = _VibeVoiceJobTracker(
+                poll_interval=_env_int(VIBEVOICE_JOB_POLL_MS_ENV, DEFAULT_VIBEVOICE_JOB_POLL_MS) / 1000.0,
+                idle_seconds=VIBEVOICE_JOB_IDLE_SECONDS,
+            )
+        return _VIBEVOICE_JOB_TRACKER
+
+
+def _reset_vibevoice_job_tracker() -> None:
+    global _VIBEVOICE_JOB_TRACKER
+
+    with _VIBEVOICE_JOB_TRACKER_LOCK:
+        tracker, _VIBEVOICE_JOB_TRACKER = _VIBEVOICE_JOB_TRACKER, None
+    if tracker is not None:
+        tracker.close()
+
+
+def _build_tracked_vibevoice_job_payload(
+    job_id: str,
+    query: dict[str, list[str]],
+) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    """Job status from the shared tracker; ``?wait=N&since=<status>`` long-polls for a change."""
+    wait_raw = (query.get("wait") or ["0"])[0]
+    try:
+        wait = max(0.0, min(float(VIBEVOICE_JOB_MAX_WAIT_SECONDS), float(wait_raw)))
+    except (TypeError, ValueError):
+        return None, f"Invalid wait value: {wait_raw!r}", HTTPStatus.BAD_REQUEST
+
+    tracker = _get_vibevoice_job_tracker()
+    clean_job_id = str(job_id or "").strip()
+    payload = tracker.get(clean_job_id)
+    if payload is None:
+        payload, error, status = _build_vibevoice_job_status_payload(clean_job_id)
+        if payload is None:
+            return None, error, status
+        tracker.track(payload)
+
+    since = str((query.get("since") or [payload.get("revision") or payload.get("status") or ""])[0])
+    if wait > 0:
+        payload = tracker.wait(clean_job_id, since, wait) or payload
+    return payload, None, HTTPStatus.OK
+
+
+def _bundle_speech_text(reference: Any, text: Any, *, inline: bool = False) -> str:
+    """Mirror the browser's speech text for a bundle card so cache keys line up."""
+    clean_text = str(text or "")
+    if inline:
+        lines = (line.strip() for line in re.sub(r"\r\n?", "\n", clean_text).split("\n"))
+        clean_text = " ".join(line for line in lines if line)
+    clean_reference = re.sub(r"\s+", " ", str(reference or "").replace("•", ".")).strip()
+    clean_text = re.sub(r"\s+", " ", re.sub(r"\n+", ". ", clean_text.strip())).strip()
+    return ". ".join(part for part in (clean_reference, clean_text) if part)
+
+
+def _build_tts_presynthesis_texts(timezone_name: str, day: date) -> list[str]:
+    """Speech texts for every distinct psalm and wisdom card shown on ``day`` in ``timezone_name``."""
+    zone = ZoneInfo(timezone_name)
+    texts: list[str] = []
+    for hour in range(24):
+        as_of = datetime(day.year, day.month, day.day, hour, 30, tzinfo=zone)
+        payload, _error, _status = _build_clock_content_bundle_payload(
+            {"timezone": timezone_name, "as_of": as_of.isoformat()}
+        )
+        bundle = (payload or {}).get("content_bundle") or {}
+        psalm = bundle.get("psalm") or {}
+        wisdom = bundle.get("wisdom") or {}
+        candidates = [
+            _bundle_speech_text(psalm.get("ref"), psalm.get("text")) if psalm.get("text") else "",
+            _bundle_speech_text(wisdom.get("ref"), wisdom.get("text"), inline=True) if wisdom.get("text") else "",
+        ]
+        for text in candidates:
+            if text and text not in texts:
+                texts.append(text)
+    return texts
+
+
+def _presynthesize_tts_text(text: str) -> str:
+    """Submit one text and follow its job until the audio is cached; returns the outcome."""
+    payload, _error, _status = _build_vibevoice_job_payload({"text": text})
+    if payload is None:
+        return "failed"
+    if payload.get("cache_status") == "hit":
+        return "cached"
+
+    job_id = str(payload.get("job_id") or "").strip()
+    tracker = _get_vibevoice_job_tracker()
+    tracker.track(payload)
+    deadline = time.monotonic() + TTS_PRESYNTH_JOB_TIMEOUT_SECONDS
+    while job_id and time.monotonic() < deadline:
+        status = str(payload.get("status") or "")
+        if status == "completed":
+            return "synthesized"
+        if status in VIBEVOICE_TERMINAL_JOB_STATUSES:
+            return "failed"
+        since = str(payload.get("revision") or status)
+        payload = tracker.wait(job_id, since, min(VIBEVOICE_JOB_MAX_WAIT_SECONDS, deadline - time.monotonic()))
+        if payload is None:
+            return "failed"
+    return "timed_out" if job_id else "failed"
+
+
+def _run_tts_presynthesis(timezone_name: str, day: date) -> dict[str, Any]:
+    texts = _build_tts_presynthesis_texts(timezone_name, day)
+    pending: queue.Queue = queue.Queue()
+    for text in texts:
+        pending.put(text)
+    outcomes: dict[str, int] = {}
+    outcomes_lock = threading.Lock()
+
+    def worker() -> None:
+        while True:
+            try:
+                text = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                outcome = _presynthesize_tts_text(text)
+            except Exception:  # pragma: no cover - one bad text must not stop the rest
+                outcome = "failed"
+            with outcomes_lock:
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    # Workers block on one job for minutes, so they get their own threads rather
+    # than occupying the shared background pool that serves short tasks.
+    concurrency = max(1, _env_int(TTS_PRESYNTH_CONCURRENCY_ENV, DEFAULT_TTS_PRESYNTH_CONCURRENCY))
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(texts))),
+        thread_name_prefix="solomonic-tts-presynth",
+    ) as executor:
+        workers = [executor.submit(worker) for _ in range(min(concurrency, len(texts)))]
+        for future in workers:
+            future.result()
+
+    summary = {
+        "timezone": timezone_name,
+        "day": day.isoformat(),
+        "texts": len(texts),
+        **outcomes,
+        "finished_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+    }
+    with _TTS_PRESYNTH_LOCK:
+        _TTS_PRESYNTH_RUNS[timezone_name] = summary
+    return summary
+
+
+def _resolve_tts_presynthesis_timezones() -> list[str]:
+    raw = os.environ.get(TTS_PRESYNTH_TIMEZONES_ENV, "")
+    return [name for name in dict.fromkeys(part.strip() for part in raw.split(",")) if name]
+
+
+def _tts_presynthesis_target_day(timezone_name: str, now: datetime) -> date:
+    """The local day whose content should be cached by ``now``: today, or tomorrow once inside the lead window."""
+    lead = timedelta(minutes=max(0, _env_int(TTS_PRESYNTH_LEAD_MINUTES_ENV, DEFAULT_TTS_PRESYNTH_LEAD_MINUTES)))
+    return (now.astimezone(ZoneInfo(timezone_name)) + lead).date()
+
+
+def _tts_presynthesis_step(timezone_name: str, now: datetime, progress: dict[str, Any]) -> None:
+    """Prepare the target day for one timezone unless it is done or backing off.
+
+    A day only counts as done once a run has no failed or timed-out texts;
+    otherwise it is retried after a delay that doubles with each attempt.
+    Texts cached by earlier attempts come back as cache hits.
+    """
+    day = _tts_presynthesis_target_day(timezone_name, now)
+    if progress.get("day") != day:
+        progress.clear()
+        progress["day"] = day
+    if progress.get("done") or time.monotonic() < progress.get("retry_at", 0.0):
+        return
+
+    try:
+        summary = _run_tts_presynthesis(timezone_name, day)
+        failures = summary.get("failed", 0) + summary.get("timed_out", 0)
+    except Exception as exc:  # pragma: no cover - keep the scheduler alive
+        print(f"[tts-presynth] {timezone_name}: {exc}")
+        failures = 1
+    if not failures:
+        progress["done"] = True
+        return
+    attempts = progress["attempts"] = progress.get("attempts", 0) + 1
+    delay = min(TTS_PRESYNTH_MAX_RETRY_SECONDS, TTS_PRESYNTH_RETRY_SECONDS * 2 ** (attempts - 1))
+    progress["retry_at"] = time.monotonic() + delay
+    print(f"[tts-presynth] {timezone_name} {day.isoformat()}: {failures} text(s) not cached, retrying in {delay:.0f}s")
+
+
+def _tts_presynthesis_loop(timezones: list[str]) -> None:
+    progress: dict[str, dict[str, Any]] = {timezone_name: {} for timezone_name in timezones}
+    while True:
+        now = datetime.now(ZoneInfo("UTC"))
+        for timezone_name in timezones:
+            try:
+                _tts_presynthesis_step(timezone_name, now, progress[timezone_name])
+            except Exception as exc:  # pragma: no cover - keep the scheduler alive
+                print(f"[tts-presynth] {timezone_name}: {exc}")
+        time.sleep(TTS_PRESYNTH_CHECK_SECONDS)
+
+
+def _start_tts_presynthesis_scheduler() -> None:
+    """Keep the audio cache filled with each configured timezone's upcoming daily content."""
+    global _TTS_PRESYNTH_STARTED
+
+    timezones = []
+    for timezone_name in _resolve_tts_presynthesis_timezones():
+        try:
+            ZoneInfo(timezone_name)
+        except Exception:
+            print(f"[tts-presynth] ignoring invalid timezone {timezone_name!r}")
+            continue
+        timezones.append(timezone_name)
+    if not timezones or _get_vibevoice_audio_cache() is None:
+        return
+    with _TTS_PRESYNTH_LOCK:
+        if _TTS_PRESYNTH_STARTED:
+            return
+        _TTS_PRESYNTH_STARTED = True
+
+    threading.Thread(
+        target=_tts_presynthesis_loop,
+        args=(timezones,),
+        name="solomonic-tts-presynth-scheduler",
+        daemon=True,
+    ).start()
+
+
+def _build_tts_presynthesis_status() -> dict[str, Any]:
+    with _TTS_PRESYNTH_LOCK:
+        return {
+            "enabled": _TTS_PRESYNTH_STARTED,
+            "timezones": _resolve_tts_presynthesis_timezones(),
+            "runs": [dict(run) for run in _TTS_PRESYNTH_RUNS.values()],
+        }
+
+
+def _build_vibevoice_health_payload(*, detailed: bool = False) -> dict[str, Any]:
+    """Summarize VibeVoice health; cache paths, errors and timezone names only when ``detailed``."""
     primary_base_url = _resolve_vibevoice_api_base_url()
     fallback_base_url = _resolve_vibevoice_fallback_api_base_url()
     token_configured = bool(_resolve_vibevoice_api_token())
     routes_configured = bool(primary_base_url or fallback_base_url)
+    # Reachability comes from the background monitor; this endpoint never probes upstream itself.
+    monitor = _get_vibevoice_health_monitor().snapshot()
+    audio_cache = _build_vibevoice_audio_cache_stats()
+    presynthesis = _build_tts_presynthesis_status()
+    if not detailed:
+        audio_cache = {**_omit_keys(audio_cache, "path", "error"), "healthy": "error" not in audio_cache}
+        presynthesis = {
+            **presynthesis,
+            "timezones": len(presynthesis["timezones"]),
+            "runs": [_omit_keys(run, "timezone") for run in presynthesis["runs"]],
+        }
     return {
         "status": "configured" if routes_configured else "missing_route",
         "client_boundary": "same-origin proxy; browser never receives Fortress token",
@@ -2029,18 +4819,25 @@ def _build_vibevoice_health_payload() -> dict[str, Any]:
             "engine": "voice-gateway",
             "route": "fortress-voice-gateway",
             "coordinates": ["vibevoice", "azure-speech"],
+            "state": monitor["routes"].get("primary", {}).get("state", "unknown"),
         },
         "fallback": {
             "role": "legacy_direct_fallback",
             "base_url_configured": bool(fallback_base_url),
             "engine": "azure-speech" if fallback_base_url else "",
             "route": "fortress-azure-voice" if fallback_base_url else "",
+            "state": monitor["routes"].get("fallback", {}).get("state", "unknown"),
         },
         "token_configured": token_configured,
         "project_id": str(os.environ.get(VIBEVOICE_PROJECT_ID_ENV, "") or DEFAULT_VIBEVOICE_PROJECT_ID).strip(),
         "speaker_name": str(os.environ.get(VIBEVOICE_SPEAKER_ENV, "") or DEFAULT_VIBEVOICE_SPEAKER).strip(),
         "fallback_speaker_name": DEFAULT_VIBEVOICE_FALLBACK_SPEAKER,
-        "max_text_length": MAX_VIBEVOICE_TEXT_LENGTH,
+        "max_text_length": MAX_VIBEVOICE_CHUNKED_TEXT_LENGTH,
+        "chunk_chars": _env_int(VIBEVOICE_CHUNK_CHARS_ENV, DEFAULT_VIBEVOICE_CHUNK_CHARS),
+        "audio_cache": audio_cache,
+        "presynthesis": presynthesis,
+        "job_tracker": _get_vibevoice_job_tracker().stats(),
+        "monitor": monitor,
     }
 
 
@@ -2073,18 +4870,18 @@ def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _read_history_store() -> dict[str, Any]:
-    path = _resolve_effective_history_store_path()
-    if not path.exists():
-        return {"clients": {}, "users": {}}
+def _read_history_store_file(path: Path) -> dict[str, Any]:
+    """Read the legacy JSON store; only a missing file counts as empty.
 
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
+    Unreadable or corrupt files raise ``OSError``/``ValueError`` so a migration
+    can leave its marker unset and try again on the next start.
+    """
+    if not path.exists():
         return {"clients": {}, "users": {}}
 
+    payload = json.loads(path.read_text(encoding="utf-8"))
     if not isinstance(payload, dict):
-        return {"clients": {}, "users": {}}
+        raise ValueError(f"{path} does not contain a JSON object")
     clients = payload.get("clients")
     users = payload.get("users")
     return {
@@ -2093,12 +4890,323 @@ def _read_history_store() -> dict[str, Any]:
     }
 
 
-def _write_history_store(payload: dict[str, Any]) -> None:
-    path = _resolve_effective_history_store_path()
-    _ensure_parent_dir(path)
-    temp_path = path.with_suffix(f"{path.suffix}.tmp")
-    temp_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
-    temp_path.replace(path)
+class _SqliteHistoryStore:
+    """Per-actor history rows in SQLite (WAL), one row per actor and one per date entry.
+
+    ``update_actor`` runs a read-modify-write for a single actor inside one
+    write transaction and only touches the entry rows that changed, so a sync
+    costs O(that actor's history) instead of O(every stored actor).
+    """
+
+    def __init__(self, path: Path, *, legacy_json_path: Path | None = None) -> None:
+        self.path = path
+        self.legacy_json_path = legacy_json_path
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(self.path), timeout=10, isolation_level=None)
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    self._prepare_schema(connection)
+                    self._schema_ready = True
+        return connection
+
+    def _prepare_schema(self, connection: sqlite3.Connection) -> None:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS history_actors ("
+            " kind TEXT NOT NULL,"
+            " actor_id TEXT NOT NULL,"
+            " key_hash TEXT,"
+            " profile TEXT,"
+            " created_at TEXT NOT NULL,"
+            " updated_at TEXT NOT NULL,"
+            " seq INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (kind, actor_id))"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS history_entries ("
+            " kind TEXT NOT NULL,"
+            " actor_id TEXT NOT NULL,"
+            " date_key TEXT NOT NULL,"
+            " entry TEXT NOT NULL,"
+            " version INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (kind, actor_id, date_key))"
+        )
+        # Databases created before the delta sync protocol lack the version columns.
+        for table, column in (("history_actors", "seq"), ("history_entries", "version")):
+            columns = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+        connection.execute("CREATE TABLE IF NOT EXISTS history_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._migrate_legacy_json(connection)
+
+    def _migrate_legacy_json(self, connection: sqlite3.Connection) -> None:
+        """Import ``history_store.json`` once; the JSON file is left in place untouched."""
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            done = connection.execute("SELECT value FROM history_meta WHERE key = 'json_migrated_at'").fetchone()
+            imported = True
+            if done is None and self.legacy_json_path is not None and self.legacy_json_path.exists():
+                try:
+                    legacy = _read_history_store_file(self.legacy_json_path)
+                except (OSError, ValueError) as exc:
+                    print(f"[history] legacy import from {self.legacy_json_path} failed, will retry: {exc}")
+                    imported = False
+                else:
+                    for kind, bucket in (("user", legacy["users"]), ("client", legacy["clients"])):
+                        for actor_id, record in bucket.items():
+                            if isinstance(record, dict):
+                                record = dict(record, state=_normalize_history_state(record.get("state") or {}))
+                                self._write_actor(connection, kind, str(actor_id), None, record)
+            if done is None and imported:
+                connection.execute(
+                    "INSERT INTO history_meta (key, value) VALUES ('json_migrated_at', ?)",
+                    (datetime.utcnow().isoformat() + "Z",),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _read_actor(connection: sqlite3.Connection, kind: str, actor_id: str) -> dict[str, Any] | None:
+        row = connection.execute(
+            "SELECT key_hash, profile, created_at, updated_at, seq FROM history_actors"
+            " WHERE kind = ? AND actor_id = ?",
+            (kind, actor_id),
+        ).fetchone()
+        if row is None:
+            return None
+        state: dict[str, Any] = {}
+        versions: dict[str, int] = {}
+        for date_key, entry, version in connection.execute(
+            "SELECT date_key, entry, version FROM history_entries WHERE kind = ? AND actor_id = ? ORDER BY date_key",
+            (kind, actor_id),
+        ):
+            try:
+                state[date_key] = json.loads(entry)
+            except json.JSONDecodeError:
+                continue
+            versions[date_key] = int(version)
+        record: dict[str, Any] = {
+            "created_at": row[2],
+            "updated_at": row[3],
+            "seq": int(row[4]),
+            "state": state,
+            "versions": versions,
+        }
+        if row[0] is not None:
+            record["key_hash"] = row[0]
+        if row[1] is not None:
+            record["profile"] = json.loads(row[1])
+        return record
+
+    @staticmethod
+    def _write_actor(
+        connection: sqlite3.Connection,
+        kind: str,
+        actor_id: str,
+        previous: dict[str, Any] | None,
+        record: dict[str, Any],
+    ) -> None:
+        now_iso = datetime.utcnow().isoformat() + "Z"
+        profile = record.get("profile")
+        connection.execute(
+            "INSERT OR REPLACE INTO history_actors (kind, actor_id, key_hash, profile, created_at, updated_at, seq)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                kind,
+                actor_id,
+                record.get("key_hash"),
+                json.dumps(profile, ensure_ascii=False) if profile is not None else None,
+                str(record.get("created_at") or now_iso),
+                str(record.get("updated_at") or now_iso),
+                int(record.get("seq") or 0),
+            ),
+        )
+        old_state = (previous or {}).get("state") or {}
+        old_versions = (previous or {}).get("versions") or {}
+        new_state = record.get("state") or {}
+        new_versions = record.get("versions") or {}
+        # Every changed entry carries a new version, so comparing versions is enough
+        # to find the rows to rewrite without comparing entry bodies.
+        connection.executemany(
+            "INSERT OR REPLACE INTO history_entries (kind, actor_id, date_key, entry, version) VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    kind,
+                    actor_id,
+                    date_key,
+                    json.dumps(entry, ensure_ascii=False, separators=(",", ":")),
+                    int(new_versions.get(date_key, 0)),
+                )
+                for date_key, entry in new_state.items()
+                if previous is None
+                or date_key not in old_state
+                or int(new_versions.get(date_key, 0)) != int(old_versions.get(date_key, 0))
+            ],
+        )
+        connection.executemany(
+            "DELETE FROM history_entries WHERE kind = ? AND actor_id = ? AND date_key = ?",
+            [(kind, actor_id, date_key) for date_key in old_state if date_key not in new_state],
+        )
+
+    def read_actor(self, kind: str, actor_id: str) -> dict[str, Any] | None:
+        connection = self._connect()
+        try:
+            return self._read_actor(connection, kind, actor_id)
+        finally:
+            connection.close()
+
+    def update_actor(self, kind: str, actor_id: str, mutate: Any) -> Any:
+        """Apply ``mutate(record) -> (new_record | None, result)`` atomically and return ``result``.
+
+        Returning ``None`` as the new record leaves the stored actor untouched.
+        """
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                previous = self._read_actor(connection, kind, actor_id)
+                record, result = mutate(previous)
+                if record is not None:
+                    self._write_actor(connection, kind, actor_id, previous, record)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            return result
+        finally:
+            connection.close()
+
+
+class _ShardedHistoryStore:
+    """One JSON file per actor, bucketed into hash shards that each have their own lock.
+
+    Actors hash into ``HISTORY_SHARD_COUNT`` buckets. A sync holds only its
+    bucket's lock while it reads and atomically replaces that actor's file, so
+    syncs for actors in different buckets never contend.
+    """
+
+    def __init__(self, root: Path, *, legacy_json_path: Path | None = None) -> None:
+        self.root = root
+        self.legacy_json_path = legacy_json_path
+        self._shard_locks = [threading.Lock() for _ in range(HISTORY_SHARD_COUNT)]
+        self._migration_lock = threading.Lock()
+        self._migrated = False
+
+    def _locate(self, kind: str, actor_id: str) -> tuple[threading.Lock, Path]:
+        digest = hashlib.sha256(f"{kind}\x00{actor_id}".encode("utf-8")).hexdigest()
+        shard = int(digest[:8], 16) % HISTORY_SHARD_COUNT
+        return self._shard_locks[shard], self.root / kind / f"{shard:03d}" / f"{digest}.json"
+
+    def _ensure_migrated(self) -> None:
+        """Split ``history_store.json`` into actor files once; existing actor files win."""
+        if self._migrated:
+            return
+        with self._migration_lock:
+            if self._migrated:
+                return
+            marker = self.root / ".json_migrated"
+            if not marker.exists():
+                if self.legacy_json_path is not None and self.legacy_json_path.exists():
+                    try:
+                        legacy = _read_history_store_file(self.legacy_json_path)
+                    except (OSError, ValueError) as exc:
+                        # Skip the marker so the next start retries; don't re-read on every request.
+                        print(f"[history] legacy import from {self.legacy_json_path} failed, will retry: {exc}")
+                        self._migrated = True
+                        return
+                    for kind, bucket in (("user", legacy["users"]), ("client", legacy["clients"])):
+                        for actor_id, record in bucket.items():
+                            if not isinstance(record, dict):
+                                continue
+                            lock, path = self._locate(kind, str(actor_id))
+                            with lock:
+                                if not path.exists():
+                                    state = _normalize_history_state(record.get("state") or {})
+                                    self._write_file(path, dict(record, state=state))
+                self.root.mkdir(parents=True, exist_ok=True)
+                marker.write_text(datetime.utcnow().isoformat() + "Z", encoding="utf-8")
+            self._migrated = True
+
+    @staticmethod
+    def _read_file(path: Path) -> dict[str, Any] | None:
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return record if isinstance(record, dict) else None
+
+    @staticmethod
+    def _write_file(path: Path, record: dict[str, Any]) -> None:
+        _ensure_parent_dir(path)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f".{path.stem}.",
+            suffix=".tmp",
+            delete=False,
+        ) as handle:
+            json.dump(record, handle, ensure_ascii=False, separators=(",", ":"))
+        os.replace(handle.name, path)
+
+    def read_actor(self, kind: str, actor_id: str) -> dict[str, Any] | None:
+        self._ensure_migrated()
+        _lock, path = self._locate(kind, actor_id)
+        # Files are only ever swapped in whole by os.replace, so reads need no lock.
+        return self._read_file(path)
+
+    def update_actor(self, kind: str, actor_id: str, mutate: Any) -> Any:
+        """Apply ``mutate(record) -> (new_record | None, result)`` under the actor's shard lock."""
+        self._ensure_migrated()
+        lock, path = self._locate(kind, actor_id)
+        with lock:
+            record, result = mutate(self._read_file(path))
+            if record is not None:
+                self._write_file(path, record)
+        return result
+
+
+def _resolve_history_store_backend() -> str:
+    raw = str(os.environ.get(HISTORY_STORE_BACKEND_ENV, DEFAULT_HISTORY_STORE_BACKEND) or "").strip().lower()
+    if raw in VALID_HISTORY_STORE_BACKENDS:
+        return raw
+    return DEFAULT_HISTORY_STORE_BACKEND
+
+
+def _resolve_history_db_path() -> Path:
+    configured = os.environ.get(HISTORY_DB_PATH_ENV, "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    return _resolve_effective_history_store_path().with_suffix(".sqlite3")
+
+
+def _resolve_history_shard_dir() -> Path:
+    configured = os.environ.get(HISTORY_SHARD_DIR_ENV, "").strip()
+    if configured:
+        return Path(configured).expanduser()
+    return _resolve_effective_history_store_path().with_suffix(".shards")
+
+
+def _get_history_store() -> _SqliteHistoryStore | _ShardedHistoryStore:
+    backend = _resolve_history_store_backend()
+    path = _resolve_history_shard_dir() if backend == "sharded" else _resolve_history_db_path()
+    with _HISTORY_STORES_LOCK:
+        store = _HISTORY_STORES.get(f"{backend}:{path}")
+        if store is None:
+            legacy_json_path = _resolve_effective_history_store_path()
+            if backend == "sharded":
+                store = _ShardedHistoryStore(path, legacy_json_path=legacy_json_path)
+            else:
+                _ensure_parent_dir(path)
+                store = _SqliteHistoryStore(path, legacy_json_path=legacy_json_path)
+            _HISTORY_STORES[f"{backend}:{path}"] = store
+        return store
 
 
 def _hash_history_key(secret: str) -> str:
@@ -2273,136 +5381,889 @@ def _merge_history_states(server_state: dict[str, Any], client_state: dict[str,
             combined["launches"] = launches[-MAX_HISTORY_LAUNCHES_PER_ENTRY:]
             combined["lastLaunchAt"] = str(combined["launches"][-1].get("launchedAt", ""))
 
-        merged[date_key] = _normalize_history_entry(combined)
+        merged[date_key] = _normalize_history_entry(combined)
+
+    return _normalize_history_state(merged)
+
+
+def _authorize_history_client(headers: Any) -> tuple[bool, HTTPStatus, str | None, str | None]:
+    client_id = str(headers.get(HISTORY_CLIENT_HEADER, "")).strip()
+    client_key = str(headers.get(HISTORY_KEY_HEADER, "")).strip()
+
+    if not _is_valid_history_client_id(client_id):
+        return False, HTTPStatus.BAD_REQUEST, None, f"Invalid or missing {HISTORY_CLIENT_HEADER}."
+    if len(client_key) < 24:
+        return False, HTTPStatus.UNAUTHORIZED, None, f"Invalid or missing {HISTORY_KEY_HEADER}."
+
+    return True, HTTPStatus.OK, client_id, client_key
+
+
+def _to_snippet(text: str, max_length: int = 220) -> str:
+    clean = re.sub(r"\s+", " ", str(text or "")).strip()
+    if not clean:
+        return ""
+    if len(clean) <= max_length:
+        return clean
+    return f"{clean[: max_length - 1].rstrip()}…"
+
+
+def _normalize_client_error_event(payload: Any) -> dict[str, Any] | None:
+    if not isinstance(payload, dict):
+        return None
+
+    severity = str(payload.get("severity", "error") or "error").strip().lower()
+    if severity not in {"info", "warn", "error"}:
+        severity = "error"
+
+    http_status: int | None = None
+    raw_status = payload.get("httpStatus")
+    if raw_status not in {None, ""}:
+        try:
+            http_status = int(raw_status)
+        except (TypeError, ValueError):
+            http_status = None
+
+    chapter: int | None = None
+    raw_chapter = payload.get("chapter")
+    if raw_chapter not in {None, ""}:
+        try:
+            chapter = int(raw_chapter)
+        except (TypeError, ValueError):
+            chapter = None
+
+    verse: int | None = None
+    raw_verse = payload.get("verse")
+    if raw_verse not in {None, ""}:
+        try:
+            verse = int(raw_verse)
+        except (TypeError, ValueError):
+            verse = None
+
+    event = {
+        "receivedAt": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+        "kind": _to_snippet(str(payload.get("kind", "")).strip(), 80),
+        "severity": severity,
+        "message": _to_snippet(str(payload.get("message", "")).strip(), 500),
+        "endpoint": _to_snippet(str(payload.get("endpoint", "")).strip(), 160),
+        "httpStatus": http_status,
+        "source": _to_snippet(str(payload.get("source", "")).strip(), 200),
+        "fallbackUsed": bool(payload.get("fallbackUsed")),
+        "requestedReference": _to_snippet(str(payload.get("requestedReference", "")).strip(), 140),
+        "resolvedReference": _to_snippet(str(payload.get("resolvedReference", "")).strip(), 140),
+        "requestKind": _to_snippet(str(payload.get("requestKind", "")).strip(), 48),
+        "pageUrl": _to_snippet(str(payload.get("pageUrl", "")).strip(), 280),
+        "pagePath": _to_snippet(str(payload.get("pagePath", "")).strip(), 160),
+        "assetVersion": _to_snippet(str(payload.get("assetVersion", "")).strip(), 48),
+        "release": _to_snippet(str(payload.get("release", "")).strip(), 120),
+        "lens": _to_snippet(str(payload.get("lens", "")).strip(), 32),
+        "mode": _to_snippet(str(payload.get("mode", "")).strip(), 32),
+        "presentation": _to_snippet(str(payload.get("presentation", "")).strip(), 32),
+        "readingDepth": _to_snippet(str(payload.get("readingDepth", "")).strip(), 24),
+        "authMode": _to_snippet(str(payload.get("authMode", "")).strip(), 24),
+        "dateKey": _to_snippet(str(payload.get("dateKey", "")).strip(), 40),
+        "chapter": chapter,
+        "verse": verse,
+    }
+
+    if not event["kind"]:
+        return None
+
+    return event
+
+
+def _client_error_fingerprint(event: dict[str, Any]) -> str:
+    identity = [
+        event.get("kind", ""),
+        event.get("endpoint", ""),
+        event.get("requestedReference", ""),
+        event.get("message", ""),
+    ]
+    return hashlib.sha256(json.dumps(identity, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
+
+def _new_client_error_total(fingerprint: str, event: dict[str, Any], seen_at: str) -> dict[str, Any]:
+    return {
+        "fingerprint": fingerprint,
+        "kind": event.get("kind", ""),
+        "severity": event.get("severity", "error"),
+        "endpoint": event.get("endpoint", ""),
+        "requestedReference": event.get("requestedReference", ""),
+        "message": event.get("message", ""),
+        "count": 0,
+        "firstSeen": seen_at,
+    }
+
+
+class _ClientErrorLogWriter:
+    """Write-behind appender for the client error JSONL log.
+
+    Request threads only enqueue. One daemon thread drains the bounded queue in
+    batches, so each batch costs a single open/append, and rotates the file by
+    size and by UTC day. When the queue is nearly full, non-error events are
+    sampled; when it is full, events are dropped. Both outcomes are counted.
+
+    Identical events (same kind, endpoint, requested reference and message)
+    are folded per fingerprint for ``aggregate_seconds`` and written as one
+    record carrying ``count``, ``firstSeen`` and ``lastSeen``. Running totals
+    per fingerprint stay in memory for the top-errors query and are seeded
+    from the current log file at startup.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        max_bytes: int,
+        keep_files: int,
+        aggregate_seconds: float = 0.0,
+    ) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.aggregate_seconds = max(0.0, aggregate_seconds)
+        self._open: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._totals: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self.max_bytes = max(1, max_bytes)
+        self.keep_files = max(0, keep_files)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._sample_tick = 0
+        self.accepted = 0
+        self.written = 0
+        self.records = 0
+        self.batches = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.last_path: str | None = None
+
+    def submit(self, event: dict[str, Any]) -> bool:
+        """Queue ``event`` for writing; returns False when it was sampled out or dropped."""
+        with self._lock:
+            if event.get("severity") != "error" and self._queue.qsize() * 4 >= self._queue.maxsize * 3:
+                # Under pressure keep every error but only one in ten info/warn events.
+                self._sample_tick += 1
+                if self._sample_tick % CLIENT_ERRORS_SAMPLE_EVERY:
+                    self.sampled_out += 1
+                    return False
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self.accepted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="solomonic-client-errors", daemon=True)
+                self._thread.start()
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Write every queued event and open aggregate; returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            started = self._thread is not None
+        if not started:
+            return True
+        try:
+            self._queue.put(_CLIENT_ERRORS_FLUSH, timeout=max(0.0, timeout))
+        except queue.Full:
+            return False
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            # Sleep until the next event, or until the oldest open aggregate is due.
+            timeout = None
+            if self._open:
+                timeout = max(0.0, min(opened for opened, _record in self._open.values()) + self.aggregate_seconds - time.monotonic())
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while batch and len(batch) < self.batch_size and batch[-1] is not _CLIENT_ERRORS_FLUSH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                events = [event for event in batch if event is not _CLIENT_ERRORS_FLUSH]
+                records = self._aggregate(events, close_all=len(events) != len(batch))
+                if records:
+                    self._write_batch(records)
+            except Exception:  # pragma: no cover - never let the writer thread die
+                with self._lock:
+                    self.write_errors += 1
+            finally:
+                for _event in batch:
+                    self._queue.task_done()
+
+    def _aggregate(self, events: list[dict[str, Any]], *, close_all: bool) -> list[dict[str, Any]]:
+        """Fold ``events`` into per-fingerprint windows and return the records now due."""
+        now = time.monotonic()
+        with self._lock:
+            for event in events:
+                fingerprint = _client_error_fingerprint(event)
+                seen_at = str(event.get("receivedAt", ""))
+                total = self._totals.pop(fingerprint, None)
+                if total is None:
+                    total = _new_client_error_total(fingerprint, event, seen_at)
+                total["count"] += 1
+                total["lastSeen"] = seen_at
+                self._totals[fingerprint] = total
+                while len(self._totals) > CLIENT_ERRORS_MAX_FINGERPRINTS:
+                    self._totals.popitem(last=False)
+
+                opened = self._open.get(fingerprint)
+                if opened is None:
+                    record = dict(event, fingerprint=fingerprint, count=0, firstSeen=seen_at)
+                    self._open[fingerprint] = (now, record)
+                else:
+                    record = opened[1]
+                record["count"] += 1
+                record["lastSeen"] = seen_at
+
+            due = [
+                fingerprint
+                for fingerprint, (opened_at, _record) in self._open.items()
+                if close_all or now - opened_at >= self.aggregate_seconds
+            ]
+            return [self._open.pop(fingerprint)[1] for fingerprint in due]
+
+    def seed_totals(self, path: Path) -> int:
+        """Rebuild the per-fingerprint totals from the records in ``path``; returns how many were read."""
+        seeded: dict[str, dict[str, Any]] = {}
+        read = 0
+        try:
+            handle = path.open(encoding="utf-8")
+        except OSError:
+            return 0
+        with handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                    count = max(1, int(record.get("count", 1)))
+                except (ValueError, TypeError, AttributeError):
+                    continue
+                read += 1
+                fingerprint = str(record.get("fingerprint") or _client_error_fingerprint(record))
+                last_seen = str(record.get("lastSeen") or record.get("receivedAt", ""))
+                total = seeded.get(fingerprint)
+                if total is None:
+                    total = seeded[fingerprint] = _new_client_error_total(
+                        fingerprint, record, str(record.get("firstSeen") or last_seen)
+                    )
+                    total["lastSeen"] = last_seen
+                total["count"] += count
+                total["lastSeen"] = max(total["lastSeen"], last_seen)
+
+        with self._lock:
+            live, self._totals = self._totals, OrderedDict(
+                (total["fingerprint"], total) for total in sorted(seeded.values(), key=lambda total: total["lastSeen"])
+            )
+            for fingerprint, total in live.items():
+                earlier = self._totals.pop(fingerprint, None)
+                if earlier is not None:
+                    total = dict(total, count=total["count"] + earlier["count"], firstSeen=earlier["firstSeen"])
+                self._totals[fingerprint] = total
+            while len(self._totals) > CLIENT_ERRORS_MAX_FINGERPRINTS:
+                self._totals.popitem(last=False)
+        return read
+
+    def top(self, limit: int) -> list[dict[str, Any]]:
+        with self._lock:
+            totals = [dict(total) for total in self._totals.values()]
+        totals.sort(key=lambda total: (total["count"], total["lastSeen"]), reverse=True)
+        return totals[: max(0, limit)]
+
+    def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        encoded = "".join(f"{json.dumps(event, ensure_ascii=False)}\n" for event in batch)
+        path = _resolve_client_errors_store_path()
+        try:
+            _ensure_parent_dir(path)
+            self._rotate_if_needed(path, len(encoded.encode("utf-8")))
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(encoded)
+        except OSError:
+            path = _resolve_client_errors_fallback_path()
+            _ensure_parent_dir(path)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(encoded)
+
+        for event in batch:
+            print(
+                "[client-error]",
+                event.get("severity", "error").upper(),
+                event.get("kind", "unknown"),
+                event.get("endpoint", ""),
+                event.get("requestedReference", ""),
+                event.get("message", ""),
+                f"x{event.get('count', 1)}",
+            )
+        with self._lock:
+            self.written += sum(int(event.get("count", 1)) for event in batch)
+            self.records += len(batch)
+            self.batches += 1
+            self.last_path = str(path)
+
+    def _rotate_if_needed(self, path: Path, incoming_bytes: int) -> None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return
+        if stat.st_size == 0:
+            return
+        now = datetime.utcnow()
+        same_day = datetime.utcfromtimestamp(stat.st_mtime).date() == now.date()
+        if same_day and stat.st_size + incoming_bytes <= self.max_bytes:
+            return
+
+        path.replace(path.with_name(f"{path.name}.{now.strftime('%Y%m%dT%H%M%S%f')}"))
+        with self._lock:
+            self.rotations += 1
+        rotated = sorted(path.parent.glob(f"{path.name}.*"))
+        for stale in rotated[: max(0, len(rotated) - self.keep_files)]:
+            stale.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "queue_size": self._queue.maxsize,
+                "accepted": self.accepted,
+                "written": self.written,
+                "records": self.records,
+                "open_aggregates": len(self._open),
+                "fingerprints": len(self._totals),
+                "batches": self.batches,
+                "dropped": self.dropped,
+                "sampled_out": self.sampled_out,
+                "rotations": self.rotations,
+                "write_errors": self.write_errors,
+                "path": self.last_path or str(_resolve_client_errors_store_path()),
+            }
+
+
+def _get_client_error_writer() -> _ClientErrorLogWriter:
+    global _CLIENT_ERROR_WRITER
+
+    with _CLIENT_ERROR_WRITER_LOCK:
+        if _CLIENT_ERROR_WRITER is None:
+            _CLIENT_ERROR_WRITER = _ClientErrorLogWriter(
+                queue_size=_env_int(CLIENT_ERRORS_QUEUE_SIZE_ENV, DEFAULT_CLIENT_ERRORS_QUEUE_SIZE),
+                batch_size=_env_int(CLIENT_ERRORS_BATCH_SIZE_ENV, DEFAULT_CLIENT_ERRORS_BATCH_SIZE),
+                flush_interval=_env_int(CLIENT_ERRORS_FLUSH_MS_ENV, DEFAULT_CLIENT_ERRORS_FLUSH_MS) / 1000.0,
+                max_bytes=_env_int(CLIENT_ERRORS_MAX_BYTES_ENV, DEFAULT_CLIENT_ERRORS_MAX_BYTES),
+                keep_files=_env_int(CLIENT_ERRORS_KEEP_FILES_ENV, DEFAULT_CLIENT_ERRORS_KEEP_FILES),
+                aggregate_seconds=_env_float(
+                    CLIENT_ERRORS_AGGREGATE_SECONDS_ENV,
+                    DEFAULT_CLIENT_ERRORS_AGGREGATE_SECONDS,
+                ),
+            )
+        return _CLIENT_ERROR_WRITER
+
+
+def _flush_client_error_log(timeout: float = 5.0) -> bool:
+    with _CLIENT_ERROR_WRITER_LOCK:
+        writer = _CLIENT_ERROR_WRITER
+    return writer.flush(timeout) if writer is not None else True
+
+
+def _reset_client_error_writer() -> None:
+    """Flush and forget the current writer so the next event picks up fresh settings."""
+    global _CLIENT_ERROR_WRITER
+
+    _flush_client_error_log()
+    with _CLIENT_ERROR_WRITER_LOCK:
+        _CLIENT_ERROR_WRITER = None
+
+
+def _seed_client_error_totals() -> int:
+    """Load the top-errors totals from the current log so they survive a restart."""
+    return _get_client_error_writer().seed_totals(_resolve_client_errors_store_path())
+
+
+def _append_client_error_event(payload: Any) -> tuple[dict[str, Any] | None, str | None]:
+    event = _normalize_client_error_event(payload)
+    if event is None:
+        return None, "Client error payload must include a kind."
+
+    queued = _get_client_error_writer().submit(dict(event))
+    event["storePath"] = str(_resolve_client_errors_store_path())
+    event["queued"] = queued
+    return event, None
+
+
+def _build_client_error_stats_payload() -> dict[str, Any]:
+    return {
+        "service": "solomonic_clock",
+        "log": _get_client_error_writer().stats(),
+        "checked_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+    }
+
+
+def _build_client_error_top_payload(query: dict[str, list[str]]) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    limit_raw = (query.get("limit") or ["20"])[0]
+    try:
+        limit = max(1, min(CLIENT_ERRORS_MAX_FINGERPRINTS, int(limit_raw)))
+    except (TypeError, ValueError):
+        return None, f"Invalid limit value: {limit_raw!r}", HTTPStatus.BAD_REQUEST
+
+    fingerprints = _get_client_error_writer().top(limit)
+    return {
+        "service": "solomonic_clock",
+        "fingerprints": fingerprints,
+        "count": len(fingerprints),
+        "checked_at": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+    }, None, HTTPStatus.OK
+
+
+def _build_client_error_post_payload(payload: Any) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    event, error = _append_client_error_event(payload)
+    if event is None:
+        return None, error or "Unable to record client error event.", HTTPStatus.BAD_REQUEST
+    return {"ok": True, "event": event}, None, HTTPStatus.ACCEPTED
+
+
+def _decode_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class _SourceSearchIndex:
+    """Read side of the inverted index written by ``scripts/index_source_texts.py``.
+
+    The file holds one segment per source so the indexer can rebuild only the
+    sources that changed. Only the header and the segment dictionaries are
+    decoded at load time; postings stay encoded and are decoded per query,
+    skipping position lists unless a phrase needs them.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        if not data.startswith(SOURCE_SEARCH_INDEX_MAGIC):
+            raise ValueError("Not a source search index.")
+        offset = len(SOURCE_SEARCH_INDEX_MAGIC)
+        (header_length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        header = json.loads(data[offset : offset + header_length].decode("utf-8"))
+        offset += header_length
+
+        self._data = data
+        self.generated = header.get("generated")
+        self.sources: list[dict[str, Any]] = header["sources"]
+        self.docs: list[list[Any]] = header["docs"]
+        self.avg_length = float(header.get("avg_length") or 1.0)
+        self.segments: list[tuple[int, dict[str, tuple[int, int, int]]]] = []
+
+        doc_base = 0
+        for entry in self.sources:
+            dictionary_end = offset + int(entry["dictionary_bytes"])
+            postings_offset = dictionary_end
+            terms: dict[str, tuple[int, int, int]] = {}
+            while offset < dictionary_end:
+                term_length, offset = _decode_varint(data, offset)
+                term = data[offset : offset + term_length].decode("utf-8")
+                offset += term_length
+                doc_freq, offset = _decode_varint(data, offset)
+                postings_length, offset = _decode_varint(data, offset)
+                terms[term] = (postings_offset, postings_length, doc_freq)
+                postings_offset += postings_length
+            offset = dictionary_end + int(entry["postings_bytes"])
+            self.segments.append((doc_base, terms))
+            doc_base += int(entry["doc_count"])
+
+    @classmethod
+    def load(cls, path: Path) -> "_SourceSearchIndex":
+        return cls(path.read_bytes())
+
+    def postings(self, term: str, *, positions_for: set[int] | None = None) -> dict[int, Any]:
+        """Map doc id to term frequency, or to the position list for docs in ``positions_for``."""
+        data = self._data
+        result: dict[int, Any] = {}
+        for doc_base, terms in self.segments:
+            entry = terms.get(term)
+            if entry is None:
+                continue
+            offset, length, _doc_freq = entry
+            end = offset + length
+            doc_id = doc_base
+            while offset < end:
+                delta, offset = _decode_varint(data, offset)
+                doc_id += delta
+                frequency, offset = _decode_varint(data, offset)
+                positions_length, offset = _decode_varint(data, offset)
+                if positions_for is None:
+                    result[doc_id] = frequency
+                if positions_for is None or doc_id not in positions_for:
+                    offset += positions_length
+                    continue
+                decoded = []
+                position = 0
+                for _ in range(frequency):
+                    gap = data[offset]
+                    if gap < 0x80:
+                        offset += 1
+                    else:
+                        gap, offset = _decode_varint(data, offset)
+                    position += gap
+                    decoded.append(position)
+                result[doc_id] = decoded
+        return result
+
+    def _idf(self, term: str) -> float:
+        doc_freq = sum(terms[term][2] for _doc_base, terms in self.segments if term in terms)
+        return math.log(1.0 + (len(self.docs) - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def _bm25(self, idf: float, frequency: int, doc_id: int) -> float:
+        norm = 1.0 - SOURCE_SEARCH_BM25_B + SOURCE_SEARCH_BM25_B * self.docs[doc_id][3] / self.avg_length
+        return idf * frequency * (SOURCE_SEARCH_BM25_K1 + 1.0) / (frequency + SOURCE_SEARCH_BM25_K1 * norm)
+
+    def search(
+        self,
+        terms: list[str],
+        phrases: list[list[str]],
+        *,
+        source_id: str | None = None,
+    ) -> list[tuple[float, int, int]]:
+        """Return ``(score, doc_id, matches)`` for sections containing every term and phrase, best first."""
+        phrase_terms = list(dict.fromkeys(term for phrase in phrases for term in phrase))
+        frequencies = {term: self.postings(term) for term in dict.fromkeys([*terms, *phrase_terms])}
+
+        candidates: set[int] | None = None
+        for doc_map in frequencies.values():
+            candidates = set(doc_map) if candidates is None else candidates & doc_map.keys()
+            if not candidates:
+                return []
+        if candidates is None:
+            return []
+        if source_id is not None:
+            source_indexes = {index for index, source in enumerate(self.sources) if source["source_id"] == source_id}
+            candidates = {doc_id for doc_id in candidates if self.docs[doc_id][0] in source_indexes}
+
+        # Positions are only decoded for sections that already contain every word.
+        positions = {term: self.postings(term, positions_for=candidates) for term in phrase_terms}
+        term_postings = {term: frequencies[term] for term in dict.fromkeys(terms)}
+        phrase_postings = [[positions[term] for term in phrase] for phrase in phrases]
+
+        term_idfs = [(self._idf(term), doc_map) for term, doc_map in term_postings.items()]
+        phrase_idfs = [sum(self._idf(term) for term in phrase) for phrase in phrases]
+        results = []
+        for doc_id in candidates:
+            score = 0.0
+            matches = 0
+            for idf, doc_map in term_idfs:
+                score += self._bm25(idf, doc_map[doc_id], doc_id)
+                matches += doc_map[doc_id]
+            for phrase_idf, maps in zip(phrase_idfs, phrase_postings):
+                starts = set(maps[0][doc_id])
+                for index, doc_map in enumerate(maps[1:], start=1):
+                    starts &= {position - index for position in doc_map[doc_id]}
+                    if not starts:
+                        break
+                if not starts:
+                    break
+                score += self._bm25(phrase_idf, len(starts), doc_id)
+                matches += len(starts)
+            else:
+                results.append((score, doc_id, matches))
+        results.sort(key=lambda result: (-result[0], result[1]))
+        return results
+
+
+def _load_reloadable_data_file(
+    cache: dict[str, tuple[float, Any]],
+    lock: threading.Lock,
+    path: Path,
+    loader: Any,
+    label: str,
+) -> Any:
+    """Load a generated data file once, reloading it when the file on disk is rebuilt."""
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    key = str(path)
+    with lock:
+        cached = cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            loaded = loader(path)
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as exc:
+            print(f"[{label}] unable to load {path}: {exc}")
+            return None
+        cache[key] = (mtime, loaded)
+        return loaded
+
+
+def _resolve_source_search_index_path() -> Path:
+    configured = os.environ.get(SOURCE_SEARCH_INDEX_PATH_ENV, "").strip()
+    return Path(configured).expanduser() if configured else DEFAULT_SOURCE_SEARCH_INDEX_PATH
+
+
+def _get_source_search_index() -> _SourceSearchIndex | None:
+    return _load_reloadable_data_file(
+        _SOURCE_SEARCH_INDEXES,
+        _SOURCE_SEARCH_INDEXES_LOCK,
+        _resolve_source_search_index_path(),
+        _SourceSearchIndex.load,
+        "source-search",
+    )
 
-    return _normalize_history_state(merged)
 
+def _reset_source_search_indexes() -> None:
+    with _SOURCE_SEARCH_INDEXES_LOCK:
+        _SOURCE_SEARCH_INDEXES.clear()
+
+
+class _SourceTextStore:
+    """Source and section metadata in memory, section texts sliced from a memory-mapped blob.
+
+    Reads the split format written by ``scripts/index_source_texts.py``: a
+    metadata table whose section rows carry byte offsets into one flat UTF-8
+    blob. Only the table is parsed, so memory use does not grow with the
+    amount of text, and each lookup decodes just the requested section.
+    """
+
+    def __init__(self, meta: dict[str, Any], blob: mmap.mmap | bytes) -> None:
+        fields = meta["section_fields"]
+        self.generated = meta.get("generated")
+        self.sources: list[dict[str, Any]] = []
+        self._sources_by_id: dict[str, dict[str, Any]] = {}
+        self._sections: dict[tuple[str, str], dict[str, Any]] = {}
+        self._positions: dict[tuple[str, str], int] = {}
+        self._blob = blob
+        for meta_source in meta["sources"]:
+            source = {key: value for key, value in meta_source.items() if key != "sections"}
+            source["sections"] = [dict(zip(fields, row)) for row in meta_source["sections"]]
+            self.sources.append(source)
+            self._sources_by_id[source["source_id"]] = source
+            for position, section in enumerate(source["sections"]):
+                self._sections[(source["source_id"], section["section_id"])] = section
+                self._positions[(source["source_id"], section["section_id"])] = position
+
+    @classmethod
+    def load(cls, meta_path: Path) -> "_SourceTextStore":
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        blob_path = meta_path.parent / str(meta["blob"])
+        with blob_path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size != int(meta["blob_bytes"]):
+                raise ValueError(f"{blob_path.name} is {size} bytes; the table expects {meta['blob_bytes']}.")
+            # mmap keeps its own reference to the file, so the handle can close.
+            blob = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        return cls(meta, blob)
+
+    def source(self, source_id: str) -> dict[str, Any] | None:
+        return self._sources_by_id.get(source_id)
+
+    def section(self, source_id: str, section_id: str) -> dict[str, Any] | None:
+        return self._sections.get((source_id, section_id))
+
+    def section_position(self, source_id: str, section_id: str) -> int | None:
+        return self._positions.get((source_id, section_id))
+
+    def section_text(self, source_id: str, section_id: str) -> str | None:
+        section = self._sections.get((source_id, section_id))
+        if section is None:
+            return None
+        offset = int(section["offset"])
+        return self._blob[offset : offset + int(section["length"])].decode("utf-8")
 
-def _authorize_history_client(headers: Any) -> tuple[bool, HTTPStatus, str | None, str | None]:
-    client_id = str(headers.get(HISTORY_CLIENT_HEADER, "")).strip()
-    client_key = str(headers.get(HISTORY_KEY_HEADER, "")).strip()
 
-    if not _is_valid_history_client_id(client_id):
-        return False, HTTPStatus.BAD_REQUEST, None, f"Invalid or missing {HISTORY_CLIENT_HEADER}."
-    if len(client_key) < 24:
-        return False, HTTPStatus.UNAUTHORIZED, None, f"Invalid or missing {HISTORY_KEY_HEADER}."
+def _resolve_source_texts_meta_path() -> Path:
+    configured = os.environ.get(SOURCE_TEXTS_META_PATH_ENV, "").strip()
+    return Path(configured).expanduser() if configured else DEFAULT_SOURCE_TEXTS_META_PATH
 
-    return True, HTTPStatus.OK, client_id, client_key
 
+def _get_source_text_store() -> _SourceTextStore | None:
+    return _load_reloadable_data_file(
+        _SOURCE_TEXT_STORES,
+        _SOURCE_TEXT_STORES_LOCK,
+        _resolve_source_texts_meta_path(),
+        _SourceTextStore.load,
+        "source-texts",
+    )
 
-def _to_snippet(text: str, max_length: int = 220) -> str:
-    clean = re.sub(r"\s+", " ", str(text or "")).strip()
-    if not clean:
-        return ""
-    if len(clean) <= max_length:
-        return clean
-    return f"{clean[: max_length - 1].rstrip()}…"
 
+def _reset_source_text_stores() -> None:
+    with _SOURCE_TEXT_STORES_LOCK:
+        _SOURCE_TEXT_STORES.clear()
+
+
+def _parse_source_search_query(raw_query: str) -> tuple[list[str], list[list[str]]]:
+    phrases = []
+    for quoted in re.findall(r'"([^"]*)"', raw_query):
+        tokens = SOURCE_SEARCH_TOKEN_PATTERN.findall(quoted.lower())
+        if tokens:
+            phrases.append(tokens)
+    bare = re.sub(r'"[^"]*"?', " ", raw_query)
+    terms = SOURCE_SEARCH_TOKEN_PATTERN.findall(bare.lower())
+    # A one-word phrase is just a term.
+    terms.extend(phrase[0] for phrase in phrases if len(phrase) == 1)
+    return terms, [phrase for phrase in phrases if len(phrase) > 1]
+
+
+def _source_search_snippet(text: str, terms: list[str], phrases: list[list[str]]) -> str:
+    clean = re.sub(r"\s+", " ", text).strip()
+    patterns = [r"[\W_]+".join(re.escape(word) for word in phrase) for phrase in phrases]
+    patterns.extend(re.escape(term) for term in terms)
+    start = 0
+    for pattern in patterns:
+        match = re.search(rf"(?<![^\W_]){pattern}(?![^\W_])", clean, re.IGNORECASE)
+        if match is not None:
+            start = max(0, match.start() - SOURCE_SEARCH_SNIPPET_CHARS // 3)
+            break
+    snippet = _to_snippet(clean[start:], SOURCE_SEARCH_SNIPPET_CHARS)
+    return f"…{snippet}" if start else snippet
 
-def _normalize_client_error_event(payload: Any) -> dict[str, Any] | None:
-    if not isinstance(payload, dict):
-        return None
 
-    severity = str(payload.get("severity", "error") or "error").strip().lower()
-    if severity not in {"info", "warn", "error"}:
-        severity = "error"
+def _build_source_search_payload(query: dict[str, list[str]]) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    raw_query = str((query.get("q") or [""])[0]).strip()
+    terms, phrases = _parse_source_search_query(raw_query)
+    if not terms and not phrases:
+        return None, "Missing search query (q).", HTTPStatus.BAD_REQUEST
 
-    http_status: int | None = None
-    raw_status = payload.get("httpStatus")
-    if raw_status not in {None, ""}:
-        try:
-            http_status = int(raw_status)
-        except (TypeError, ValueError):
-            http_status = None
+    limit_raw = (query.get("limit") or [str(SOURCE_SEARCH_DEFAULT_LIMIT)])[0]
+    offset_raw = (query.get("offset") or ["0"])[0]
+    try:
+        limit = max(1, min(SOURCE_SEARCH_MAX_LIMIT, int(limit_raw)))
+        offset = max(0, int(offset_raw))
+    except (TypeError, ValueError):
+        return None, f"Invalid limit/offset value: {limit_raw!r}/{offset_raw!r}", HTTPStatus.BAD_REQUEST
+    source_id = str((query.get("source") or [""])[0]).strip() or None
+
+    index = _get_source_search_index()
+    if index is None:
+        return None, "Source search index is not built; run scripts/index_source_texts.py.", HTTPStatus.SERVICE_UNAVAILABLE
+
+    started = time.perf_counter()
+    results = index.search(terms, phrases, source_id=source_id)
+    store = _get_source_text_store()
+    hits = []
+    for score, doc_id, matches in results[offset : offset + limit]:
+        source_index, section_id, heading, _length = index.docs[doc_id]
+        source = index.sources[source_index]
+        text = store.section_text(source["source_id"], section_id) if store is not None else None
+        hits.append(
+            {
+                "source_id": source["source_id"],
+                "title": source.get("title"),
+                "section_id": section_id,
+                "heading": heading,
+                "score": round(score, 4),
+                "matches": matches,
+                "snippet": _source_search_snippet(text, terms, phrases) if text else "",
+            }
+        )
+    return {
+        "query": raw_query,
+        "terms": terms,
+        "phrases": [" ".join(phrase) for phrase in phrases],
+        "source": source_id,
+        "total": len(results),
+        "offset": offset,
+        "limit": limit,
+        "results": hits,
+        "took_ms": round((time.perf_counter() - started) * 1000.0, 2),
+        "index_generated": index.generated,
+    }, None, HTTPStatus.OK
 
-    chapter: int | None = None
-    raw_chapter = payload.get("chapter")
-    if raw_chapter not in {None, ""}:
-        try:
-            chapter = int(raw_chapter)
-        except (TypeError, ValueError):
-            chapter = None
 
-    verse: int | None = None
-    raw_verse = payload.get("verse")
-    if raw_verse not in {None, ""}:
-        try:
-            verse = int(raw_verse)
-        except (TypeError, ValueError):
-            verse = None
+SOURCE_TEXTS_UNAVAILABLE_ERROR = "Source texts index is not built; run scripts/index_source_texts.py."
 
-    event = {
-        "receivedAt": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
-        "kind": _to_snippet(str(payload.get("kind", "")).strip(), 80),
-        "severity": severity,
-        "message": _to_snippet(str(payload.get("message", "")).strip(), 500),
-        "endpoint": _to_snippet(str(payload.get("endpoint", "")).strip(), 160),
-        "httpStatus": http_status,
-        "source": _to_snippet(str(payload.get("source", "")).strip(), 200),
-        "fallbackUsed": bool(payload.get("fallbackUsed")),
-        "requestedReference": _to_snippet(str(payload.get("requestedReference", "")).strip(), 140),
-        "resolvedReference": _to_snippet(str(payload.get("resolvedReference", "")).strip(), 140),
-        "requestKind": _to_snippet(str(payload.get("requestKind", "")).strip(), 48),
-        "pageUrl": _to_snippet(str(payload.get("pageUrl", "")).strip(), 280),
-        "pagePath": _to_snippet(str(payload.get("pagePath", "")).strip(), 160),
-        "assetVersion": _to_snippet(str(payload.get("assetVersion", "")).strip(), 48),
-        "release": _to_snippet(str(payload.get("release", "")).strip(), 120),
-        "lens": _to_snippet(str(payload.get("lens", "")).strip(), 32),
-        "mode": _to_snippet(str(payload.get("mode", "")).strip(), 32),
-        "presentation": _to_snippet(str(payload.get("presentation", "")).strip(), 32),
-        "readingDepth": _to_snippet(str(payload.get("readingDepth", "")).strip(), 24),
-        "authMode": _to_snippet(str(payload.get("authMode", "")).strip(), 24),
-        "dateKey": _to_snippet(str(payload.get("dateKey", "")).strip(), 40),
-        "chapter": chapter,
-        "verse": verse,
-    }
 
-    if not event["kind"]:
-        return None
+def _source_summary(source: dict[str, Any]) -> dict[str, Any]:
+    summary = {key: value for key, value in source.items() if key != "sections"}
+    summary["text_bytes"] = sum(int(section["length"]) for section in source["sections"])
+    return summary
 
-    return event
 
+def _section_summary(section: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in section.items() if key not in {"offset", "length"}} | {
+        "text_bytes": int(section["length"])
+    }
 
-def _append_client_error_event(payload: Any) -> tuple[dict[str, Any] | None, str | None]:
-    event = _normalize_client_error_event(payload)
-    if event is None:
-        return None, "Client error payload must include a kind."
 
-    path = _resolve_client_errors_store_path()
-    encoded = json.dumps(event, ensure_ascii=False)
-    try:
-        with _CLIENT_ERRORS_STORE_LOCK:
-            _ensure_parent_dir(path)
-            with path.open("a", encoding="utf-8") as handle:
-                handle.write(encoded)
-                handle.write("\n")
-    except OSError:
-        fallback_path = _resolve_client_errors_fallback_path()
-        with _CLIENT_ERRORS_STORE_LOCK:
-            _ensure_parent_dir(fallback_path)
-            with fallback_path.open("a", encoding="utf-8") as handle:
-                handle.write(encoded)
-                handle.write("\n")
-        event["storePath"] = str(fallback_path)
-    else:
-        event["storePath"] = str(path)
+def _build_sources_payload() -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    store = _get_source_text_store()
+    if store is None:
+        return None, SOURCE_TEXTS_UNAVAILABLE_ERROR, HTTPStatus.SERVICE_UNAVAILABLE
+    return {
+        "generated": store.generated,
+        "source_count": len(store.sources),
+        "sources": [_source_summary(source) for source in store.sources],
+    }, None, HTTPStatus.OK
 
-    print(
-        "[client-error]",
-        event.get("severity", "error").upper(),
-        event.get("kind", "unknown"),
-        event.get("endpoint", ""),
-        event.get("requestedReference", ""),
-        event.get("message", ""),
-    )
-    return event, None
 
+def _build_source_resource_payload(
+    resource_path: str,
+    query: dict[str, list[str]],
+) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    """Serve ``{source_id}`` (metadata plus a page of sections) and ``{source_id}/sections/{section_id}``."""
+    parts = [unquote(part) for part in resource_path.split("/")]
+    if len(parts) not in {1, 3} or (len(parts) == 3 and parts[1] != "sections"):
+        return None, "Unknown source texts resource.", HTTPStatus.NOT_FOUND
+
+    store = _get_source_text_store()
+    if store is None:
+        return None, SOURCE_TEXTS_UNAVAILABLE_ERROR, HTTPStatus.SERVICE_UNAVAILABLE
+    source = store.source(parts[0])
+    if source is None:
+        return None, f"Unknown source: {parts[0]}", HTTPStatus.NOT_FOUND
+
+    if len(parts) == 3:
+        section = store.section(parts[0], parts[2])
+        if section is None:
+            return None, f"Unknown section: {parts[2]}", HTTPStatus.NOT_FOUND
+        sections = source["sections"]
+        position = store.section_position(parts[0], parts[2]) or 0
+        return {
+            "source_id": source["source_id"],
+            "title": source.get("title"),
+            **_section_summary(section),
+            "text": store.section_text(parts[0], parts[2]),
+            "previous_section_id": sections[position - 1]["section_id"] if position > 0 else None,
+            "next_section_id": sections[position + 1]["section_id"] if position + 1 < len(sections) else None,
+        }, None, HTTPStatus.OK
+
+    limit_raw = (query.get("limit") or [str(SOURCE_SECTIONS_DEFAULT_LIMIT)])[0]
+    offset_raw = (query.get("offset") or ["0"])[0]
+    try:
+        limit = max(1, min(SOURCE_SECTIONS_MAX_LIMIT, int(limit_raw)))
+        offset = max(0, int(offset_raw))
+    except (TypeError, ValueError):
+        return None, f"Invalid limit/offset value: {limit_raw!r}/{offset_raw!r}", HTTPStatus.BAD_REQUEST
 
-def _build_client_error_post_payload(payload: Any) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
-    event, error = _append_client_error_event(payload)
-    if event is None:
-        return None, error or "Unable to record client error event.", HTTPStatus.BAD_REQUEST
-    return {"ok": True, "event": event}, None, HTTPStatus.ACCEPTED
+    sections = source["sections"]
+    page = sections[offset : offset + limit]
+    return {
+        **_source_summary(source),
+        "sections": [_section_summary(section) for section in page],
+        "offset": offset,
+        "limit": limit,
+        "total": len(sections),
+        "next_offset": offset + limit if offset + limit < len(sections) else None,
+    }, None, HTTPStatus.OK
 
 
 def _strip_translation_meta(text: str) -> str:
@@ -4278,105 +8139,250 @@ def _build_clock_wisdom_anchor_payload(request_payload: dict[str, Any]) -> tuple
     }, None, status
 
 
-def _build_history_sync_get_payload(headers: Any) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+def _parse_history_cursor(value: Any) -> int | None:
+    try:
+        cursor = int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return cursor if cursor >= 0 else None
+
+
+def _stamp_history_record(
+    previous: dict[str, Any] | None,
+    record: dict[str, Any],
+    touched: list[str] | None = None,
+) -> None:
+    """Cap ``record["state"]`` and give every changed date the actor's next sequence number.
+
+    ``touched`` limits the change check to the dates a delta sync wrote; a full
+    sync compares every date against ``previous``.
+    """
+    old_state = (previous or {}).get("state") or {}
+    old_versions = (previous or {}).get("versions") or {}
+    state = record.get("state") or {}
+    if len(state) > MAX_HISTORY_ENTRIES_PER_CLIENT:
+        state = {date_key: state[date_key] for date_key in sorted(state)[-MAX_HISTORY_ENTRIES_PER_CLIENT:]}
+
+    candidates = state.keys() if touched is None else touched
+    changed = [date_key for date_key in candidates if date_key in state and old_state.get(date_key) != state[date_key]]
+    seq = int((previous or {}).get("seq") or 0) + (1 if changed else 0)
+    versions = {date_key: int(old_versions.get(date_key, 0)) for date_key in state}
+    for date_key in changed:
+        versions[date_key] = seq
+    record.update(state=state, seq=seq, versions=versions)
+
+
+def _build_history_delta(
+    record: dict[str, Any] | None,
+    cursor: int | None,
+    sent: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Entries the server changed after ``cursor``, skipping ones the client just sent unchanged.
+
+    A missing cursor, or one ahead of the server's sequence (e.g. after a
+    restore), returns every entry with ``reset`` set so the client starts over.
+    """
+    state = (record or {}).get("state") or {}
+    versions = (record or {}).get("versions") or {}
+    seq = int((record or {}).get("seq") or 0)
+    sent = sent or {}
+    reset = cursor is None or cursor > seq
+    changes = {
+        date_key: entry
+        for date_key, entry in sorted(state.items())
+        if reset or (int(versions.get(date_key, 0)) > cursor and sent.get(date_key) != entry)
+    }
+    return {
+        "protocol": HISTORY_SYNC_PROTOCOL,
+        "cursor": seq,
+        "reset": reset,
+        "changes": changes,
+        "stored_entries": len(state),
+    }
+
+
+def _build_history_sync_get_payload(
+    headers: Any,
+    query: dict[str, list[str]] | None = None,
+) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
     actor, status, error = _extract_history_actor(headers)
     if actor is None:
         return None, error or "Unauthorized.", status
 
-    with _HISTORY_STORE_LOCK:
-        store = _read_history_store()
-        record: dict[str, Any] | None = None
-        if actor["mode"] == "user":
-            record = store.get("users", {}).get(actor["id"])
-        else:
-            client_record = store.get("clients", {}).get(actor["id"])
-            if client_record is not None:
-                key_hash = _hash_history_key(str(actor.get("client_key", "") or "").strip())
-                if not hmac.compare_digest(str(client_record.get("key_hash", "")), key_hash):
-                    return None, "Invalid history key.", HTTPStatus.FORBIDDEN
-            record = client_record
-
-        if record is None:
-            response = {
-                "service": "solomonic_clock",
-                "state": {},
-                "stored_entries": 0,
-                "synced_at": datetime.utcnow().isoformat() + "Z",
-            }
-            response.update(_build_history_actor_payload(actor))
-            return response, None, HTTPStatus.OK
-
-        state = _normalize_history_state(record.get("state") or {})
-        response = {
-            "service": "solomonic_clock",
-            "state": state,
-            "stored_entries": len(state),
-            "synced_at": str(record.get("updated_at") or datetime.utcnow().isoformat() + "Z"),
-        }
+    kind = "user" if actor["mode"] == "user" else "client"
+    record = _get_history_store().read_actor(kind, actor["id"])
+    if kind == "client" and record is not None:
+        key_hash = _hash_history_key(str(actor.get("client_key", "") or "").strip())
+        if not hmac.compare_digest(str(record.get("key_hash", "")), key_hash):
+            return None, "Invalid history key.", HTTPStatus.FORBIDDEN
+
+    synced_at = str((record or {}).get("updated_at") or datetime.utcnow().isoformat() + "Z")
+    if query and "cursor" in query:
+        response = {"service": "solomonic_clock", "synced_at": synced_at}
+        response.update(_build_history_delta(record, _parse_history_cursor((query.get("cursor") or [""])[0])))
         response.update(_build_history_actor_payload(actor))
         return response, None, HTTPStatus.OK
 
+    state = dict(sorted(((record or {}).get("state") or {}).items()))
+    response = {
+        "service": "solomonic_clock",
+        "state": state,
+        "stored_entries": len(state),
+        "cursor": int((record or {}).get("seq") or 0),
+        "synced_at": synced_at,
+    }
+    response.update(_build_history_actor_payload(actor))
+    return response, None, HTTPStatus.OK
+
 
 def _build_history_sync_post_payload(
     headers: Any,
     request_payload: dict[str, Any],
 ) -> tuple[dict[str, Any] | None, str | None, HTTPStatus]:
+    """Merge a client's history into the stored copy.
+
+    Clients speaking ``delta-v1`` send ``{"cursor", "changes"}`` with only the
+    dates they changed since the cursor and get back only what the server
+    changed since then. A plain ``{"state"}`` body is a full sync and returns
+    the full merged state.
+    """
     actor, status, error = _extract_history_actor(headers)
     if actor is None:
         return None, error or "Unauthorized.", status
 
-    client_state = _normalize_history_state(request_payload.get("state") or {})
+    delta = "cursor" in request_payload or "changes" in request_payload
+    cursor = _parse_history_cursor(request_payload.get("cursor"))
+    client_state = _normalize_history_state(request_payload.get("changes" if delta else "state") or {})
     now_iso = datetime.utcnow().isoformat() + "Z"
 
-    with _HISTORY_STORE_LOCK:
-        store = _read_history_store()
+    def merge(record: dict[str, Any] | None) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        key_hash = _hash_history_key(str(actor.get("client_key", "") or "").strip())
+        if actor["mode"] != "user" and record is not None:
+            if not hmac.compare_digest(str(record.get("key_hash", "")), key_hash):
+                return None, None
+
+        server_state = (record or {}).get("state") or {}
+        touched: list[str] | None = None
+        if delta:
+            # Only the dates the client sent are merged; everything else is kept as stored.
+            merged = _merge_history_states(
+                {date_key: server_state[date_key] for date_key in client_state if date_key in server_state},
+                client_state,
+            )
+            state = dict(server_state)
+            state.update(merged)
+            touched = list(merged)
+        elif record is None:
+            state = client_state
+        else:
+            state = _merge_history_states(server_state, client_state)
+
+        updated = dict(record or {"created_at": now_iso}, state=state, updated_at=now_iso)
         if actor["mode"] == "user":
-            users = store.setdefault("users", {})
-            user_record = users.get(actor["id"])
-            if user_record is None:
-                merged_state = client_state
-                users[actor["id"]] = {
-                    "created_at": now_iso,
-                    "updated_at": now_iso,
-                    "profile": _build_history_actor_payload(actor).get("user", {}),
-                    "state": merged_state,
-                }
-            else:
-                merged_state = _merge_history_states(user_record.get("state") or {}, client_state)
-                user_record["updated_at"] = now_iso
-                user_record["profile"] = _build_history_actor_payload(actor).get("user", {})
-                user_record["state"] = merged_state
+            updated["profile"] = _build_history_actor_payload(actor).get("user", {})
+        elif record is None:
+            updated["key_hash"] = key_hash
+        _stamp_history_record(record, updated, touched)
+        return updated, updated
+
+    kind = "user" if actor["mode"] == "user" else "client"
+    stored = _get_history_store().update_actor(kind, actor["id"], merge)
+    if stored is None:
+        return None, "Invalid history key.", HTTPStatus.FORBIDDEN
+
+    response: dict[str, Any] = {"service": "solomonic_clock", "synced_at": now_iso}
+    if delta:
+        response.update(_build_history_delta(stored, cursor, client_state))
+    else:
+        merged_state = dict(sorted(stored["state"].items()))
+        response.update(
+            {
+                "state": merged_state,
+                "stored_entries": len(merged_state),
+                "cursor": stored["seq"],
+            }
+        )
+    response.update(_build_history_actor_payload(actor))
+    return response, None, HTTPStatus.OK
+
+
+def _get_pericope_history_detail_cache() -> _TTLCache:
+    global _PERICOPE_HISTORY_DETAIL_CACHE
+
+    with _PERICOPE_HISTORY_DETAIL_CACHE_LOCK:
+        if _PERICOPE_HISTORY_DETAIL_CACHE is None:
+            _PERICOPE_HISTORY_DETAIL_CACHE = _TTLCache(
+                max_entries=PERICOPE_HISTORY_DETAIL_CACHE_MAX_ENTRIES,
+                sweep_interval=DEFAULT_PERICOPE_HISTORY_DETAIL_TTL_SECONDS,
+            )
+        return _PERICOPE_HISTORY_DETAIL_CACHE
+
+
+def _reset_pericope_history_detail_cache() -> None:
+    global _PERICOPE_HISTORY_DETAIL_CACHE
+
+    with _PERICOPE_HISTORY_DETAIL_CACHE_LOCK:
+        _PERICOPE_HISTORY_DETAIL_CACHE = None
+
+
+def _fetch_pericope_history_details(
+    bearer: str,
+    user_id: str,
+    entries: list[tuple[str, str]],
+) -> tuple[dict[str, dict[str, Any]], int]:
+    """Fetch ``/history/{id}`` for each (session_id, last_active) pair concurrently.
+
+    At most ``SOLOMONIC_PERICOPE_HISTORY_WORKERS`` fetches run at once and the
+    whole fan-out stops at the deadline. Returns the details that arrived and
+    how many sessions were cut off by the deadline. Details are cached per user
+    until the session's ``last_active`` changes.
+    """
+    cache = _get_pericope_history_detail_cache()
+    ttl = _env_float(PERICOPE_HISTORY_DETAIL_TTL_SECONDS_ENV, DEFAULT_PERICOPE_HISTORY_DETAIL_TTL_SECONDS)
+    details: dict[str, dict[str, Any]] = {}
+    pending: list[tuple[str, str]] = []
+    for session_id, last_active in entries:
+        cached = cache.get(f"{user_id}\x00{session_id}\x00{last_active}")
+        if cached is not None:
+            details[session_id] = cached
         else:
-            clients = store.setdefault("clients", {})
-            client_record = clients.get(actor["id"])
-            key_hash = _hash_history_key(str(actor.get("client_key", "") or "").strip())
-
-            if client_record is None:
-                merged_state = client_state
-                clients[actor["id"]] = {
-                    "key_hash": key_hash,
-                    "created_at": now_iso,
-                    "updated_at": now_iso,
-                    "state": merged_state,
-                }
-            else:
-                if not hmac.compare_digest(str(client_record.get("key_hash", "")), key_hash):
-                    return None, "Invalid history key.", HTTPStatus.FORBIDDEN
+            pending.append((session_id, last_active))
 
-                merged_state = _merge_history_states(client_record.get("state") or {}, client_state)
-                client_record["updated_at"] = now_iso
-                client_record["state"] = merged_state
+    deadline = time.monotonic() + max(0, _env_int(PERICOPE_HISTORY_DEADLINE_MS_ENV, DEFAULT_PERICOPE_HISTORY_DEADLINE_MS)) / 1000.0
+    workers = max(1, _env_int(PERICOPE_HISTORY_WORKERS_ENV, DEFAULT_PERICOPE_HISTORY_WORKERS))
 
-        _write_history_store(store)
+    def fetch(session_id: str, last_active: str) -> dict[str, Any]:
+        detail = _fetch_pericope_json(
+            f"/history/{session_id}",
+            bearer,
+            timeout=max(0.5, min(6.0, deadline - time.monotonic())),
+        )
+        if ttl > 0:
+            cache.set(f"{user_id}\x00{session_id}\x00{last_active}", detail, ttl)
+        return detail
+
+    executor = _get_upstream_executor()
+    backlog = list(pending)
+    in_flight: dict[Future, str] = {}
+    while backlog or in_flight:
+        while backlog and len(in_flight) < workers:
+            session_id, last_active = backlog.pop(0)
+            in_flight[executor.submit(fetch, session_id, last_active)] = session_id
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, _not_done = wait(list(in_flight), timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            session_id = in_flight.pop(future)
+            try:
+                details[session_id] = future.result()
+            except ValueError:
+                continue
 
-    response = {
-        "service": "solomonic_clock",
-        "state": merged_state,
-        "stored_entries": len(merged_state),
-        "synced_at": now_iso,
-    }
-    response.update(_build_history_actor_payload(actor))
-    return response, None, HTTPStatus.OK
+    # Late fetches still land in the cache for the next request.
+    return details, len(backlog) + len(in_flight)
 
 
 def _build_pericope_history_sessions_payload(
@@ -4411,18 +8417,25 @@ def _build_pericope_history_sessions_payload(
     if not isinstance(raw_sessions, list):
         raw_sessions = []
 
-    sessions: list[dict[str, Any]] = []
-    pericope_base_url = _resolve_pericope_web_base_url().rstrip("/")
+    listed: list[tuple[str, dict[str, Any]]] = []
     for raw in raw_sessions:
         if not isinstance(raw, dict):
             continue
         session_id = _to_snippet(str(raw.get("session_id", "")).strip(), 64)
-        if not session_id:
-            continue
+        if session_id:
+            listed.append((session_id, raw))
 
-        try:
-            detail = _fetch_pericope_json(f"/history/{session_id}", bearer)
-        except ValueError:
+    details, timed_out = _fetch_pericope_history_details(
+        bearer,
+        user_id,
+        [(session_id, str(raw.get("last_active", "")).strip()) for session_id, raw in listed],
+    )
+
+    sessions: list[dict[str, Any]] = []
+    pericope_base_url = _resolve_pericope_web_base_url().rstrip("/")
+    for session_id, raw in listed:
+        detail = details.get(session_id)
+        if detail is None:
             continue
 
         source = _to_snippet(str(detail.get("source", "")).strip(), 60)
@@ -4456,6 +8469,8 @@ def _build_pericope_history_sessions_payload(
         "pericope_api_base": _resolve_pericope_api_base_url(),
         "sessions": sessions,
         "count": len(sessions),
+        "partial": timed_out > 0,
+        "timed_out_sessions": timed_out,
         "fetched_at": datetime.utcnow().isoformat() + "Z",
     }, None, HTTPStatus.OK
 
@@ -4476,6 +8491,19 @@ def _extract_guided_prompts_supplied_key(headers: Any) -> str:
     return ""
 
 
+def _get_operator_expected_key() -> str:
+    return str(os.environ.get(OPERATOR_API_KEY_ENV) or "").strip()
+
+
+def _is_operator_request(headers: Any) -> bool:
+    """True when the request carries the configured operator key; never true while it is unset."""
+    expected_key = _get_operator_expected_key()
+    supplied_key = str(headers.get(OPERATOR_AUTH_HEADER, "") or "").strip()
+    if not expected_key or not supplied_key:
+        return False
+    return hmac.compare_digest(supplied_key, expected_key)
+
+
 class ClockRequestHandler(SimpleHTTPRequestHandler):
     """Serve static files and expose /api/clock with the JSON dataset."""
 
@@ -4545,6 +8573,82 @@ class ClockRequestHandler(SimpleHTTPRequestHandler):
         if send_body:
             self.wfile.write(body)
 
+    def _send_stream(self, stream: _UpstreamStream, default_content_type: str, send_body: bool = True) -> None:
+        """Relay an upstream (possibly 206 partial) response chunk by chunk."""
+        self.send_response(stream.status)
+        self.send_header("Content-Type", stream.headers.get("Content-Type") or default_content_type)
+        for name in STREAM_PASSTHROUGH_HEADERS:
+            value = stream.headers.get(name)
+            if value:
+                self.send_header(name, value)
+        self.end_headers()
+        if not send_body:
+            stream.close()
+            return
+
+        chunk_size = max(1024, _env_int(STREAM_CHUNK_BYTES_ENV, DEFAULT_STREAM_CHUNK_BYTES))
+        try:
+            for chunk in stream.iter_chunks(chunk_size):
+                self.wfile.write(chunk)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # The listener seeked or went away; the upstream connection is dropped on close.
+            self.close_connection = True
+        except (OSError, HTTPException):
+            # Headers are already sent, so an upstream failure can only end the response early.
+            self.close_connection = True
+
+    def _send_file_range(self, path: Path, content_type: str, send_body: bool = True) -> None:
+        """Serve a local file, honouring a single ``bytes=`` Range so players can seek."""
+        try:
+            handle = path.open("rb")
+        except OSError:
+            self._send_json({"error": "File not found."}, HTTPStatus.NOT_FOUND, send_body=send_body)
+            return
+
+        with handle:
+            size = os.fstat(handle.fileno()).st_size
+            start, end = 0, size - 1
+            status = HTTPStatus.OK
+            match = re.fullmatch(r"bytes=(\d*)-(\d*)", (self.headers.get("Range") or "").strip())
+            if match and (match.group(1) or match.group(2)):
+                if match.group(1):
+                    start = int(match.group(1))
+                    end = min(size - 1, int(match.group(2))) if match.group(2) else size - 1
+                else:
+                    start = max(0, size - int(match.group(2)))
+                if start >= size or start > end:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status = HTTPStatus.PARTIAL_CONTENT
+
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(max(0, end - start + 1)))
+            if status == HTTPStatus.PARTIAL_CONTENT:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            self.send_header("Cache-Control", "public, max-age=86400, immutable")
+            self.end_headers()
+            if not send_body:
+                return
+
+            handle.seek(start)
+            remaining = end - start + 1
+            chunk_size = max(1024, _env_int(STREAM_CHUNK_BYTES_ENV, DEFAULT_STREAM_CHUNK_BYTES))
+            try:
+                while remaining > 0:
+                    chunk = handle.read(min(chunk_size, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True
+
     def _resolve_site_url(self) -> str:
         configured = os.environ.get(SITE_URL_ENV, "").strip()
         if configured:
@@ -4655,6 +8759,22 @@ class ClockRequestHandler(SimpleHTTPRequestHandler):
 
         return True, HTTPStatus.OK, None
 
+    def _authorize_operator_request(self) -> tuple[bool, HTTPStatus, str | None]:
+        if not _get_operator_expected_key():
+            return (
+                False,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                f"Operator diagnostics are not configured. Set {OPERATOR_API_KEY_ENV}.",
+            )
+
+        if not str(self.headers.get(OPERATOR_AUTH_HEADER, "") or "").strip():
+            return False, HTTPStatus.UNAUTHORIZED, f"Missing operator key. Supply {OPERATOR_AUTH_HEADER}."
+
+        if not _is_operator_request(self.headers):
+            return False, HTTPStatus.FORBIDDEN, "Invalid operator key."
+
+        return True, HTTPStatus.OK, None
+
     def do_POST(self) -> None:  # noqa: N802
         parsed_url = urlparse(self.path)
         request_path = parsed_url.path.rstrip("/")
@@ -4793,7 +8913,19 @@ class ClockRequestHandler(SimpleHTTPRequestHandler):
             return True
 
         if normalized_path == VIBEVOICE_HEALTH_API_PATH:
-            self._send_json(_build_vibevoice_health_payload(), HTTPStatus.OK, send_body=send_body)
+            self._send_json(
+                _build_vibevoice_health_payload(detailed=_is_operator_request(self.headers)),
+                HTTPStatus.OK,
+                send_body=send_body,
+            )
+            return True
+
+        if normalized_path == UPSTREAM_STATUS_API_PATH:
+            self._send_json(
+                _build_upstream_status_payload(detailed=_is_operator_request(self.headers)),
+                HTTPStatus.OK,
+                send_body=send_body,
+            )
             return True
 
         if normalized_path == "/api/psalm":
@@ -4982,7 +9114,7 @@ class ClockRequestHandler(SimpleHTTPRequestHandler):
 
         if normalized_path.startswith(f"{VIBEVOICE_TTS_JOBS_API_PATH}/"):
             job_id = normalized_path.removeprefix(f"{VIBEVOICE_TTS_JOBS_API_PATH}/")
-            response_payload, error, status = _build_vibevoice_job_status_payload(job_id)
+            response_payload, error, status = _build_tracked_vibevoice_job_payload(job_id, parse_qs(parsed_url.query))
             if response_payload is None:
                 self._send_json({"error": error or "Unable to load VibeVoice audio job."}, status, send_body=send_body)
                 return True
@@ -4990,6 +9122,20 @@ class ClockRequestHandler(SimpleHTTPRequestHandler):
             self._send_json(response_payload, status, send_body=send_body)
             return True
 
+        if normalized_path.startswith(f"{VIBEVOICE_CACHED_AUDIO_API_PATH}/"):
+            cache_key = normalized_path.removeprefix(f"{VIBEVOICE_CACHED_AUDIO_API_PATH}/")
+            try:
+                cache = _get_vibevoice_audio_cache()
+                entry = cache.get(cache_key) if cache is not None and re.fullmatch(r"[0-9a-f]{64}", cache_key) else None
+            except (OSError, sqlite3.Error):
+                entry = None
+            if entry is None:
+                self._send_json({"error": "Cached VibeVoice audio not found."}, HTTPStatus.NOT_FOUND, send_body=send_body)
+                return True
+
+            self._send_file_range(entry["path"], entry["content_type"], send_body=send_body)
+            return True
+
         if normalized_path == VIBEVOICE_AUDIO_API_PATH:
             query = parse_qs(parsed_url.query)
             audio_url = unquote((query.get("url") or [""])[0]).strip()
@@ -4997,9 +9143,25 @@ class ClockRequestHandler(SimpleHTTPRequestHandler):
                 self._send_json({"error": "Invalid VibeVoice audio URL."}, HTTPStatus.BAD_REQUEST, send_body=send_body)
                 return True
 
+            range_headers = {
+                name: value
+                for name in ("Range", "If-Range")
+                if (value := (self.headers.get(name) or "").strip())
+            }
             try:
-                audio_body, content_type = _fetch_vibevoice_audio(audio_url)
+                audio_stream = _open_vibevoice_audio_stream(
+                    audio_url,
+                    method="GET" if send_body else "HEAD",
+                    range_headers=range_headers,
+                )
             except HTTPError as exc:
+                if exc.code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    if exc.headers.get("Content-Range"):
+                        self.send_header("Content-Range", exc.headers["Content-Range"])
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return True
                 detail = exc.read().decode("utf-8", errors="replace").strip()
                 self._send_json(
                     {"error": f"VibeVoice audio download failed ({exc.code}){f': {detail}' if detail else ''}."},
@@ -5026,11 +9188,70 @@ class ClockRequestHandler(SimpleHTTPRequestHandler):
                 )
                 return True
 
-            self._send_binary(audio_body, HTTPStatus.OK, content_type, send_body=send_body)
+            try:
+                self._send_stream(audio_stream, "audio/wav", send_body=send_body)
+            finally:
+                audio_stream.close()
+            return True
+
+        if normalized_path == CLIENT_ERRORS_API_PATH:
+            authorized, status, error = self._authorize_operator_request()
+            if not authorized:
+                self._send_json({"error": error}, status, send_body=send_body)
+                return True
+
+            self._send_json(_build_client_error_stats_payload(), HTTPStatus.OK, send_body=send_body)
+            return True
+
+        if normalized_path == CLIENT_ERRORS_TOP_API_PATH:
+            authorized, status, error = self._authorize_operator_request()
+            if not authorized:
+                self._send_json({"error": error}, status, send_body=send_body)
+                return True
+
+            response_payload, error, status = _build_client_error_top_payload(parse_qs(parsed_url.query))
+            if response_payload is None:
+                self._send_json({"error": error or "Unable to load client error fingerprints."}, status, send_body=send_body)
+                return True
+
+            self._send_json(response_payload, status, send_body=send_body)
+            return True
+
+        if normalized_path == SOURCES_API_PATH:
+            response_payload, error, status = _build_sources_payload()
+            if response_payload is None:
+                self._send_json({"error": error or "Unable to load source texts."}, status, send_body=send_body)
+                return True
+
+            self._send_json(response_payload, status, send_body=send_body)
+            return True
+
+        if normalized_path == SOURCE_SEARCH_API_PATH:
+            response_payload, error, status = _build_source_search_payload(parse_qs(parsed_url.query))
+            if response_payload is None:
+                self._send_json({"error": error or "Unable to search source texts."}, status, send_body=send_body)
+                return True
+
+            self._send_json(response_payload, status, send_body=send_body)
+            return True
+
+        if normalized_path.startswith(f"{SOURCES_API_PATH}/"):
+            response_payload, error, status = _build_source_resource_payload(
+                normalized_path.removeprefix(f"{SOURCES_API_PATH}/"),
+                parse_qs(parsed_url.query),
+            )
+            if response_payload is None:
+                self._send_json({"error": error or "Unable to load source texts."}, status, send_body=send_body)
+                return True
+
+            self._send_json(response_payload, status, send_body=send_body)
             return True
 
         if normalized_path == HISTORY_SYNC_API_PATH:
-            response_payload, error, status = _build_history_sync_get_payload(self.headers)
+            response_payload, error, status = _build_history_sync_get_payload(
+                self.headers,
+                parse_qs(parsed_url.query),
+            )
             if response_payload is None:
                 self._send_json({"error": error or "Unable to load history state."}, status, send_body=send_body)
                 return True
@@ -5086,11 +9307,21 @@ def main() -> None:
     source_mode = _resolve_psalm_source_mode()
     numbering_mode = _resolve_psalm_lookup_numbering()
     handler = partial(ClockRequestHandler, directory=args.root)
+    _start_psalm_lookup_refresher()
+    _start_tts_presynthesis_scheduler()
+    _start_vibevoice_health_monitor()
+    _seed_client_error_totals()
+    # Load the source texts table and search dictionary before the first request needs them.
+    _get_source_text_store()
+    _get_source_search_index()
     server = ThreadingHTTPServer((args.host, args.port), handler)
     print(f"Serving {args.root} on http://{args.host}:{args.port}")
     print("• Static assets are available directly (e.g. /web/clock_visualizer.html)")
     print("• Dataset endpoint: /api/clock")
     print(f"• Clock runtime endpoint: {CLOCK_RUNTIME_API_PATH}")
+    print(f"• Upstream status endpoint: {UPSTREAM_STATUS_API_PATH}")
+    print(f"• Source texts endpoints: {SOURCES_API_PATH}, {SOURCES_API_PATH}/<source_id>, {SOURCES_API_PATH}/<source_id>/sections/<section_id>")
+    print(f"• Source search endpoint: {SOURCE_SEARCH_API_PATH}")
     print("• Clock context endpoint: /api/clock/context")
     print("• Clock content bundle endpoint: /api/clock/content-bundle")
     print("• Clock wisdom anchor endpoint: /api/clock/wisdom-anchor")
@@ -5106,6 +9337,7 @@ def main() -> None:
         print("\nShutting down server.")
     finally:
         server.server_close()
+        _flush_client_error_log()
 
 
 if __name__ == "__main__":
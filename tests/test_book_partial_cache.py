@@ -0,0 +1,102 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src import webserver
+
+
+def _target(start: int = 1) -> webserver.BookPartialTarget:
+    return webserver.BookPartialTarget(
+        author_slug="solomon",
+        book="Proverbs",
+        source="Proverbs.txt",
+        start_position=start,
+        end_position=start + 1,
+        chapter="1",
+        reference="Proverbs 1",
+    )
+
+
+class BookPartialCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp.name) / "book_partial_cache.sqlite3"
+        self.env = patch.dict(
+            os.environ,
+            {webserver.BOOK_PARTIAL_CACHE_PATH_ENV: str(self.cache_path)},
+            clear=False,
+        )
+        self.env.start()
+        webserver._RESPONSE_CACHES.clear()
+
+    def tearDown(self) -> None:
+        self.env.stop()
+        webserver._RESPONSE_CACHES.clear()
+        self.tmp.cleanup()
+
+    def test_second_request_is_served_from_disk_even_after_restart(self) -> None:
+        with patch(
+            "src.webserver._fetch_book_partial_from_pericope",
+            return_value=({"content": "My son, hear", "resolved_via": "pericope"}, None),
+        ) as upstream:
+            first, _error = webserver._fetch_book_partial_cached(_target())
+            webserver._RESPONSE_CACHES.clear()  # simulate a process restart
+            second, _error = webserver._fetch_book_partial_cached(_target())
+
+        self.assertEqual(upstream.call_count, 1)
+        self.assertEqual(first["cache_status"], "miss")
+        self.assertEqual(second["cache_status"], "hit")
+        self.assertEqual(second["content"], "My son, hear")
+        self.assertTrue(self.cache_path.exists())
+
+    def test_stale_entry_is_served_while_refreshing_in_background(self) -> None:
+        cache = webserver._get_book_partial_cache()
+        key = webserver._book_partial_cache_key(_target())
+        cache.put(key, {"content": "old text"})
+
+        with (
+            patch.dict(os.environ, {webserver.BOOK_PARTIAL_CACHE_TTL_SECONDS_ENV: "-1"}, clear=False),
+            patch(
+                "src.webserver._fetch_book_partial_from_pericope",
+                return_value=({"content": "new text"}, None),
+            ),
+        ):
+            payload, error = webserver._fetch_book_partial_cached(_target())
+            self.assertIsNone(error)
+            self.assertEqual(payload["cache_status"], "stale")
+            self.assertEqual(payload["content"], "old text")
+
+            deadline = time.monotonic() + 5
+            while key in webserver._BOOK_PARTIAL_REVALIDATING and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        refreshed, _age = cache.get(key)
+        self.assertEqual(refreshed["content"], "new text")
+
+    def test_size_bound_evicts_least_recently_used_entries(self) -> None:
+        cache = webserver._SqliteResponseCache(Path(self.tmp.name) / "lru.sqlite3", max_bytes=120)
+        cache.put("a", {"content": "a" * 40})
+        time.sleep(0.01)
+        cache.put("b", {"content": "b" * 40})
+        time.sleep(0.01)
+        cache.get("a")  # touch a so b becomes least recently used
+        time.sleep(0.01)
+        cache.put("c", {"content": "c" * 40})
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertLessEqual(cache.stats()["bytes"], 120)
+
+    def test_distinct_position_windows_use_distinct_keys(self) -> None:
+        self.assertNotEqual(
+            webserver._book_partial_cache_key(_target(1)),
+            webserver._book_partial_cache_key(_target(5)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from urllib.error import URLError
+
+from src import webserver
+
+
+PRIMARY_URL = "http://primary.invalid/v1/book_partial"
+SECONDARY_URL = "http://secondary.invalid/v1/book_partial"
+
+
+def _target() -> webserver.BookPartialTarget:
+    return webserver.BookPartialTarget(
+        author_slug="solomon",
+        book="Proverbs",
+        source="Proverbs.txt",
+        start_position=1,
+        end_position=2,
+        chapter="1",
+        reference="Proverbs 1",
+    )
+
+
+class BookPartialHedgingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        webserver._reset_upstream_breakers()
+        self.release_primary = threading.Event()
+        self.resolved = patch.dict(webserver._BOOK_PARTIAL_RESOLVED, clear=True)
+        self.resolved.start()
+
+    def tearDown(self) -> None:
+        self.release_primary.set()
+        self.resolved.stop()
+        webserver._reset_upstream_breakers()
+
+    def _fake_post(self, url: str, payload: dict) -> dict:
+        if url == PRIMARY_URL:
+            self.release_primary.wait(5)
+            return {"content": "primary text"}
+        return {"content": "secondary text"}
+
+    def _fetch(self, env: dict[str, str]) -> tuple[dict | None, str | None, float]:
+        with (
+            patch.dict(os.environ, env, clear=False),
+            patch("src.webserver._resolve_pericope_book_partial_urls", return_value=[PRIMARY_URL, SECONDARY_URL]),
+            patch("src.webserver._post_pericope_book_partial", side_effect=self._fake_post),
+        ):
+            started = time.monotonic()
+            payload, error = webserver._fetch_book_partial_from_pericope(_target())
+            return payload, error, time.monotonic() - started
+
+    def test_hedged_mode_fires_secondary_after_delay_and_takes_first_success(self) -> None:
+        payload, error, elapsed = self._fetch(
+            {
+                webserver.PERICOPE_HEDGE_MODE_ENV: "hedged",
+                webserver.PERICOPE_HEDGE_DELAY_MS_ENV: "50",
+            }
+        )
+
+        self.assertIsNone(error)
+        self.assertEqual(payload["content"], "secondary text")
+        self.assertEqual(webserver._build_book_partial_resolved_stats(), {SECONDARY_URL: 1})
+        self.assertNotIn("resolved_upstream", payload)
+        self.assertEqual(payload["hedge_mode"], "hedged")
+        self.assertLess(elapsed, 2.0)
+
+    def test_parallel_mode_uses_first_valid_response(self) -> None:
+        payload, error, elapsed = self._fetch({webserver.PERICOPE_HEDGE_MODE_ENV: "parallel"})
+
+        self.assertIsNone(error)
+        self.assertEqual(payload["content"], "secondary text")
+        self.assertEqual(webserver._build_book_partial_resolved_stats(), {SECONDARY_URL: 1})
+        self.assertLess(elapsed, 2.0)
+
+    def test_hedged_mode_launches_next_url_immediately_after_failure(self) -> None:
+        calls: list[str] = []
+
+        def failing_primary(url: str, payload: dict) -> dict:
+            calls.append(url)
+            if url == PRIMARY_URL:
+                raise URLError("connection refused")
+            return {"content": "secondary text"}
+
+        with (
+            patch.dict(
+                os.environ,
+                {webserver.PERICOPE_HEDGE_MODE_ENV: "hedged", webserver.PERICOPE_HEDGE_DELAY_MS_ENV: "5000"},
+                clear=False,
+            ),
+            patch("src.webserver._resolve_pericope_book_partial_urls", return_value=[PRIMARY_URL, SECONDARY_URL]),
+            patch("src.webserver._post_pericope_book_partial", side_effect=failing_primary),
+        ):
+            started = time.monotonic()
+            payload, error = webserver._fetch_book_partial_from_pericope(_target())
+            elapsed = time.monotonic() - started
+
+        self.assertIsNone(error)
+        self.assertEqual(payload["content"], "secondary text")
+        self.assertEqual(calls, [PRIMARY_URL, SECONDARY_URL])
+        self.assertLess(elapsed, 2.0)
+
+    def test_default_mode_stays_sequential(self) -> None:
+        self.release_primary.set()
+        payload, error, _elapsed = self._fetch({webserver.PERICOPE_HEDGE_MODE_ENV: "off"})
+
+        self.assertIsNone(error)
+        self.assertEqual(webserver._build_book_partial_resolved_stats(), {PRIMARY_URL: 1})
+        self.assertNotIn(PRIMARY_URL, repr(payload))
+        self.assertNotIn("hedge_mode", payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
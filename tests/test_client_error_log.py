@@ -0,0 +1,218 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from functools import partial
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from src import webserver
+
+
+class ClientErrorLogWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "client_errors.jsonl"
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.CLIENT_ERRORS_STORE_PATH_ENV: str(self.path),
+                webserver.CLIENT_ERRORS_FLUSH_MS_ENV: "20",
+            },
+            clear=False,
+        )
+        self.env.start()
+        self.stdout = patch("builtins.print")
+        self.stdout.start()
+        webserver._reset_client_error_writer()
+
+    def tearDown(self) -> None:
+        webserver._reset_client_error_writer()
+        self.stdout.stop()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def _lines(self, path: Path | None = None) -> list[dict]:
+        return [json.loads(line) for line in (path or self.path).read_text(encoding="utf-8").splitlines()]
+
+    def test_events_are_written_in_batches_off_the_request_thread(self) -> None:
+        for index in range(50):
+            payload, error, status = webserver._build_client_error_post_payload(
+                {"kind": "history_sync_get_http_error", "message": f"failure {index}"}
+            )
+            self.assertEqual(status, webserver.HTTPStatus.ACCEPTED)
+            self.assertTrue(payload["event"]["queued"])
+
+        self.assertTrue(webserver._flush_client_error_log())
+
+        self.assertEqual([line["message"] for line in self._lines()], [f"failure {index}" for index in range(50)])
+        stats = webserver._build_client_error_stats_payload()["log"]
+        self.assertEqual(stats["written"], 50)
+        self.assertLess(stats["batches"], 50)
+
+    def test_full_queue_drops_and_pressure_samples_with_counters(self) -> None:
+        release = threading.Event()
+        writer = webserver._ClientErrorLogWriter(
+            queue_size=8,
+            batch_size=1,
+            flush_interval=0,
+            max_bytes=1 << 20,
+            keep_files=2,
+        )
+        original_write = writer._write_batch
+
+        def blocked_write(batch):
+            release.wait(5)
+            original_write(batch)
+
+        writer._write_batch = blocked_write
+        self.assertTrue(writer.submit({"kind": "boom", "severity": "error"}))
+        deadline = time.monotonic() + 5
+        while writer.stats()["queued"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # The writer thread holds the first event; eight fill the queue and the rest are dropped.
+        results = [writer.submit({"kind": "boom", "severity": "error"}) for _ in range(11)]
+        # Under pressure nine of every ten warnings are sampled out; the tenth hits the full queue.
+        warn_results = [writer.submit({"kind": "slow", "severity": "warn"}) for _ in range(10)]
+        release.set()
+        self.assertTrue(writer.flush())
+
+        stats = writer.stats()
+        self.assertEqual(results.count(True), 8)
+        self.assertEqual(warn_results.count(True), 0)
+        self.assertEqual(stats["sampled_out"], 9)
+        self.assertEqual(stats["dropped"], 4)
+        self.assertEqual(stats["written"], 9)
+
+    def test_log_rotates_by_size_and_keeps_a_bounded_number_of_files(self) -> None:
+        writer = webserver._ClientErrorLogWriter(
+            queue_size=64,
+            batch_size=1,
+            flush_interval=0,
+            max_bytes=200,
+            keep_files=2,
+        )
+        for index in range(12):
+            writer.submit({"kind": "boom", "severity": "error", "message": "x" * 60 + str(index)})
+            self.assertTrue(writer.flush())
+
+        rotated = sorted(self.path.parent.glob("client_errors.jsonl.*"))
+        self.assertEqual(len(rotated), 2)
+        self.assertGreaterEqual(writer.stats()["rotations"], 4)
+        self.assertLessEqual(self.path.stat().st_size, 200)
+
+    def test_log_rotates_when_the_day_changes(self) -> None:
+        self.path.write_text('{"kind": "yesterday"}\n', encoding="utf-8")
+        yesterday = self.path.stat().st_mtime - 2 * 24 * 60 * 60
+        os.utime(self.path, (yesterday, yesterday))
+
+        webserver._append_client_error_event({"kind": "today"})
+        webserver._flush_client_error_log()
+
+        self.assertEqual([line["kind"] for line in self._lines()], ["today"])
+        (rotated,) = self.path.parent.glob("client_errors.jsonl.*")
+        self.assertEqual([line["kind"] for line in self._lines(rotated)], ["yesterday"])
+
+    def test_identical_events_are_aggregated_into_one_record(self) -> None:
+        for _ in range(5):
+            webserver._append_client_error_event(
+                {"kind": "book_partial_http_error", "endpoint": "/api/book-partial", "requestedReference": "Sir 1", "message": "502"}
+            )
+        webserver._append_client_error_event({"kind": "book_partial_http_error", "endpoint": "/api/book-partial", "message": "timeout"})
+        self.assertTrue(webserver._flush_client_error_log())
+
+        records = {line["message"]: line for line in self._lines()}
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records["502"]["count"], 5)
+        self.assertEqual(records["timeout"]["count"], 1)
+        self.assertLessEqual(records["502"]["firstSeen"], records["502"]["lastSeen"])
+        self.assertNotEqual(records["502"]["fingerprint"], records["timeout"]["fingerprint"])
+        stats = webserver._build_client_error_stats_payload()["log"]
+        self.assertEqual(stats["written"], 6)
+        self.assertEqual(stats["records"], 2)
+
+    def test_aggregate_window_closes_without_an_explicit_flush(self) -> None:
+        writer = webserver._ClientErrorLogWriter(
+            queue_size=64,
+            batch_size=16,
+            flush_interval=0,
+            max_bytes=1 << 20,
+            keep_files=2,
+            aggregate_seconds=0.05,
+        )
+        for _ in range(3):
+            writer.submit({"kind": "boom", "severity": "error", "message": "same"})
+        deadline = time.monotonic() + 5
+        while writer.stats()["records"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        (record,) = self._lines()
+        self.assertEqual(record["count"], 3)
+        self.assertEqual(writer.stats()["open_aggregates"], 0)
+
+    def test_top_payload_ranks_fingerprints_by_count(self) -> None:
+        for message, repeats in (("rare", 1), ("common", 4), ("middle", 2)):
+            for _ in range(repeats):
+                webserver._append_client_error_event({"kind": "history_sync_get_http_error", "message": message})
+        webserver._flush_client_error_log()
+
+        payload, error, status = webserver._build_client_error_top_payload({"limit": ["2"]})
+
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        self.assertIsNone(error)
+        self.assertEqual([(row["message"], row["count"]) for row in payload["fingerprints"]], [("common", 4), ("middle", 2)])
+        self.assertTrue(payload["fingerprints"][0]["firstSeen"])
+
+        payload, error, status = webserver._build_client_error_top_payload({"limit": ["many"]})
+        self.assertIsNone(payload)
+        self.assertEqual(status, webserver.HTTPStatus.BAD_REQUEST)
+
+    def test_top_totals_are_seeded_from_the_log_after_a_restart(self) -> None:
+        for message, repeats in (("common", 3), ("rare", 1)):
+            for _ in range(repeats):
+                webserver._append_client_error_event({"kind": "history_sync_get_http_error", "message": message})
+        webserver._flush_client_error_log()
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("not json\n")
+        webserver._reset_client_error_writer()
+
+        self.assertEqual(webserver._seed_client_error_totals(), 2)
+        webserver._append_client_error_event({"kind": "history_sync_get_http_error", "message": "rare"})
+        webserver._flush_client_error_log()
+
+        payload, _error, _status = webserver._build_client_error_top_payload({})
+        self.assertEqual([(row["message"], row["count"]) for row in payload["fingerprints"]], [("common", 3), ("rare", 2)])
+
+    def _get_status(self, path: str, headers: dict[str, str]) -> int:
+        site = ThreadingHTTPServer(("127.0.0.1", 0), partial(webserver.ClockRequestHandler, directory=self.tmpdir.name))
+        site.daemon_threads = True
+        threading.Thread(target=site.serve_forever, daemon=True).start()
+        self.addCleanup(site.server_close)
+        self.addCleanup(site.shutdown)
+        connection = HTTPConnection("127.0.0.1", site.server_address[1], timeout=10)
+        self.addCleanup(connection.close)
+        with patch.object(webserver.ClockRequestHandler, "log_message"):
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+
+    def test_stats_endpoints_require_the_operator_key(self) -> None:
+        with patch.dict(os.environ, {webserver.OPERATOR_API_KEY_ENV: ""}, clear=False):
+            self.assertEqual(self._get_status("/api/client-errors", {webserver.OPERATOR_AUTH_HEADER: "guess"}), 503)
+
+        with patch.dict(os.environ, {webserver.OPERATOR_API_KEY_ENV: "ops-secret"}, clear=False):
+            self.assertEqual(self._get_status("/api/client-errors", {}), 401)
+            self.assertEqual(self._get_status("/api/client-errors", {webserver.OPERATOR_AUTH_HEADER: "guess"}), 403)
+            self.assertEqual(self._get_status("/api/client-errors", {webserver.OPERATOR_AUTH_HEADER: "ops-secret"}), 200)
+            self.assertEqual(self._get_status("/api/client-errors/top", {}), 401)
+            self.assertEqual(self._get_status("/api/client-errors/top", {webserver.OPERATOR_AUTH_HEADER: "ops-secret"}), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src import webserver
+
+
+HEADERS = {
+    webserver.HISTORY_CLIENT_HEADER: "guest-client-delta-0123456789",
+    webserver.HISTORY_KEY_HEADER: "guest-key-delta-0123456789abcdef",
+}
+
+
+class HistoryDeltaSyncTests(unittest.TestCase):
+    backend = "sqlite"
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.HISTORY_STORE_PATH_ENV: str(Path(self.tmpdir.name) / "history_store.json"),
+                webserver.HISTORY_STORE_BACKEND_ENV: self.backend,
+            },
+            clear=False,
+        )
+        self.env.start()
+        os.environ.pop(webserver.HISTORY_DB_PATH_ENV, None)
+        webserver._HISTORY_STORES.clear()
+
+    def tearDown(self) -> None:
+        webserver._HISTORY_STORES.clear()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def _post(self, body: dict) -> dict:
+        payload, error, status = webserver._build_history_sync_post_payload(HEADERS, body)
+        self.assertIsNone(error)
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        return payload
+
+    def _seed(self, days: int = 30) -> dict:
+        state = {f"2026-09-{day:02d}": {"reflection": f"Day {day}"} for day in range(1, days + 1)}
+        return self._post({"cursor": None, "changes": state})
+
+    def test_first_delta_sync_resets_and_returns_a_cursor(self) -> None:
+        payload = self._seed()
+
+        self.assertEqual(payload["protocol"], "delta-v1")
+        self.assertTrue(payload["reset"])
+        self.assertEqual(len(payload["changes"]), 30)
+        self.assertEqual(payload["cursor"], 1)
+
+    def test_delta_sync_only_returns_entries_changed_since_the_cursor(self) -> None:
+        cursor = self._seed()["cursor"]
+
+        # Another device edits one day.
+        other = self._post({"cursor": cursor, "changes": {"2026-09-05": {"reflection": "Edited elsewhere"}}})
+        self.assertEqual(other["changes"], {})
+
+        # This device sends one new day and receives only the other device's edit.
+        payload = self._post({"cursor": cursor, "changes": {"2026-10-01": {"reflection": "New day"}}})
+
+        self.assertFalse(payload["reset"])
+        self.assertEqual(list(payload["changes"]), ["2026-09-05"])
+        self.assertEqual(payload["changes"]["2026-09-05"]["reflection"], "Edited elsewhere")
+        self.assertEqual(payload["stored_entries"], 31)
+        self.assertEqual(payload["cursor"], cursor + 2)
+
+    def test_server_merge_result_is_returned_when_it_differs_from_what_was_sent(self) -> None:
+        cursor = self._seed()["cursor"]
+        self._post({"cursor": cursor, "changes": {"2026-09-02": {"reflection": "Newer", "updatedAt": "2026-09-03T00:00:00Z"}}})
+
+        payload = self._post(
+            {"cursor": cursor, "changes": {"2026-09-02": {"reflection": "Older", "updatedAt": "2026-09-02T00:00:00Z"}}}
+        )
+
+        self.assertEqual(payload["changes"]["2026-09-02"]["reflection"], "Newer")
+
+    def test_unchanged_resend_does_not_advance_the_cursor(self) -> None:
+        cursor = self._seed()["cursor"]
+
+        payload = self._post({"cursor": cursor, "changes": {"2026-09-01": {"reflection": "Day 1"}}})
+
+        self.assertEqual(payload["cursor"], cursor)
+        self.assertEqual(payload["changes"], {})
+
+    def test_get_with_cursor_and_stale_cursor(self) -> None:
+        cursor = self._seed()["cursor"]
+        self._post({"cursor": cursor, "changes": {"2026-09-07": {"reflection": "Changed"}}})
+
+        payload, _error, _status = webserver._build_history_sync_get_payload(HEADERS, {"cursor": [str(cursor)]})
+        self.assertEqual(list(payload["changes"]), ["2026-09-07"])
+
+        payload, _error, _status = webserver._build_history_sync_get_payload(HEADERS, {"cursor": ["999"]})
+        self.assertTrue(payload["reset"])
+        self.assertEqual(len(payload["changes"]), 30)
+
+    def test_full_state_sync_still_works_and_reports_a_cursor(self) -> None:
+        self._seed()
+
+        payload = self._post({"state": {"2026-10-02": {"reflection": "Legacy client"}}})
+
+        self.assertEqual(len(payload["state"]), 31)
+        self.assertEqual(payload["cursor"], 2)
+
+    def test_databases_from_before_the_delta_protocol_are_upgraded(self) -> None:
+        if self.backend != "sqlite":
+            self.skipTest("schema upgrade only applies to the SQLite backend")
+        db_path = webserver._resolve_history_db_path()
+        with sqlite3.connect(db_path) as connection:
+            connection.execute(
+                "CREATE TABLE history_actors (kind TEXT NOT NULL, actor_id TEXT NOT NULL, key_hash TEXT,"
+                " profile TEXT, created_at TEXT NOT NULL, updated_at TEXT NOT NULL, PRIMARY KEY (kind, actor_id))"
+            )
+            connection.execute(
+                "CREATE TABLE history_entries (kind TEXT NOT NULL, actor_id TEXT NOT NULL, date_key TEXT NOT NULL,"
+                " entry TEXT NOT NULL, PRIMARY KEY (kind, actor_id, date_key))"
+            )
+
+        payload = self._seed(days=3)
+
+        self.assertEqual(payload["cursor"], 1)
+
+
+class ShardedHistoryDeltaSyncTests(HistoryDeltaSyncTests):
+    backend = "sharded"
+
+
+if __name__ == "__main__":
+    unittest.main()
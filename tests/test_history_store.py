@@ -0,0 +1,201 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src import webserver
+
+
+CLIENT_ID = "guest-client-0123456789"
+CLIENT_KEY = "guest-key-0123456789abcdef"
+
+
+def _guest_headers(client_id: str = CLIENT_ID, client_key: str = CLIENT_KEY) -> dict[str, str]:
+    return {
+        webserver.HISTORY_CLIENT_HEADER: client_id,
+        webserver.HISTORY_KEY_HEADER: client_key,
+    }
+
+
+class _HistoryStoreContract:
+    backend = ""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.json_path = Path(self.tmpdir.name) / "history_store.json"
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.HISTORY_STORE_PATH_ENV: str(self.json_path),
+                webserver.HISTORY_STORE_BACKEND_ENV: self.backend,
+            },
+            clear=False,
+        )
+        self.env.start()
+        os.environ.pop(webserver.HISTORY_DB_PATH_ENV, None)
+        os.environ.pop(webserver.HISTORY_SHARD_DIR_ENV, None)
+        webserver._HISTORY_STORES.clear()
+
+    def tearDown(self) -> None:
+        webserver._HISTORY_STORES.clear()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def _sync(self, state: dict, headers: dict | None = None):
+        return webserver._build_history_sync_post_payload(headers or _guest_headers(), {"state": state})
+
+    def test_legacy_json_store_is_migrated_once(self) -> None:
+        self.json_path.write_text(
+            json.dumps(
+                {
+                    "clients": {
+                        CLIENT_ID: {
+                            "key_hash": webserver._hash_history_key(CLIENT_KEY),
+                            "created_at": "2026-01-01T00:00:00Z",
+                            "updated_at": "2026-01-02T00:00:00Z",
+                            "state": {"2026-01-02": {"reflection": "Migrated day", "updatedAt": "2026-01-02T08:00:00Z"}},
+                        }
+                    },
+                    "users": {},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        payload, error, status = webserver._build_history_sync_get_payload(_guest_headers())
+
+        self.assertIsNone(error)
+        self.assertEqual(payload["state"]["2026-01-02"]["reflection"], "Migrated day")
+        self.assertEqual(payload["synced_at"], "2026-01-02T00:00:00Z")
+
+        # Rewriting the JSON afterwards must not re-import it over newer rows.
+        self._sync({"2026-01-02": {"reflection": "Edited", "updatedAt": "2026-01-03T08:00:00Z"}})
+        webserver._HISTORY_STORES.clear()
+        payload, _error, _status = webserver._build_history_sync_get_payload(_guest_headers())
+        self.assertEqual(payload["state"]["2026-01-02"]["reflection"], "Edited")
+
+    def test_corrupt_legacy_json_store_is_retried_on_next_start(self) -> None:
+        legacy = {
+            "clients": {
+                CLIENT_ID: {
+                    "key_hash": webserver._hash_history_key(CLIENT_KEY),
+                    "created_at": "2026-01-01T00:00:00Z",
+                    "updated_at": "2026-01-02T00:00:00Z",
+                    "state": {"2026-01-02": {"reflection": "Migrated day", "updatedAt": "2026-01-02T08:00:00Z"}},
+                }
+            },
+            "users": {},
+        }
+        self.json_path.write_text(json.dumps(legacy)[:40], encoding="utf-8")
+
+        with patch("builtins.print"):
+            webserver._build_history_sync_get_payload(_guest_headers())
+
+        # Once the half-written file is complete, the next start imports it.
+        self.json_path.write_text(json.dumps(legacy), encoding="utf-8")
+        webserver._HISTORY_STORES.clear()
+        payload, error, _status = webserver._build_history_sync_get_payload(_guest_headers())
+
+        self.assertIsNone(error)
+        self.assertEqual(payload["state"]["2026-01-02"]["reflection"], "Migrated day")
+
+    def test_wrong_client_key_is_rejected_without_writing(self) -> None:
+        self._sync({"2026-10-01": {"reflection": "Mine"}})
+
+        payload, error, status = self._sync(
+            {"2026-10-01": {"reflection": "Overwritten", "updatedAt": "2099-01-01T00:00:00Z"}},
+            _guest_headers(client_key="another-key-0123456789abcdef"),
+        )
+
+        self.assertIsNone(payload)
+        self.assertEqual(status, webserver.HTTPStatus.FORBIDDEN)
+        stored, _error, _status = webserver._build_history_sync_get_payload(_guest_headers())
+        self.assertEqual(stored["state"]["2026-10-01"]["reflection"], "Mine")
+
+    def test_concurrent_syncs_for_one_actor_do_not_lose_days(self) -> None:
+        errors: list = []
+
+        def sync(day: int) -> None:
+            _payload, error, _status = self._sync({f"2026-10-{day:02d}": {"reflection": f"Day {day}"}})
+            if error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=sync, args=(day,)) for day in range(1, 13)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(errors, [])
+        payload, _error, _status = webserver._build_history_sync_get_payload(_guest_headers())
+        self.assertEqual(payload["stored_entries"], 12)
+
+
+
+class SqliteHistoryStoreTests(_HistoryStoreContract, unittest.TestCase):
+    backend = "sqlite"
+
+    def test_sync_merges_and_only_rewrites_changed_days(self) -> None:
+        self._sync(
+            {
+                "2026-10-01": {"reflection": "One", "updatedAt": "2026-10-01T08:00:00Z"},
+                "2026-10-02": {"reflection": "Two", "updatedAt": "2026-10-02T08:00:00Z"},
+            }
+        )
+        db_path = webserver._resolve_history_db_path()
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("CREATE TABLE writes (date_key TEXT)")
+            connection.execute(
+                "CREATE TRIGGER track_writes AFTER INSERT ON history_entries"
+                " BEGIN INSERT INTO writes VALUES (NEW.date_key); END"
+            )
+
+        payload, error, status = self._sync({"2026-10-02": {"reflection": "Two, revised", "updatedAt": "2026-10-02T09:00:00Z"}})
+
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        self.assertEqual(sorted(payload["state"]), ["2026-10-01", "2026-10-02"])
+        self.assertEqual(payload["state"]["2026-10-02"]["reflection"], "Two, revised")
+        with sqlite3.connect(db_path) as connection:
+            written = [row[0] for row in connection.execute("SELECT date_key FROM writes")]
+        self.assertEqual(written, ["2026-10-02"])
+
+
+class ShardedHistoryStoreTests(_HistoryStoreContract, unittest.TestCase):
+    backend = "sharded"
+
+    def test_actor_files_are_written_per_shard(self) -> None:
+        self._sync({"2026-10-01": {"reflection": "One"}})
+
+        store = webserver._get_history_store()
+        _lock, path = store._locate("client", CLIENT_ID)
+        self.assertTrue(path.is_file())
+        self.assertEqual(json.loads(path.read_text(encoding="utf-8"))["state"]["2026-10-01"]["reflection"], "One")
+
+    def test_sync_in_another_shard_does_not_wait_on_a_held_shard(self) -> None:
+        store = webserver._get_history_store()
+        held_lock, _path = store._locate("client", CLIENT_ID)
+        other_id = next(
+            f"guest-client-other-{index:04d}"
+            for index in range(1000)
+            if store._locate("client", f"guest-client-other-{index:04d}")[0] is not held_lock
+        )
+
+        finished = threading.Event()
+
+        def sync_other() -> None:
+            self._sync({"2026-10-01": {"reflection": "Other"}}, _guest_headers(client_id=other_id))
+            finished.set()
+
+        with held_lock:
+            worker = threading.Thread(target=sync_other)
+            worker.start()
+            self.assertTrue(finished.wait(5))
+        worker.join(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
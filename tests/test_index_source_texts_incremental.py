@@ -0,0 +1,113 @@
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts import index_source_texts
+from src import webserver
+
+PSALM = "PSALM 1\nBlessed is the man that walketh not in the counsel of the ungodly.\n\nPSALM 2\nWhy do the heathen rage?\n"
+ODE = "ODE 1\nThe Lord is on my head like a crown.\n"
+
+
+class IncrementalIndexingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        self.source_dir = root / "texts"
+        self.source_dir.mkdir()
+        (self.source_dir / "psalms.txt").write_text(PSALM, encoding="utf-8")
+        (self.source_dir / "odes.txt").write_text(ODE, encoding="utf-8")
+        self.out = root / "out"
+        self.index_path = self.out / "index.json"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _run(self, *extra: str) -> str:
+        argv = [
+            "index_source_texts.py",
+            "--source-dir", str(self.source_dir),
+            "--output", str(self.index_path),
+            "--search-output", str(self.out / "search.bin"),
+            "--meta-output", str(self.out / "meta.json"),
+            "--blob-output", str(self.out / "blob.utf8"),
+            "--manifest", str(self.out / "manifest.json"),
+            *extra,
+        ]
+        output = StringIO()
+        with patch("sys.argv", argv), redirect_stdout(output):
+            index_source_texts.main()
+        return output.getvalue()
+
+    def test_only_changed_files_are_re_sectioned(self) -> None:
+        self._run()
+        (self.source_dir / "odes.txt").write_text(ODE + "\nODE 2\nI rested on the Spirit.\n", encoding="utf-8")
+        (self.source_dir / "wisdom.txt").write_text("CHAPTER 1\nLove righteousness.\n", encoding="utf-8")
+
+        with patch.object(index_source_texts, "index_source_file", wraps=index_source_texts.index_source_file) as sectioned:
+            output = self._run()
+
+        self.assertEqual(sorted(call.args[0].name for call in sectioned.call_args_list), ["odes.txt", "wisdom.txt"])
+        self.assertIn("re-indexed 2 of 3 files", output)
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self.assertEqual([source["source_id"] for source in index["sources"]], ["odes", "psalms", "wisdom"])
+        self.assertEqual(index["sources"][0]["section_count"], 2)
+
+    def test_unchanged_sources_reuse_their_search_segments(self) -> None:
+        self._run()
+        (self.source_dir / "wisdom.txt").write_text("CHAPTER 1\nLove righteousness.\n", encoding="utf-8")
+
+        with patch.object(
+            index_source_texts, "encode_search_segment", wraps=index_source_texts.encode_search_segment
+        ) as encoded:
+            self._run()
+
+        self.assertEqual(encoded.call_count, 1)
+        incremental = (self.out / "search.bin").read_bytes()
+        self._run("--full")
+        self.assertEqual((self.out / "search.bin").read_bytes(), incremental)
+
+        index = webserver._SourceSearchIndex(incremental)
+        hits = index.search(["counsel"], [["love", "righteousness"]])
+        self.assertEqual(hits, [])
+        self.assertEqual([index.docs[doc_id][1] for _score, doc_id, _matches in index.search(["righteousness"], [])], ["chapter_1"])
+        self.assertEqual(len(index.search(["the"], [])), 3)
+
+    def test_an_unchanged_tree_rewrites_nothing(self) -> None:
+        self._run()
+        mtime = self.index_path.stat().st_mtime_ns
+
+        with patch.object(index_source_texts, "index_source_file") as sectioned:
+            output = self._run()
+
+        sectioned.assert_not_called()
+        self.assertIn("up to date", output)
+        self.assertEqual(self.index_path.stat().st_mtime_ns, mtime)
+
+    def test_metadata_or_indexer_changes_invalidate_cached_sources(self) -> None:
+        self._run()
+        (self.source_dir / "book_metadata.json").write_text(
+            json.dumps([{"filename": "odes.txt", "title": "Odes of Solomon"}]), encoding="utf-8"
+        )
+        self.assertIn("re-indexed 1 of 2 files: odes.txt", self._run())
+
+        with patch.object(index_source_texts, "INDEXER_VERSION", index_source_texts.INDEXER_VERSION + 1):
+            self.assertIn("re-indexed 2 of 2 files", self._run())
+
+    def test_removed_files_drop_out_of_the_index(self) -> None:
+        self._run()
+        (self.source_dir / "odes.txt").unlink()
+
+        self._run()
+
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self.assertEqual([source["source_id"] for source in index["sources"]], ["psalms"])
+        self.assertEqual(json.loads((self.out / "manifest.json").read_text())["files"].keys(), {"psalms.txt"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+import base64
+import hashlib
+import json
+import os
+import random
+import time
+import unittest
+from unittest.mock import patch
+from urllib.error import URLError
+
+from src import webserver
+
+
+ISSUER = "https://auth.example/realms/pericope"
+JWKS_URL = f"{ISSUER}/protocol/openid-connect/certs"
+AUDIENCE = "pericope-web"
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _int_b64url(value: int) -> str:
+    return _b64url(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+def _is_probable_prime(candidate: int, rng: random.Random) -> bool:
+    if candidate % 2 == 0:
+        return False
+    d, r = candidate - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for _ in range(16):
+        x = pow(rng.randrange(2, candidate - 1), d, candidate)
+        if x in (1, candidate - 1):
+            continue
+        for _ in range(r - 1):
+            x = pow(x, 2, candidate)
+            if x == candidate - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _generate_rsa_key(rng: random.Random, bits: int = 1024) -> tuple[int, int, int]:
+    exponent = 65537
+    primes: list[int] = []
+    while len(primes) < 2:
+        candidate = rng.getrandbits(bits // 2) | (1 << (bits // 2 - 1)) | 1
+        if (candidate - 1) % exponent and _is_probable_prime(candidate, rng):
+            primes.append(candidate)
+    p, q = primes
+    return p * q, exponent, pow(exponent, -1, (p - 1) * (q - 1))
+
+
+class JwtLocalVerificationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = random.Random(20261019)
+        cls.rsa_n, cls.rsa_e, cls.rsa_d = _generate_rsa_key(rng)
+        cls.ec_d = rng.randrange(1, webserver._P256_N)
+        cls.ec_q = webserver._p256_mul(cls.ec_d, webserver._P256_G)
+        cls.rng = rng
+
+    def setUp(self) -> None:
+        webserver._reset_auth_jwks()
+        webserver._reset_auth_userinfo_cache()
+        self.jwks = {"keys": [self._rsa_jwk("rsa-1"), self._ec_jwk("ec-1")]}
+        self.jwks_requests = 0
+        self.env = patch.dict(
+            os.environ,
+            {
+                "SOLOMONIC_AUTH_TOKEN_VERIFICATION": "jwks",
+                "SOLOMONIC_AUTH_ISSUER": ISSUER,
+                "SOLOMONIC_AUTH_CLIENT_ID": AUDIENCE,
+                "SOLOMONIC_AUTH_JWKS_MIN_REFRESH_SECONDS": "0",
+            },
+            clear=False,
+        )
+        self.env.start()
+        self.upstream = patch("src.webserver._upstream_request", side_effect=self._stub_upstream)
+        self.upstream.start()
+
+    def tearDown(self) -> None:
+        self.upstream.stop()
+        self.env.stop()
+        webserver._reset_auth_jwks()
+        webserver._reset_auth_userinfo_cache()
+
+    def _stub_upstream(self, url: str, **_kwargs) -> webserver.UpstreamResponse:
+        if url != JWKS_URL:
+            raise AssertionError(f"unexpected upstream call to {url}")
+        self.jwks_requests += 1
+        return webserver.UpstreamResponse(
+            url=url,
+            status=200,
+            reason="OK",
+            headers={},
+            body=json.dumps(self.jwks).encode("utf-8"),
+        )
+
+    def _rsa_jwk(self, kid: str) -> dict:
+        return {"kty": "RSA", "kid": kid, "use": "sig", "n": _int_b64url(self.rsa_n), "e": _int_b64url(self.rsa_e)}
+
+    def _ec_jwk(self, kid: str) -> dict:
+        x, y = self.ec_q
+        return {"kty": "EC", "kid": kid, "crv": "P-256", "x": _int_b64url(x), "y": _int_b64url(y)}
+
+    def _claims(self, **overrides) -> dict:
+        claims = {
+            "iss": ISSUER,
+            "sub": "user-1",
+            "aud": "account",
+            "azp": AUDIENCE,
+            "exp": int(time.time()) + 300,
+        }
+        claims.update(overrides)
+        return claims
+
+    def _sign(self, alg: str, kid: str, claims: dict) -> str:
+        header = _b64url(json.dumps({"alg": alg, "kid": kid, "typ": "JWT"}).encode("utf-8"))
+        body = _b64url(json.dumps(claims).encode("utf-8"))
+        signing_input = f"{header}.{body}".encode("ascii")
+        if alg == "RS256":
+            size = (self.rsa_n.bit_length() + 7) // 8
+            digest_info = webserver._RSA_SHA256_DIGEST_INFO + hashlib.sha256(signing_input).digest()
+            encoded = b"\x00\x01" + b"\xff" * (size - len(digest_info) - 3) + b"\x00" + digest_info
+            signature = pow(int.from_bytes(encoded, "big"), self.rsa_d, self.rsa_n).to_bytes(size, "big")
+        else:
+            digest = int.from_bytes(hashlib.sha256(signing_input).digest(), "big")
+            while True:
+                nonce = self.rng.randrange(1, webserver._P256_N)
+                r = webserver._p256_mul(nonce, webserver._P256_G)[0] % webserver._P256_N
+                s = pow(nonce, -1, webserver._P256_N) * (digest + r * self.ec_d) % webserver._P256_N
+                if r and s:
+                    break
+            signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+        return f"{header}.{body}.{_b64url(signature)}"
+
+    def test_rs256_and_es256_tokens_verify_without_userinfo(self) -> None:
+        rsa_claims = webserver._verify_userinfo_token(self._sign("RS256", "rsa-1", self._claims()))
+        ec_claims = webserver._verify_userinfo_token(self._sign("ES256", "ec-1", self._claims(sub="user-2")))
+
+        self.assertEqual(rsa_claims["sub"], "user-1")
+        self.assertEqual(ec_claims["sub"], "user-2")
+        self.assertEqual(self.jwks_requests, 1)
+
+    def test_tampered_payload_is_rejected(self) -> None:
+        header, _body, signature = self._sign("RS256", "rsa-1", self._claims()).split(".")
+        forged = _b64url(json.dumps(self._claims(sub="admin")).encode("utf-8"))
+
+        with self.assertRaisesRegex(ValueError, "signature is invalid"):
+            webserver._verify_userinfo_token(f"{header}.{forged}.{signature}")
+
+    def test_claim_checks(self) -> None:
+        cases = {
+            "expired": (self._claims(exp=int(time.time()) - 120), "expired"),
+            "issuer": (self._claims(iss="https://evil.example/realms/x"), "issuer"),
+            "audience": (self._claims(aud="other", azp="other"), "audience"),
+            "id token": (self._claims(typ="ID"), "not an access token"),
+            "refresh token": (self._claims(typ="Refresh"), "not an access token"),
+        }
+        for name, (claims, message) in cases.items():
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, message):
+                    webserver._verify_userinfo_token(self._sign("ES256", "ec-1", claims))
+
+    def test_unknown_kid_refetches_jwks_for_rotated_keys(self) -> None:
+        webserver._verify_userinfo_token(self._sign("RS256", "rsa-1", self._claims()))
+        self.jwks = {"keys": [self._rsa_jwk("rsa-2")]}
+
+        claims = webserver._verify_userinfo_token(self._sign("RS256", "rsa-2", self._claims(sub="user-3")))
+
+        self.assertEqual(claims["sub"], "user-3")
+        self.assertEqual(self.jwks_requests, 2)
+
+    def test_unknown_kid_refetch_is_rate_limited(self) -> None:
+        webserver._verify_userinfo_token(self._sign("RS256", "rsa-1", self._claims()))
+
+        with patch.dict(os.environ, {"SOLOMONIC_AUTH_JWKS_MIN_REFRESH_SECONDS": "60"}, clear=False):
+            with self.assertRaisesRegex(ValueError, "not in the realm JWKS"):
+                webserver._verify_userinfo_token(self._sign("RS256", "forged", self._claims()))
+
+        self.assertEqual(self.jwks_requests, 1)
+
+    def test_access_token_types_are_accepted(self) -> None:
+        for token_type in ("Bearer", "at+jwt"):
+            with self.subTest(token_type):
+                claims = webserver._verify_userinfo_token(self._sign("ES256", "ec-1", self._claims(typ=token_type)))
+                self.assertEqual(claims["typ"], token_type)
+
+    def test_failed_jwks_fetch_backs_off_before_retrying(self) -> None:
+        def unreachable(url: str, **_kwargs):
+            self.jwks_requests += 1
+            raise URLError("connection refused")
+
+        self.upstream.stop()
+        self.upstream = patch("src.webserver._upstream_request", side_effect=unreachable)
+        self.upstream.start()
+        token = self._sign("RS256", "rsa-1", self._claims())
+
+        with patch.dict(os.environ, {"SOLOMONIC_AUTH_JWKS_MIN_REFRESH_SECONDS": "60"}, clear=False):
+            with self.assertRaisesRegex(ValueError, "JWKS unavailable"):
+                webserver._verify_userinfo_token(token)
+            with self.assertRaisesRegex(ValueError, "JWKS unavailable"):
+                webserver._verify_userinfo_token(token)
+            self.assertIsNotNone(webserver._build_auth_token_verification_status()["jwks_failed_seconds_ago"])
+
+        self.assertEqual(self.jwks_requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
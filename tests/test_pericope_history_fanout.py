@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src import webserver
+
+
+class PericopeHistoryFanoutTests(unittest.TestCase):
+    def setUp(self) -> None:
+        webserver._reset_pericope_history_detail_cache()
+        self.last_active = {f"s{index}": "2026-10-19T08:00:00Z" for index in range(6)}
+        self.slow_sessions: set[str] = set()
+        self.detail_calls: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self.auth = patch("src.webserver._verify_userinfo_token", return_value={"sub": "user-1"})
+        self.auth.start()
+        self.upstream = patch("src.webserver._fetch_pericope_json", side_effect=self._stub_pericope)
+        self.upstream.start()
+
+    def tearDown(self) -> None:
+        self.upstream.stop()
+        self.auth.stop()
+        webserver._reset_pericope_history_detail_cache()
+
+    def _stub_pericope(self, path: str, _token: str, *, timeout: float = 6.0) -> dict:
+        if path.startswith("/history?"):
+            return {
+                "sessions": [
+                    {"session_id": session_id, "last_active": last_active}
+                    for session_id, last_active in self.last_active.items()
+                ]
+            }
+        session_id = path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.detail_calls.append(session_id)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(1.0 if session_id in self.slow_sessions else 0.1)
+        finally:
+            with self.lock:
+                self.active -= 1
+        return {"source": "solomonic_clock"}
+
+    def _request(self) -> dict:
+        payload, error, status = webserver._build_pericope_history_sessions_payload(
+            {"Authorization": "Bearer token-a"},
+            {"limit": ["6"]},
+        )
+        self.assertIsNone(error)
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        return payload
+
+    def test_details_are_fetched_concurrently_within_the_worker_bound(self) -> None:
+        with patch.dict(os.environ, {"SOLOMONIC_PERICOPE_HISTORY_WORKERS": "3"}, clear=False):
+            started = time.monotonic()
+            payload = self._request()
+            elapsed = time.monotonic() - started
+
+        self.assertEqual([session["session_id"] for session in payload["sessions"]], list(self.last_active))
+        self.assertFalse(payload["partial"])
+        self.assertEqual(self.max_active, 3)
+        self.assertLess(elapsed, 0.5)
+
+    def test_deadline_returns_partial_results(self) -> None:
+        self.slow_sessions = {"s2"}
+        with patch.dict(os.environ, {"SOLOMONIC_PERICOPE_HISTORY_DEADLINE_MS": "400"}, clear=False):
+            started = time.monotonic()
+            payload = self._request()
+            elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.9)
+        self.assertTrue(payload["partial"])
+        self.assertEqual(payload["timed_out_sessions"], 1)
+        self.assertNotIn("s2", [session["session_id"] for session in payload["sessions"]])
+        self.assertEqual(payload["count"], 5)
+
+    def test_details_are_cached_until_last_active_changes(self) -> None:
+        self._request()
+        self.detail_calls.clear()
+
+        self._request()
+        self.assertEqual(self.detail_calls, [])
+
+        self.last_active["s1"] = "2026-10-19T09:30:00Z"
+        payload = self._request()
+        self.assertEqual(self.detail_calls, ["s1"])
+        self.assertEqual(payload["count"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src import webserver
+
+
+REMOTE_LOOKUP = {23: {1: "The LORD is my shepherd; I shall not want."}}
+
+
+def _reset_psalm_lookup_state() -> None:
+    webserver._PSALM_LOOKUP = None
+    webserver._PSALM_LOOKUP_PATH = None
+    webserver._PSALM_LOOKUP_MTIME = None
+    webserver._PSALM_LOOKUP_SOURCE = None
+    webserver._PSALM_LOOKUP_NUMBERING = None
+    webserver._PSALM_LOOKUP_MODE = None
+    webserver._PSALM_REMOTE_FUTURE = None
+    webserver._PSALM_REMOTE_LOOKUP = None
+    webserver._PSALM_REMOTE_SOURCE = None
+    webserver._PSALM_REMOTE_ERROR = None
+    webserver._PSALM_REMOTE_FAILED_AT = None
+    webserver._PSALM_REMOTE_READY.clear()
+
+
+class PsalmLookupRefreshTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _reset_psalm_lookup_state()
+        self.release_remote = threading.Event()
+        self.calls = 0
+        self.calls_lock = threading.Lock()
+
+    def tearDown(self) -> None:
+        self.release_remote.set()
+        _reset_psalm_lookup_state()
+
+    def _gated_remote(self):
+        with self.calls_lock:
+            self.calls += 1
+        self.release_remote.wait(5)
+        return REMOTE_LOOKUP, "pericope-stub"
+
+    def test_pericope_first_serves_local_file_until_remote_copy_arrives(self) -> None:
+        with (
+            patch.dict(
+                os.environ,
+                {
+                    "SOLOMONIC_PSALM_SOURCE_MODE": "pericope_first",
+                    "SOLOMONIC_PSALMS_TEXT_PATH": str(webserver.DEFAULT_LOCAL_PSALMS_PATH),
+                },
+                clear=False,
+            ),
+            patch("src.webserver._load_psalm_lookup_from_pericope", side_effect=self._gated_remote),
+        ):
+            started = time.monotonic()
+            lookup, error = webserver._load_psalm_lookup()
+            self.assertLess(time.monotonic() - started, 1.0)
+            self.assertIsNone(error)
+            self.assertEqual(webserver._PSALM_LOOKUP_PATH, webserver.DEFAULT_LOCAL_PSALMS_PATH)
+            self.assertFalse(webserver._build_psalm_lookup_status()["remote"]["ready"])
+
+            self.release_remote.set()
+            self.assertTrue(webserver._PSALM_REMOTE_READY.wait(5))
+            lookup, error = webserver._load_psalm_lookup()
+
+        self.assertIs(lookup, REMOTE_LOOKUP)
+        status = webserver._build_psalm_lookup_status()
+        self.assertEqual(status["serving"], "pericope")
+        self.assertTrue(status["remote"]["ready"])
+        self.assertEqual(self.calls, 1)
+
+    def test_concurrent_first_requests_share_one_remote_fetch(self) -> None:
+        results: list = []
+
+        def request() -> None:
+            results.append(webserver._load_psalm_lookup())
+
+        with (
+            patch.dict(os.environ, {"SOLOMONIC_PSALM_SOURCE_MODE": "pericope_only"}, clear=False),
+            patch("src.webserver._load_psalm_lookup_from_pericope", side_effect=self._gated_remote),
+        ):
+            threads = [threading.Thread(target=request) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.1)
+            self.release_remote.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(lookup is REMOTE_LOOKUP for lookup, _error in results))
+
+    def test_failed_remote_load_is_not_retried_inside_backoff_window(self) -> None:
+        with (
+            patch.dict(os.environ, {"SOLOMONIC_PSALM_SOURCE_MODE": "pericope_only"}, clear=False),
+            patch(
+                "src.webserver._load_psalm_lookup_from_pericope",
+                return_value=(None, "Pericope down"),
+            ) as remote,
+        ):
+            first = webserver._load_psalm_lookup()
+            second = webserver._load_psalm_lookup()
+
+        self.assertIsNone(first[0])
+        self.assertIn("Pericope down", first[1])
+        self.assertIn("Pericope down", second[1])
+        self.assertEqual(remote.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src import webserver
+
+
+class SingleFlightTests(unittest.TestCase):
+    def _run_concurrently(self, fn, count: int = 8) -> list:
+        results: list = []
+        results_lock = threading.Lock()
+
+        def call() -> None:
+            try:
+                value = fn()
+            except Exception as exc:  # collected so the assertion can inspect it
+                value = exc
+            with results_lock:
+                results.append(value)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_concurrent_callers_share_one_computation(self) -> None:
+        flight = webserver._SingleFlight()
+        calls = []
+
+        def slow() -> str:
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        results = self._run_concurrently(lambda: flight.do("key", slow))
+
+        self.assertEqual(results, ["value"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats(), {"in_flight": 0, "leaders": 1, "coalesced": 7})
+
+    def test_errors_are_shared_and_the_next_call_runs_again(self) -> None:
+        flight = webserver._SingleFlight()
+        calls = []
+
+        def failing() -> None:
+            calls.append(1)
+            time.sleep(0.2)
+            raise ValueError("upstream down")
+
+        results = self._run_concurrently(lambda: flight.do("key", failing))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(flight.do("key", lambda: "recovered"), "recovered")
+
+    def test_same_token_shares_one_userinfo_round_trip(self) -> None:
+        webserver._reset_auth_userinfo_cache()
+        calls = []
+
+        def userinfo(token: str, token_hash: str) -> dict:
+            calls.append(token)
+            time.sleep(0.2)
+            return {"sub": "user-1"}
+
+        with patch("src.webserver._fetch_userinfo_claims", side_effect=userinfo):
+            results = self._run_concurrently(lambda: webserver._verify_userinfo_token("token-a"))
+
+        self.assertEqual(calls, ["token-a"])
+        self.assertEqual(results, [{"sub": "user-1"}] * 8)
+        # Every caller gets its own copy of the claims.
+        self.assertEqual(len({id(result) for result in results}), 8)
+
+    def test_concurrent_book_partial_misses_share_one_upstream_fetch(self) -> None:
+        target = webserver.BookPartialTarget(
+            author_slug="augustine",
+            book="Confessions",
+            source="confessions.txt",
+            chapter="1",
+            start_position=0,
+            end_position=10,
+        )
+        calls = []
+
+        def fetch(_target):
+            calls.append(1)
+            time.sleep(0.2)
+            return {"text": "Great art Thou, O Lord"}, None
+
+        with (
+            patch("src.webserver._get_book_partial_cache", return_value=None),
+            patch("src.webserver._fetch_book_partial_from_pericope", side_effect=fetch),
+        ):
+            results = self._run_concurrently(lambda: webserver._fetch_book_partial_cached(target))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(payload == {"text": "Great art Thou, O Lord"} for payload, _ in results))
+        self.assertEqual(len({id(payload) for payload, _ in results}), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src import webserver
+
+
+def _reset_psalm_lookup_cache() -> None:
+    webserver._PSALM_LOOKUP = None
+    webserver._PSALM_LOOKUP_PATH = None
+    webserver._PSALM_LOOKUP_MTIME = None
+    webserver._PSALM_LOOKUP_SOURCE = None
+    webserver._PSALM_LOOKUP_NUMBERING = None
+    webserver._PSALM_LOOKUP_MODE = None
+    webserver._PSALM_REMOTE_FUTURE = None
+    webserver._PSALM_REMOTE_LOOKUP = None
+    webserver._PSALM_REMOTE_SOURCE = None
+    webserver._PSALM_REMOTE_FAILED_AT = None
+    webserver._PSALM_REMOTE_READY.clear()
+
+
+class SourceRaceModeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _reset_psalm_lookup_cache()
+        self.release_remote = threading.Event()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {
+                "SOLOMONIC_PSALM_SOURCE_MODE": "race",
+                webserver.SOURCE_RACE_BUDGET_MS_ENV: "50",
+                "SOLOMONIC_PSALMS_TEXT_PATH": str(webserver.DEFAULT_LOCAL_PSALMS_PATH),
+                webserver.BOOK_PARTIAL_CACHE_PATH_ENV: str(Path(self.tmp.name) / "cache.sqlite3"),
+            },
+            clear=False,
+        )
+        self.env.start()
+
+    def tearDown(self) -> None:
+        self.release_remote.set()
+        self.env.stop()
+        self.tmp.cleanup()
+        _reset_psalm_lookup_cache()
+
+    def test_local_text_wins_when_pericope_exceeds_budget(self) -> None:
+        def slow_remote(target):
+            self.release_remote.wait(5)
+            return None, "late"
+
+        with patch("src.webserver._fetch_book_partial_from_pericope", side_effect=slow_remote):
+            payload, error, status = webserver._build_book_partial_payload(
+                {"kind": "wisdom", "reference": "Proverbs 3:5"}
+            )
+
+        self.assertEqual(int(status), 200, error)
+        self.assertEqual(payload["resolved_via"], "local_fallback")
+        self.assertEqual(payload["source_race"]["winner"], "local")
+        self.assertEqual(payload["source_race"]["budget_ms"], 50)
+        self.assertIn("did not answer within 50 ms", payload["resolution_warning"])
+        self.assertLess(payload["source_race"]["elapsed_ms"], 2000)
+
+    def test_pericope_wins_when_it_answers_inside_budget(self) -> None:
+        remote = {"content": "Trust in the LORD", "resolved_via": "pericope"}
+        before = webserver._build_source_race_stats().get("book_partial", {}).get("pericope", 0)
+
+        with (
+            patch.dict(os.environ, {webserver.SOURCE_RACE_BUDGET_MS_ENV: "2000"}, clear=False),
+            patch("src.webserver._fetch_book_partial_from_pericope", return_value=(dict(remote), None)),
+        ):
+            payload, error, status = webserver._build_book_partial_payload(
+                {"kind": "wisdom", "reference": "Proverbs 3:5"}
+            )
+
+        self.assertEqual(int(status), 200, error)
+        self.assertEqual(payload["resolved_via"], "pericope")
+        self.assertEqual(payload["source_race"]["winner"], "pericope")
+        self.assertEqual(webserver._build_source_race_stats()["book_partial"]["pericope"], before + 1)
+
+    def test_psalm_lookup_serves_local_file_while_pericope_is_slow(self) -> None:
+        def slow_lookup():
+            self.release_remote.wait(5)
+            return None, "late"
+
+        with patch("src.webserver._load_psalm_lookup_from_pericope", side_effect=slow_lookup):
+            lookup, error = webserver._load_psalm_lookup()
+
+        self.assertIsNone(error)
+        self.assertIn(23, lookup)
+        self.assertEqual(webserver._PSALM_LOOKUP_PATH, webserver.DEFAULT_LOCAL_PSALMS_PATH)
+
+    def test_background_work_runs_on_a_bounded_pool(self) -> None:
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def task() -> str:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            self.release_remote.wait(0.05)
+            with lock:
+                running -= 1
+            return threading.current_thread().name
+
+        pool = webserver.ThreadPoolExecutor(max_workers=2, thread_name_prefix="solomonic-background")
+        self.addCleanup(pool.shutdown)
+        with patch("src.webserver._BACKGROUND_EXECUTOR", pool):
+            names = [future.result(5) for future in [webserver._run_in_background(task) for _ in range(8)]]
+
+        self.assertEqual(peak, 2)
+        self.assertTrue(all(name.startswith("solomonic-background") for name in names))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.index_source_texts import build_search_index
+from src import webserver
+
+SOURCES = [
+    {
+        "source_id": "proverbs",
+        "title": "Proverbs",
+        "sections": [
+            {"section_id": "chapter_1", "heading": "CHAPTER 1", "text": "CHAPTER 1\nThe fear of the LORD is the beginning of knowledge.\n"},
+            {"section_id": "chapter_9", "heading": "CHAPTER 9", "text": "CHAPTER 9\nThe LORD's fear, of wisdom the beginning.\n"},
+        ],
+    },
+    {
+        "source_id": "wisdom_of_solomon",
+        "title": "Wisdom of Solomon",
+        "sections": [
+            {
+                "section_id": "chapter_7",
+                "heading": "CHAPTER 7",
+                "text": "CHAPTER 7\nWisdom, wisdom and the fear of the LORD; I preferred wisdom before sceptres.\n",
+            },
+        ],
+    },
+]
+
+
+class SourceTextSearchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.index_path = Path(self.tmpdir.name) / "search.bin"
+        self.index_path.write_bytes(build_search_index(SOURCES, "2026-10-19"))
+        self.env = patch.dict(
+            os.environ, {webserver.SOURCE_SEARCH_INDEX_PATH_ENV: str(self.index_path)}, clear=False
+        )
+        self.env.start()
+        webserver._reset_source_search_indexes()
+
+    def tearDown(self) -> None:
+        webserver._reset_source_search_indexes()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def _search(self, **params: str) -> dict:
+        payload, error, status = webserver._build_source_search_payload({key: [value] for key, value in params.items()})
+        self.assertIsNone(error)
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        return payload
+
+    def test_terms_match_sections_containing_every_word_ranked_by_frequency(self) -> None:
+        payload = self._search(q="Wisdom fear")
+
+        self.assertEqual(payload["total"], 2)
+        self.assertEqual(
+            [(hit["source_id"], hit["section_id"]) for hit in payload["results"]],
+            [("wisdom_of_solomon", "chapter_7"), ("proverbs", "chapter_9")],
+        )
+        self.assertEqual(payload["results"][0]["matches"], 4)
+        self.assertEqual(payload["results"][0]["title"], "Wisdom of Solomon")
+
+    def test_phrases_require_adjacent_words(self) -> None:
+        payload = self._search(q='"fear of the lord"')
+
+        self.assertEqual(payload["phrases"], ["fear of the lord"])
+        self.assertEqual(
+            sorted(hit["section_id"] for hit in payload["results"]),
+            ["chapter_1", "chapter_7"],
+        )
+        self.assertEqual(self._search(q='"the beginning" knowledge')["results"][0]["section_id"], "chapter_1")
+        self.assertEqual(self._search(q='"lord fear"')["total"], 0)
+
+    def test_source_filter_and_paging(self) -> None:
+        payload = self._search(q="the", source="proverbs", limit="1", offset="1")
+
+        self.assertEqual(payload["total"], 2)
+        self.assertEqual(len(payload["results"]), 1)
+        self.assertEqual(payload["results"][0]["source_id"], "proverbs")
+
+    def test_rebuilt_index_file_is_reloaded(self) -> None:
+        self.assertEqual(self._search(q="sceptres")["total"], 1)
+
+        trimmed = [dict(SOURCES[0])]
+        self.index_path.write_bytes(build_search_index(trimmed, "2026-10-20"))
+        os.utime(self.index_path, (1, 1))
+
+        payload = self._search(q="sceptres")
+        self.assertEqual(payload["total"], 0)
+        self.assertEqual(payload["index_generated"], "2026-10-20")
+
+    def test_empty_query_and_missing_index_are_reported(self) -> None:
+        _payload, error, status = webserver._build_source_search_payload({"q": ['  "" ']})
+        self.assertEqual(status, webserver.HTTPStatus.BAD_REQUEST)
+        self.assertIn("q", error)
+
+        self.index_path.unlink()
+        _payload, error, status = webserver._build_source_search_payload({"q": ["wisdom"]})
+        self.assertEqual(status, webserver.HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertIn("index_source_texts.py", error)
+
+    def test_shipped_search_index_matches_the_shipped_json_index(self) -> None:
+        sections = sum(
+            len(source["sections"])
+            for source in json.loads((webserver.REPO_ROOT / "data" / "source_texts_index.json").read_text("utf-8"))["sources"]
+        )
+
+        index = webserver._SourceSearchIndex.load(webserver.DEFAULT_SOURCE_SEARCH_INDEX_PATH)
+
+        self.assertEqual(len(index.docs), sections)
+
+
+if __name__ == "__main__":
+    unittest.main()
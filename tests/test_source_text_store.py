@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.index_source_texts import build_search_index, build_split_index, extract_sections
+from src import webserver
+
+SOURCES = [
+    {
+        "source_id": "odes_of_solomon",
+        "title": "Odes of Solomon",
+        "file": "external/odes.txt",
+        "source_urls": ["https://example.org/odes"],
+        "section_count": 2,
+        "sections": [
+            {"section_id": "ode_1", "heading": "ODE 1", "order": 1, "char_start": 0, "char_end": 40, "text": "ODE 1\nThe Lord is on my head like a crown.\n"},
+            {"section_id": "ode_2", "heading": "ODE 2", "order": 2, "char_start": 40, "char_end": 90, "text": "ODE 2\nΣοφία — wisdom crowned with glory.\n"},
+        ],
+    },
+]
+
+
+class SourceTextStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        meta, blob = build_split_index(SOURCES, "2026-10-19", "texts.utf8")
+        (root / "texts.utf8").write_bytes(blob)
+        self.meta_path = root / "meta.json"
+        self.meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        (root / "search.bin").write_bytes(build_search_index(SOURCES, "2026-10-19"))
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.SOURCE_TEXTS_META_PATH_ENV: str(self.meta_path),
+                webserver.SOURCE_SEARCH_INDEX_PATH_ENV: str(root / "search.bin"),
+            },
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_source_text_stores()
+        webserver._reset_source_search_indexes()
+
+    def tearDown(self) -> None:
+        webserver._reset_source_text_stores()
+        webserver._reset_source_search_indexes()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_sections_are_sliced_from_the_blob_by_byte_offset(self) -> None:
+        store = webserver._get_source_text_store()
+
+        self.assertEqual(store.section_text("odes_of_solomon", "ode_2"), SOURCES[0]["sections"][1]["text"])
+        self.assertEqual(store.section_text("odes_of_solomon", "ode_1"), SOURCES[0]["sections"][0]["text"])
+        self.assertIsNone(store.section_text("odes_of_solomon", "ode_3"))
+        section = store.section("odes_of_solomon", "ode_2")
+        self.assertEqual((section["heading"], section["order"], section["char_end"]), ("ODE 2", 2, 90))
+        self.assertEqual(store.source("odes_of_solomon")["source_urls"], ["https://example.org/odes"])
+        self.assertNotIn("text", section)
+
+    def test_blob_that_does_not_match_the_table_is_rejected(self) -> None:
+        (self.meta_path.parent / "texts.utf8").write_bytes(b"truncated")
+
+        with patch("builtins.print"):
+            self.assertIsNone(webserver._get_source_text_store())
+
+    def test_search_results_carry_a_snippet_around_the_match(self) -> None:
+        payload, _error, _status = webserver._build_source_search_payload({"q": ['"crowned with glory"']})
+
+        self.assertEqual(payload["results"][0]["snippet"], "ODE 2 Σοφία — wisdom crowned with glory.")
+
+    def test_numbered_repeats_do_not_collide_with_numbered_headings(self) -> None:
+        text = "\n".join(["PREFACE", "x", "ODE 2", "a", "ODE", "b", "ODE", "c", ""])
+
+        ids = [section["section_id"] for section in extract_sections(text)]
+
+        self.assertEqual(ids, ["preface", "ode_2", "ode", "ode_2_2"])
+
+    def test_shipped_split_index_round_trips_the_json_index(self) -> None:
+        full = json.loads((webserver.REPO_ROOT / "data" / "source_texts_index.json").read_text(encoding="utf-8"))
+
+        store = webserver._SourceTextStore.load(webserver.DEFAULT_SOURCE_TEXTS_META_PATH)
+
+        self.assertEqual([source["source_id"] for source in store.sources], [source["source_id"] for source in full["sources"]])
+        for source in full["sources"]:
+            for section in source["sections"]:
+                self.assertEqual(store.section_text(source["source_id"], section["section_id"]), section["text"])
+
+
+if __name__ == "__main__":
+    unittest.main()
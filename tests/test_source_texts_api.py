@@ -0,0 +1,145 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from functools import partial
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.index_source_texts import build_search_index, build_split_index
+from src import webserver
+
+SOURCES = [
+    {
+        "source_id": "psalms_of_solomon",
+        "title": "Psalms of Solomon",
+        "file": "external/psalms_of_solomon.txt",
+        "metadata": {"tradition": "pseudepigrapha"},
+        "section_count": 5,
+        "sections": [
+            {
+                "section_id": f"psalm_{number}",
+                "heading": f"PSALM {number}",
+                "order": number,
+                "char_start": number * 100,
+                "char_end": number * 100 + 99,
+                "text": f"PSALM {number}\nA psalm of Solomon, number {number}.\n",
+            }
+            for number in range(1, 6)
+        ],
+    },
+    {
+        "source_id": "odes_of_solomon",
+        "title": "Odes of Solomon",
+        "section_count": 1,
+        "sections": [
+            {"section_id": "ode 1", "heading": "ODE 1", "order": 1, "char_start": 0, "char_end": 30, "text": "ODE 1\nI am crowned.\n"},
+        ],
+    },
+]
+
+
+class SourceTextsApiTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        meta, blob = build_split_index(SOURCES, "2026-10-19", "texts.utf8")
+        (root / "texts.utf8").write_bytes(blob)
+        (root / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+        (root / "search.bin").write_bytes(build_search_index(SOURCES, "2026-10-19"))
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.SOURCE_TEXTS_META_PATH_ENV: str(root / "meta.json"),
+                webserver.SOURCE_SEARCH_INDEX_PATH_ENV: str(root / "search.bin"),
+            },
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_source_text_stores()
+        webserver._reset_source_search_indexes()
+
+        self.site = ThreadingHTTPServer(("127.0.0.1", 0), partial(webserver.ClockRequestHandler, directory=self.tmpdir.name))
+        self.site.daemon_threads = True
+        threading.Thread(target=self.site.serve_forever, daemon=True).start()
+
+    def tearDown(self) -> None:
+        self.site.shutdown()
+        self.site.server_close()
+        webserver._reset_source_text_stores()
+        webserver._reset_source_search_indexes()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def _get(self, path: str) -> tuple[int, dict]:
+        connection = HTTPConnection("127.0.0.1", self.site.server_address[1], timeout=10)
+        self.addCleanup(connection.close)
+        with patch.object(webserver.ClockRequestHandler, "log_message"):
+            connection.request("GET", path)
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+
+    def test_source_list_has_metadata_but_no_sections(self) -> None:
+        status, payload = self._get("/api/sources")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["source_count"], 2)
+        psalms = payload["sources"][0]
+        self.assertEqual((psalms["source_id"], psalms["section_count"]), ("psalms_of_solomon", 5))
+        self.assertEqual(psalms["metadata"], {"tradition": "pseudepigrapha"})
+        self.assertEqual(psalms["text_bytes"], sum(len(section["text"].encode()) for section in SOURCES[0]["sections"]))
+        self.assertNotIn("sections", psalms)
+
+    def test_source_sections_are_paged_without_text(self) -> None:
+        status, payload = self._get("/api/sources/psalms_of_solomon?limit=2&offset=2")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["title"], "Psalms of Solomon")
+        self.assertEqual([section["section_id"] for section in payload["sections"]], ["psalm_3", "psalm_4"])
+        self.assertEqual((payload["total"], payload["next_offset"]), (5, 4))
+        self.assertNotIn("text", payload["sections"][0])
+        self.assertNotIn("offset", payload["sections"][0])
+
+        _status, last_page = self._get("/api/sources/psalms_of_solomon?limit=2&offset=4")
+        self.assertIsNone(last_page["next_offset"])
+
+    def test_section_text_is_fetched_on_demand_with_neighbours(self) -> None:
+        status, payload = self._get("/api/sources/psalms_of_solomon/sections/psalm_3")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["text"], "PSALM 3\nA psalm of Solomon, number 3.\n")
+        self.assertEqual((payload["previous_section_id"], payload["next_section_id"]), ("psalm_2", "psalm_4"))
+        self.assertEqual(payload["heading"], "PSALM 3")
+
+        _status, encoded = self._get("/api/sources/odes_of_solomon/sections/ode%201")
+        self.assertEqual(encoded["text"], "ODE 1\nI am crowned.\n")
+        self.assertIsNone(encoded["previous_section_id"])
+
+    def test_unknown_resources_and_bad_paging_are_rejected(self) -> None:
+        self.assertEqual(self._get("/api/sources/missing")[0], 404)
+        self.assertEqual(self._get("/api/sources/psalms_of_solomon/sections/psalm_9")[0], 404)
+        self.assertEqual(self._get("/api/sources/psalms_of_solomon/chapters/psalm_1")[0], 404)
+        self.assertEqual(self._get("/api/sources/psalms_of_solomon?limit=many")[0], 400)
+
+    def test_search_is_not_shadowed_by_the_source_routes(self) -> None:
+        status, payload = self._get("/api/sources/search?q=crowned")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["results"][0]["section_id"], "ode 1")
+
+    def test_shipped_source_list_is_a_small_fraction_of_the_json_index(self) -> None:
+        webserver._reset_source_text_stores()
+        with patch.dict(os.environ, {webserver.SOURCE_TEXTS_META_PATH_ENV: ""}, clear=False):
+            payload, _error, _status = webserver._build_sources_payload()
+            source_id = payload["sources"][0]["source_id"]
+            page, _error, _status = webserver._build_source_resource_payload(source_id, {})
+
+        self.assertLess(len(json.dumps(payload)), 64 * 1024)
+        self.assertLess(len(json.dumps(page)), 64 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from src import webserver
+
+
+class TtsPresynthesisTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {webserver.VIBEVOICE_AUDIO_CACHE_DIR_ENV: self.tmpdir.name}, clear=False)
+        self.env.start()
+        webserver._TTS_PRESYNTH_RUNS.clear()
+        webserver._reset_vibevoice_audio_cache()
+        webserver._reset_vibevoice_job_tracker()
+
+    def tearDown(self) -> None:
+        webserver._TTS_PRESYNTH_RUNS.clear()
+        webserver._reset_vibevoice_job_tracker()
+        webserver._reset_vibevoice_audio_cache()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_speech_text_matches_the_browser_bundle_card(self) -> None:
+        self.assertEqual(
+            webserver._bundle_speech_text("Psalm 23 • Full chapter", "The LORD\nis my  shepherd"),
+            "Psalm 23 . Full chapter. The LORD. is my shepherd",
+        )
+        self.assertEqual(
+            webserver._bundle_speech_text("Proverbs 3:5", " Trust in the LORD\n  with all thine heart \n", inline=True),
+            "Proverbs 3:5. Trust in the LORD with all thine heart",
+        )
+
+    def test_target_day_rolls_over_inside_the_lead_window(self) -> None:
+        zone = ZoneInfo("America/New_York")
+        with patch.dict(os.environ, {webserver.TTS_PRESYNTH_LEAD_MINUTES_ENV: "30"}, clear=False):
+            midday = datetime(2026, 10, 19, 12, 0, tzinfo=zone)
+            late = datetime(2026, 10, 19, 23, 45, tzinfo=zone)
+            self.assertEqual(webserver._tts_presynthesis_target_day("America/New_York", midday), date(2026, 10, 19))
+            self.assertEqual(webserver._tts_presynthesis_target_day("America/New_York", late), date(2026, 10, 20))
+
+    def test_run_submits_each_text_with_bounded_concurrency(self) -> None:
+        texts = [f"Psalm {index}. Text" for index in range(6)]
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        thread_names = set()
+
+        def submit(payload):
+            nonlocal active, peak
+            with lock:
+                thread_names.add(threading.current_thread().name)
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            if payload["text"] == texts[0]:
+                return {"job_id": "cache-x", "status": "completed", "cache_status": "hit"}, None, webserver.HTTPStatus.OK
+            if payload["text"] == texts[1]:
+                return None, "VibeVoice service unavailable", webserver.HTTPStatus.BAD_GATEWAY
+            return {"job_id": f"job-{payload['text']}", "status": "queued", "cache_status": "miss"}, None, webserver.HTTPStatus.ACCEPTED
+
+        def status(job_id):
+            return {"job_id": job_id, "status": "completed"}, None, webserver.HTTPStatus.OK
+
+        env = {webserver.TTS_PRESYNTH_CONCURRENCY_ENV: "2", webserver.VIBEVOICE_JOB_POLL_MS_ENV: "10"}
+        with patch.dict(os.environ, env, clear=False), patch(
+            "src.webserver._build_tts_presynthesis_texts", return_value=texts
+        ), patch("src.webserver._build_vibevoice_job_payload", side_effect=submit) as submitted, patch(
+            "src.webserver._build_vibevoice_job_status_payload", side_effect=status
+        ) as polled:
+            summary = webserver._run_tts_presynthesis("UTC", date(2026, 10, 20))
+
+        self.assertEqual(sorted(call.args[0]["text"] for call in submitted.call_args_list), sorted(texts))
+        self.assertLessEqual(peak, 2)
+        self.assertTrue(all(name.startswith("solomonic-tts-presynth") for name in thread_names), thread_names)
+        self.assertEqual(polled.call_count, 4)
+        self.assertEqual(summary["texts"], 6)
+        self.assertEqual(summary["cached"], 1)
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(summary["synthesized"], 4)
+        self.assertEqual(webserver._build_tts_presynthesis_status()["runs"], [summary])
+
+    def test_a_day_with_failures_is_retried_with_backoff_until_clean(self) -> None:
+        now = datetime(2026, 10, 19, 12, 0, tzinfo=ZoneInfo("UTC"))
+        runs = [
+            {"texts": 3, "synthesized": 1, "failed": 1, "timed_out": 1},
+            {"texts": 3, "cached": 1, "synthesized": 1, "timed_out": 1},
+            {"texts": 3, "cached": 3},
+        ]
+        progress: dict = {}
+
+        with patch("src.webserver._run_tts_presynthesis", side_effect=runs) as run, patch("builtins.print"):
+            webserver._tts_presynthesis_step("UTC", now, progress)
+            webserver._tts_presynthesis_step("UTC", now, progress)
+            self.assertEqual(run.call_count, 1, "a failed day waits out its backoff")
+            first_delay = progress["retry_at"] - time.monotonic()
+            self.assertAlmostEqual(first_delay, webserver.TTS_PRESYNTH_RETRY_SECONDS, delta=5)
+
+            progress["retry_at"] = 0.0
+            webserver._tts_presynthesis_step("UTC", now, progress)
+            self.assertEqual(run.call_count, 2)
+            self.assertAlmostEqual(progress["retry_at"] - time.monotonic(), 2 * first_delay, delta=5)
+            self.assertNotIn("done", progress)
+
+            progress["retry_at"] = 0.0
+            webserver._tts_presynthesis_step("UTC", now, progress)
+            webserver._tts_presynthesis_step("UTC", now, progress)
+
+        self.assertEqual(run.call_count, 3)
+        self.assertTrue(progress["done"])
+        self.assertEqual(run.call_args.args, ("UTC", date(2026, 10, 19)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+
+from src import webserver
+
+
+PRIMARY_URL = "http://primary.invalid/v1/book_partial"
+SECONDARY_URL = "http://secondary.invalid/v1/book_partial"
+
+
+def _target() -> webserver.BookPartialTarget:
+    return webserver.BookPartialTarget(
+        author_slug="solomon",
+        book="Proverbs",
+        source="Proverbs.txt",
+        start_position=1,
+        end_position=2,
+        chapter="1",
+        reference="Proverbs 1",
+    )
+
+
+class UpstreamCircuitBreakerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {webserver.BOOK_PARTIAL_CACHE_PATH_ENV: str(Path(self.tmpdir.name) / "book_partial_cache.sqlite3")},
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_upstream_breakers()
+
+    def tearDown(self) -> None:
+        webserver._reset_upstream_breakers()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_breaker_opens_after_threshold_and_half_opens_after_cooldown(self) -> None:
+        breaker = webserver._CircuitBreaker("upstream", failure_threshold=2, cooldown_seconds=0.0)
+        breaker.record_failure("boom")
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure("boom")
+        self.assertEqual(breaker.state, "open")
+
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, "half_open")
+        self.assertFalse(breaker.allow_request(), "only one half-open trial may run at a time")
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+        self.assertEqual(breaker.consecutive_failures, 0)
+
+    def test_failed_half_open_trial_reopens_breaker(self) -> None:
+        breaker = webserver._CircuitBreaker("upstream", failure_threshold=1, cooldown_seconds=0.0)
+        breaker.record_failure("down")
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure("still down")
+        self.assertEqual(breaker.state, "open")
+
+    def test_client_errors_do_not_trip_breaker(self) -> None:
+        self.assertFalse(webserver._is_upstream_health_failure(HTTPError("u", 404, "Not Found", None, None)))
+        self.assertTrue(webserver._is_upstream_health_failure(HTTPError("u", 503, "Unavailable", None, None)))
+        self.assertTrue(webserver._is_upstream_health_failure(URLError("refused")))
+
+    def test_open_upstream_is_skipped_without_network_call(self) -> None:
+        with (
+            patch.dict(os.environ, {webserver.UPSTREAM_BREAKER_FAILURES_ENV: "1"}, clear=False),
+            patch("src.webserver._resolve_pericope_book_partial_urls", return_value=[PRIMARY_URL, SECONDARY_URL]),
+            patch(
+                "src.webserver._upstream_request",
+                side_effect=URLError("connection refused"),
+            ) as upstream,
+        ):
+            payload, error = webserver._fetch_book_partial_from_pericope(_target())
+            self.assertIsNone(payload)
+            self.assertEqual(upstream.call_count, 2)
+
+            payload, error = webserver._fetch_book_partial_from_pericope(_target())
+            self.assertIsNone(payload)
+            self.assertEqual(upstream.call_count, 2, "open breakers must short-circuit")
+            self.assertIn("circuit open", error or "")
+
+    def test_status_payload_reports_breaker_state(self) -> None:
+        breaker = webserver._get_upstream_breaker(PRIMARY_URL)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure("timed out")
+
+        with patch("src.webserver._resolve_pericope_book_partial_urls", return_value=[PRIMARY_URL, SECONDARY_URL]):
+            payload = webserver._build_upstream_status_payload(detailed=True)
+
+        self.assertEqual(payload["status"], "ok")
+        self.assertEqual(payload["pericope_book_partial"]["available"], [SECONDARY_URL])
+        snapshot = next(item for item in payload["breakers"] if item["upstream"] == PRIMARY_URL)
+        self.assertEqual(snapshot["state"], "open")
+        self.assertEqual(snapshot["last_error"], "timed out")
+        self.assertIsNotNone(snapshot["retry_in_seconds"])
+
+    def test_public_status_payload_carries_only_counts_and_states(self) -> None:
+        breaker = webserver._get_upstream_breaker(PRIMARY_URL)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure("timed out connecting to 10.0.0.7")
+
+        with patch("src.webserver._resolve_pericope_book_partial_urls", return_value=[PRIMARY_URL, SECONDARY_URL]), patch(
+            "src.webserver._PSALM_LOOKUP_SOURCE", "https://pericope.invalid/api/psalms"
+        ):
+            payload = webserver._build_upstream_status_payload()
+            detailed = webserver._build_upstream_status_payload(detailed=True)
+
+        self.assertEqual(detailed["psalm_lookup"]["source"], "https://pericope.invalid/api/psalms")
+        self.assertNotIn("source", payload["psalm_lookup"])
+        self.assertEqual(payload["pericope_book_partial"]["configured"], 2)
+        self.assertEqual(payload["pericope_book_partial"]["available"], 1)
+        self.assertEqual([item["state"] for item in payload["breakers"]], ["open"])
+        self.assertNotIn("last_error", payload["psalm_lookup"]["remote"])
+        self.assertNotIn("jwks_url", payload["token_verification"])
+        self.assertNotIn("path", payload["book_partial_cache"])
+        for leaked in ("primary.invalid", "pericope.invalid", "10.0.0.7", "/var/lib"):
+            self.assertNotIn(leaked, repr(payload))
+
+    def test_operator_key_unlocks_the_detailed_view(self) -> None:
+        with patch.dict(os.environ, {webserver.OPERATOR_API_KEY_ENV: "ops-secret"}, clear=False):
+            self.assertTrue(webserver._is_operator_request({webserver.OPERATOR_AUTH_HEADER: "ops-secret"}))
+            self.assertFalse(webserver._is_operator_request({webserver.OPERATOR_AUTH_HEADER: "guess"}))
+            self.assertFalse(webserver._is_operator_request({}))
+        with patch.dict(os.environ, {webserver.OPERATOR_API_KEY_ENV: ""}, clear=False):
+            self.assertFalse(webserver._is_operator_request({webserver.OPERATOR_AUTH_HEADER: ""}))
+
+if __name__ == "__main__":
+    unittest.main()
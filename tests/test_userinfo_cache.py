@@ -0,0 +1,106 @@
+import io
+import json
+import os
+import time
+import unittest
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+
+from src import webserver
+
+
+def _userinfo_response(payload: dict) -> webserver.UpstreamResponse:
+    return webserver.UpstreamResponse(
+        url="https://auth.example/userinfo",
+        status=200,
+        reason="OK",
+        headers={},
+        body=json.dumps(payload).encode("utf-8"),
+    )
+
+
+def _http_error(code: int) -> HTTPError:
+    return HTTPError("https://auth.example/userinfo", code, "error", {}, io.BytesIO(b""))
+
+
+class TTLCacheTests(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted_at_capacity(self) -> None:
+        cache = webserver._TTLCache(max_entries=2, sweep_interval=60)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3, 60)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 3)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_sweep_purges_expired_entries_without_reading_them(self) -> None:
+        cache = webserver._TTLCache(max_entries=10, sweep_interval=0)
+        cache.set("short", 1, 0.01)
+        cache.set("long", 2, 60)
+        time.sleep(0.02)
+        cache.set("other", 3, 60)
+
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["expirations"], 1)
+
+
+class UserinfoCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        webserver._reset_auth_userinfo_cache()
+
+    def tearDown(self) -> None:
+        webserver._reset_auth_userinfo_cache()
+
+    def test_valid_token_is_served_from_cache(self) -> None:
+        with patch(
+            "src.webserver._upstream_request",
+            return_value=_userinfo_response({"sub": "user-1"}),
+        ) as upstream:
+            first = webserver._verify_userinfo_token("token-a")
+            second = webserver._verify_userinfo_token("token-a")
+
+        self.assertEqual(first, {"sub": "user-1"})
+        self.assertEqual(second, {"sub": "user-1"})
+        self.assertEqual(upstream.call_count, 1)
+        self.assertEqual(webserver._build_auth_userinfo_cache_stats()["hits"], 1)
+
+    def test_rejected_token_is_negatively_cached(self) -> None:
+        with patch("src.webserver._upstream_request", side_effect=_http_error(401)) as upstream:
+            for _ in range(3):
+                with self.assertRaisesRegex(ValueError, "rejected token \\(401\\)"):
+                    webserver._verify_userinfo_token("bad-token")
+
+        self.assertEqual(upstream.call_count, 1)
+
+    def test_negative_entries_expire(self) -> None:
+        with (
+            patch.dict(os.environ, {webserver.AUTH_USERINFO_NEGATIVE_TTL_SECONDS_ENV: "0.01"}, clear=False),
+            patch("src.webserver._upstream_request", side_effect=_http_error(401)) as upstream,
+        ):
+            with self.assertRaises(ValueError):
+                webserver._verify_userinfo_token("bad-token")
+            time.sleep(0.02)
+            with self.assertRaises(ValueError):
+                webserver._verify_userinfo_token("bad-token")
+
+        self.assertEqual(upstream.call_count, 2)
+
+    def test_upstream_outages_are_not_cached(self) -> None:
+        with patch("src.webserver._upstream_request", side_effect=URLError("refused")) as upstream:
+            for _ in range(2):
+                with self.assertRaisesRegex(ValueError, "Userinfo unavailable"):
+                    webserver._verify_userinfo_token("token-a")
+
+        self.assertEqual(upstream.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from email.message import Message
+from functools import partial
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+from src import webserver
+
+AUDIO = b"RIFF" + bytes(range(256)) * 64
+
+
+class _FakeAudioStream:
+    def __init__(self, body: bytes) -> None:
+        self.headers = Message()
+        self.headers["Content-Type"] = "audio/wav"
+        self._body = body
+        self.closed = False
+
+    def iter_chunks(self, chunk_size: int):
+        for offset in range(0, len(self._body), chunk_size):
+            yield self._body[offset : offset + chunk_size]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class VibeVoiceAudioCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.VIBEVOICE_AUDIO_CACHE_DIR_ENV: self.tmpdir.name,
+                webserver.VIBEVOICE_FALLBACK_API_BASE_ENV: "",
+            },
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_vibevoice_audio_cache()
+
+    def tearDown(self) -> None:
+        webserver._reset_vibevoice_audio_cache()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def _wait_for_entries(self, count: int) -> None:
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if webserver._build_vibevoice_audio_cache_stats()["entries"] >= count:
+                return
+            time.sleep(0.01)
+        self.fail("audio was not cached")
+
+    def test_completed_job_audio_is_served_from_cache_on_the_next_request(self) -> None:
+        job_responses = [
+            {"job_id": "job-1", "status": "queued"},
+            {"job_id": "job-1", "status": "completed", "audio_url": "/files/audio/vibevoice/job-1.wav", "engine": "vibevoice"},
+        ]
+        with patch("src.webserver._fetch_vibevoice_json", side_effect=job_responses) as fetch_json, patch(
+            "src.webserver._open_vibevoice_audio_stream", return_value=_FakeAudioStream(AUDIO)
+        ) as open_audio:
+            payload, error, status = webserver._build_vibevoice_job_payload({"text": "The  LORD is my shepherd"})
+            self.assertEqual(status, webserver.HTTPStatus.ACCEPTED)
+            self.assertEqual(payload["cache_status"], "miss")
+
+            webserver._build_vibevoice_job_status_payload("job-1")
+            self._wait_for_entries(1)
+
+            # Whitespace differences normalize to the same key; no upstream call is made.
+            payload, error, status = webserver._build_vibevoice_job_payload({"text": "The LORD is my shepherd"})
+
+        self.assertIsNone(error)
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        self.assertEqual(fetch_json.call_count, 2)
+        open_audio.assert_called_once_with("/files/audio/vibevoice/job-1.wav")
+        self.assertEqual(payload["status"], "completed")
+        self.assertEqual(payload["cache_status"], "hit")
+        self.assertEqual(payload["engine"], "vibevoice")
+        self.assertTrue(payload["proxy_audio_url"].startswith(f"{webserver.VIBEVOICE_CACHED_AUDIO_API_PATH}/"))
+
+        status_payload, _error, status = webserver._build_vibevoice_job_status_payload(payload["job_id"])
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        self.assertEqual(status_payload["proxy_audio_url"], payload["proxy_audio_url"])
+
+    def test_speaker_and_cfg_scale_are_part_of_the_key(self) -> None:
+        base = webserver._vibevoice_audio_cache_key("Psalm 23", "Carter", 1.5, "voice-gateway")
+
+        self.assertEqual(base, webserver._vibevoice_audio_cache_key("Psalm 23", "Carter", "1.5", "voice-gateway"))
+        self.assertNotEqual(base, webserver._vibevoice_audio_cache_key("Psalm 23", "Frank", 1.5, "voice-gateway"))
+        self.assertNotEqual(base, webserver._vibevoice_audio_cache_key("Psalm 23", "Carter", 2.0, "voice-gateway"))
+        self.assertNotEqual(base, webserver._vibevoice_audio_cache_key("Psalm 23", "Carter", 1.5, "azure-speech"))
+
+    def test_least_recently_used_audio_is_evicted_past_the_size_bound(self) -> None:
+        cache = webserver._AudioFileCache(Path(self.tmpdir.name), max_bytes=2500)
+        for key in ("a", "b", "c"):
+            source = Path(self.tmpdir.name) / f"{key}.partial"
+            source.write_bytes(b"x" * 1000)
+            self.assertTrue(cache.put_file(key, source, content_type="audio/wav", engine="vibevoice"))
+            if key == "b":
+                cache.get("a")
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertFalse(cache.path_for("b").exists())
+        self.assertEqual(cache.stats()["bytes"], 2000)
+
+    def test_cached_audio_route_supports_range_requests(self) -> None:
+        cache = webserver._get_vibevoice_audio_cache()
+        key = webserver._vibevoice_audio_cache_key("Wisdom 7", "Carter", 1.5, "voice-gateway")
+        source = Path(self.tmpdir.name) / "upload.partial"
+        source.write_bytes(AUDIO)
+        cache.put_file(key, source, content_type="audio/wav", engine="vibevoice")
+
+        site = ThreadingHTTPServer(("127.0.0.1", 0), partial(webserver.ClockRequestHandler, directory=self.tmpdir.name))
+        site.daemon_threads = True
+        threading.Thread(target=site.serve_forever, daemon=True).start()
+        self.addCleanup(site.server_close)
+        self.addCleanup(site.shutdown)
+
+        def get(headers: dict[str, str]):
+            connection = HTTPConnection("127.0.0.1", site.server_address[1], timeout=10)
+            self.addCleanup(connection.close)
+            connection.request("GET", f"{webserver.VIBEVOICE_CACHED_AUDIO_API_PATH}/{key}", headers=headers)
+            response = connection.getresponse()
+            return response, response.read()
+
+        with patch.object(webserver.ClockRequestHandler, "log_message"):
+            response, body = get({})
+            self.assertEqual(response.status, 200)
+            self.assertEqual(body, AUDIO)
+
+            response, body = get({"Range": "bytes=4-99"})
+            self.assertEqual(response.status, 206)
+            self.assertEqual(response.headers["Content-Range"], f"bytes 4-99/{len(AUDIO)}")
+            self.assertEqual(body, AUDIO[4:100])
+
+            response, body = get({"Range": "bytes=-10"})
+            self.assertEqual(body, AUDIO[-10:])
+
+            response, _body = get({"Range": f"bytes={len(AUDIO)}-"})
+            self.assertEqual(response.status, 416)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import re
+import tempfile
+import threading
+import time
+import unittest
+from functools import partial
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from src import webserver
+
+AUDIO = bytes(range(256)) * 1024
+
+
+class _StubAudioHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - BaseHTTPRequestHandler signature
+        return
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self.server.requests.append((self.path, "HEAD"))
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/wav")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(AUDIO)))
+        self.end_headers()
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.requests.append((self.path, self.headers.get("Range")))
+        if self.path == "/files/slow.wav":
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/wav")
+            self.send_header("Content-Length", str(len(AUDIO)))
+            self.end_headers()
+            self.wfile.write(AUDIO[:4096])
+            self.wfile.flush()
+            self.server.release.wait(5)
+            self.wfile.write(AUDIO[4096:])
+            return
+
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if match is None:
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/wav")
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(len(AUDIO)))
+            self.end_headers()
+            self.wfile.write(AUDIO)
+            return
+
+        start = int(match.group(1))
+        end = int(match.group(2) or len(AUDIO) - 1)
+        if start >= len(AUDIO):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(AUDIO)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = AUDIO[start : end + 1]
+        self.send_response(206)
+        self.send_header("Content-Type", "audio/wav")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(AUDIO)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class VibeVoiceAudioStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        webserver._reset_upstream_pools()
+        self.upstream = ThreadingHTTPServer(("127.0.0.1", 0), _StubAudioHandler)
+        self.upstream.requests = []
+        self.upstream.release = threading.Event()
+        threading.Thread(target=self.upstream.serve_forever, daemon=True).start()
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.site = ThreadingHTTPServer(
+            ("127.0.0.1", 0), partial(webserver.ClockRequestHandler, directory=self.tmpdir.name)
+        )
+        self.site.daemon_threads = True
+        threading.Thread(target=self.site.serve_forever, daemon=True).start()
+
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.VIBEVOICE_API_BASE_ENV: f"http://127.0.0.1:{self.upstream.server_address[1]}",
+                webserver.VIBEVOICE_FALLBACK_API_BASE_ENV: "",
+                webserver.VIBEVOICE_API_TOKEN_ENV: "",
+                webserver.FORTRESS_VIBEVOICE_API_TOKEN_ENV: "",
+                webserver.VIBEVOICE_AUDIO_CACHE_DIR_ENV: self.tmpdir.name,
+            },
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_vibevoice_audio_cache()
+
+    def tearDown(self) -> None:
+        self.upstream.release.set()
+        self.env.stop()
+        self.site.shutdown()
+        self.site.server_close()
+        self.upstream.shutdown()
+        self.upstream.server_close()
+        webserver._reset_upstream_pools()
+        webserver._reset_vibevoice_audio_cache()
+        self.tmpdir.cleanup()
+
+    def _get(self, audio_path: str, headers: dict[str, str] | None = None, method: str = "GET"):
+        connection = HTTPConnection("127.0.0.1", self.site.server_address[1], timeout=10)
+        self.addCleanup(connection.close)
+        connection.request(method, webserver._build_vibevoice_proxy_audio_url(audio_path), headers=headers or {})
+        return connection.getresponse()
+
+    def test_full_download_is_relayed_with_length_and_range_support(self) -> None:
+        response = self._get("/files/audio/full.wav")
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.headers["Content-Type"], "audio/wav")
+        self.assertEqual(response.headers["Content-Length"], str(len(AUDIO)))
+        self.assertEqual(response.headers["Accept-Ranges"], "bytes")
+        self.assertEqual(response.read(), AUDIO)
+
+    def test_range_request_is_forwarded_and_answered_with_partial_content(self) -> None:
+        response = self._get("/files/audio/full.wav", {"Range": "bytes=1000-1999"})
+
+        self.assertEqual(response.status, 206)
+        self.assertEqual(response.headers["Content-Range"], f"bytes 1000-1999/{len(AUDIO)}")
+        self.assertEqual(response.read(), AUDIO[1000:2000])
+        self.assertEqual(self.upstream.requests[-1], ("/files/audio/full.wav", "bytes=1000-1999"))
+
+    def test_unsatisfiable_range_is_reported_as_416(self) -> None:
+        response = self._get("/files/audio/full.wav", {"Range": f"bytes={len(AUDIO)}-"})
+
+        self.assertEqual(response.status, 416)
+        self.assertEqual(response.headers["Content-Range"], f"bytes */{len(AUDIO)}")
+        response.read()
+
+    def test_first_bytes_arrive_before_the_upstream_finishes(self) -> None:
+        response = self._get("/files/slow.wav")
+
+        self.assertEqual(response.status, 200)
+        # The upstream is still holding back everything past the first 4 KiB.
+        self.assertEqual(response.read(4096), AUDIO[:4096])
+        self.upstream.release.set()
+        self.assertEqual(response.read(), AUDIO[4096:])
+
+    def test_fully_read_stream_returns_its_connection_to_the_pool(self) -> None:
+        for _ in range(2):
+            self.assertEqual(self._get("/files/audio/full.wav").read(), AUDIO)
+            # The proxy releases the upstream connection just after the last byte is relayed.
+            deadline = time.monotonic() + 5
+            while webserver._build_upstream_pool_stats()[0]["idle"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        (stats,) = webserver._build_upstream_pool_stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["reused"], 1)
+
+    def test_head_requests_return_their_connection_to_the_pool(self) -> None:
+        for _ in range(2):
+            response = self._get("/files/audio/full.wav", method="HEAD")
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader("Content-Length"), str(len(AUDIO)))
+            self.assertEqual(response.read(), b"")
+            deadline = time.monotonic() + 5
+            while webserver._build_upstream_pool_stats()[0]["idle"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        (stats,) = webserver._build_upstream_pool_stats()
+        self.assertEqual(stats["created"], 1)
+        self.assertEqual(stats["reused"], 1)
+        self.assertEqual(self.upstream.requests, [("/files/audio/full.wav", "HEAD")] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+import wave
+from email.message import Message
+from unittest.mock import patch
+
+from src import webserver
+
+SENTENCES = [f"Verse {index} sings of mercy and of judgment before the LORD." for index in range(1, 41)]
+LONG_TEXT = " ".join(SENTENCES)
+
+
+def _wav_bytes(frames: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(24000)
+        output.writeframes(b"\x01\x00" * frames)
+    return buffer.getvalue()
+
+
+class _FakeAudioStream:
+    def __init__(self, body: bytes) -> None:
+        self.headers = Message()
+        self.headers["Content-Type"] = "audio/wav"
+        self._body = body
+
+    def iter_chunks(self, chunk_size: int):
+        yield self._body
+
+    def close(self) -> None:
+        return
+
+
+class _FakeVoiceService:
+    def __init__(self) -> None:
+        self.jobs: dict[str, dict] = {}
+        self.submitted: list[str] = []
+
+    def fetch_json(self, path, *, payload=None, timeout=20.0, base_url=None):
+        if payload is not None:
+            job_id = f"job-{len(self.submitted)}"
+            self.submitted.append(payload["turns"][0]["text"])
+            self.jobs[job_id] = {"job_id": job_id, "status": "queued"}
+            return dict(self.jobs[job_id])
+        return dict(self.jobs[path.rsplit("/", 1)[-1]])
+
+    def complete(self, job_id: str) -> None:
+        self.jobs[job_id].update(status="completed", audio_url=f"/files/audio/vibevoice/{job_id}.wav", engine="vibevoice")
+
+    def open_audio(self, audio_url, **_kwargs):
+        index = int(audio_url.rsplit("-", 1)[-1].removesuffix(".wav"))
+        return _FakeAudioStream(_wav_bytes(100 + index))
+
+
+class ChunkedSynthesisTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.VIBEVOICE_AUDIO_CACHE_DIR_ENV: self.tmpdir.name,
+                webserver.VIBEVOICE_FALLBACK_API_BASE_ENV: "",
+                webserver.VIBEVOICE_CHUNK_CHARS_ENV: "600",
+                webserver.VIBEVOICE_JOB_POLL_MS_ENV: "20",
+            },
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_vibevoice_audio_cache()
+        webserver._reset_vibevoice_job_tracker()
+
+    def tearDown(self) -> None:
+        webserver._reset_vibevoice_job_tracker()
+        webserver._reset_vibevoice_audio_cache()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_split_keeps_sentences_whole_and_the_first_chunk_short(self) -> None:
+        chunks = webserver._split_tts_text(LONG_TEXT, 600)
+
+        self.assertEqual(" ".join(chunks), LONG_TEXT)
+        self.assertLessEqual(len(chunks[0]), 300)
+        self.assertTrue(all(len(chunk) <= 600 for chunk in chunks))
+        self.assertTrue(all(chunk.endswith(".") for chunk in chunks))
+
+        self.assertTrue(all(len(chunk) <= 60 for chunk in webserver._split_tts_text("word " * 50, 60)))
+
+    def test_short_text_stays_a_single_job(self) -> None:
+        service = _FakeVoiceService()
+        with patch("src.webserver._fetch_vibevoice_json", side_effect=service.fetch_json):
+            payload, _error, _status = webserver._build_vibevoice_job_payload({"text": SENTENCES[0]})
+
+        self.assertEqual(payload["job_id"], "job-0")
+        self.assertNotIn("chunks", payload)
+
+    def test_long_text_is_synthesized_in_parallel_chunks_and_reassembled(self) -> None:
+        service = _FakeVoiceService()
+        with patch("src.webserver._fetch_vibevoice_json", side_effect=service.fetch_json), patch(
+            "src.webserver._open_vibevoice_audio_stream", side_effect=service.open_audio
+        ):
+            payload, error, status = webserver._build_vibevoice_job_payload({"text": LONG_TEXT})
+            self.assertIsNone(error)
+            self.assertEqual(status, webserver.HTTPStatus.ACCEPTED)
+            job_id = payload["job_id"]
+            chunk_count = payload["chunk_count"]
+            self.assertGreater(chunk_count, 2)
+            self.assertEqual(sorted(service.submitted), sorted(webserver._split_tts_text(LONG_TEXT, 600)))
+            self.assertEqual(payload["revision"], f"running:0/{chunk_count}")
+
+            # The first chunk becomes playable while the rest are still synthesizing.
+            service.complete("job-0")
+            payload, _error, _status = webserver._build_tracked_vibevoice_job_payload(
+                job_id, {"wait": ["5"], "since": [payload["revision"]]}
+            )
+            self.assertEqual(payload["status"], "running")
+            self.assertEqual(payload["chunks"][0]["status"], "completed")
+            self.assertTrue(payload["chunks"][0]["proxy_audio_url"])
+
+            for index in range(1, chunk_count):
+                service.complete(f"job-{index}")
+            deadline = time.monotonic() + 5
+            while payload["status"] != "completed" and time.monotonic() < deadline:
+                payload, _error, _status = webserver._build_tracked_vibevoice_job_payload(
+                    job_id, {"wait": ["1"], "since": [payload["revision"]]}
+                )
+            self.assertEqual(payload["status"], "completed")
+
+            cached = None
+            while cached is None and time.monotonic() < deadline:
+                webserver._build_chunked_vibevoice_job_payload(job_id)
+                time.sleep(0.02)
+                cached, _error, _status = webserver._build_vibevoice_job_payload({"text": LONG_TEXT})
+                cached = cached if cached.get("cache_status") == "hit" else None
+
+        self.assertIsNotNone(cached)
+        self.assertEqual(len(service.submitted), chunk_count)
+        cache = webserver._get_vibevoice_audio_cache()
+        entry = cache.get(cached["job_id"].removeprefix("cache-"))
+        with wave.open(str(entry["path"]), "rb") as combined:
+            self.assertEqual(combined.getnframes(), sum(100 + index for index in range(chunk_count)))
+
+    def test_concurrent_requests_for_the_same_text_share_one_submission(self) -> None:
+        service = _FakeVoiceService()
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch(path, **kwargs):
+            entered.set()
+            release.wait(5)
+            return service.fetch_json(path, **kwargs)
+
+        results: list = []
+        with patch("src.webserver._fetch_vibevoice_json", side_effect=slow_fetch):
+            threads = [
+                threading.Thread(target=lambda: results.append(webserver._build_vibevoice_job_payload({"text": LONG_TEXT})))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            entered.wait(5)
+            time.sleep(0.05)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        chunk_count = len(webserver._split_tts_text(LONG_TEXT, 600))
+        self.assertEqual(len(service.submitted), chunk_count)
+        self.assertEqual({payload["job_id"] for payload, _error, _status in results}, {results[0][0]["job_id"]})
+
+    def test_a_retry_only_resubmits_the_chunks_that_failed(self) -> None:
+        service = _FakeVoiceService()
+        chunks = webserver._split_tts_text(LONG_TEXT, 600)
+        broken = {chunks[1]}
+
+        def flaky_fetch(path, **kwargs):
+            payload = kwargs.get("payload")
+            if payload is not None and payload["turns"][0]["text"] in broken:
+                raise ValueError("VibeVoice service unavailable: timed out")
+            return service.fetch_json(path, **kwargs)
+
+        with patch("src.webserver._fetch_vibevoice_json", side_effect=flaky_fetch):
+            payload, error, status = webserver._build_vibevoice_job_payload({"text": LONG_TEXT})
+            self.assertIsNone(payload)
+            self.assertIn("timed out", error)
+            self.assertEqual(len(service.submitted), len(chunks) - 1)
+
+            broken.clear()
+            payload, error, status = webserver._build_vibevoice_job_payload({"text": LONG_TEXT})
+
+        self.assertIsNone(error)
+        self.assertEqual(status, webserver.HTTPStatus.ACCEPTED)
+        self.assertEqual(len(service.submitted), len(chunks))
+        self.assertEqual(service.submitted[-1], chunks[1])
+        self.assertEqual([chunk["status"] for chunk in payload["chunks"]], ["queued"] * len(chunks))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import io
+import os
+import tempfile
+import unittest
+from email.message import Message
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
+
+from src import webserver
+
+PRIMARY = "http://primary.voice.test"
+FALLBACK = "http://fallback.voice.test"
+
+
+class VibeVoiceHealthMonitorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.VIBEVOICE_API_BASE_ENV: PRIMARY,
+                webserver.VIBEVOICE_FALLBACK_API_BASE_ENV: FALLBACK,
+                webserver.VIBEVOICE_AUDIO_CACHE_DIR_ENV: self.tmpdir.name,
+            },
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_vibevoice_health_monitor()
+        webserver._reset_vibevoice_audio_cache()
+
+    def tearDown(self) -> None:
+        webserver._reset_vibevoice_health_monitor()
+        webserver._reset_vibevoice_audio_cache()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_probes_mark_a_route_down_after_repeated_failures_and_up_on_recovery(self) -> None:
+        monitor = webserver._get_vibevoice_health_monitor()
+        outcomes = {PRIMARY: [URLError("refused"), URLError("refused"), None], FALLBACK: [None, None, None]}
+
+        def upstream(url, **_kwargs):
+            outcome = outcomes[url.removesuffix("/health")].pop(0)
+            if outcome is not None:
+                raise outcome
+
+        with patch("src.webserver._upstream_request", side_effect=upstream), patch("builtins.print") as log:
+            monitor.probe_all()
+            self.assertEqual(monitor.state("primary"), "up")
+            monitor.probe_all()
+            self.assertTrue(monitor.is_down("primary"))
+            self.assertEqual(monitor.state("fallback"), "up")
+            monitor.probe_all()
+
+        snapshot = monitor.snapshot()
+        self.assertEqual(snapshot["probes"], 6)
+        primary = snapshot["routes"]["primary"]
+        self.assertEqual(primary["state"], "up")
+        self.assertEqual(primary["consecutive_failures"], 0)
+        self.assertIsNotNone(primary["last_failure_at"])
+        self.assertIsNotNone(primary["latency_ms"])
+        self.assertNotIn("refused", repr(snapshot))
+        self.assertNotIn("history", primary)
+        self.assertIn("refused", " ".join(str(arg) for call in log.call_args_list for arg in call.args))
+
+    def test_client_error_answers_count_as_reachable(self) -> None:
+        monitor = webserver._get_vibevoice_health_monitor()
+        missing = HTTPError(f"{PRIMARY}/health", 404, "Not Found", Message(), io.BytesIO(b""))
+        broken = HTTPError(f"{PRIMARY}/health", 503, "Unavailable", Message(), io.BytesIO(b""))
+
+        with patch("src.webserver._upstream_request", side_effect=missing), patch("builtins.print"):
+            monitor.probe("primary", PRIMARY)
+            monitor.probe("primary", PRIMARY)
+        self.assertEqual(monitor.state("primary"), "up")
+
+        with patch("src.webserver._upstream_request", side_effect=broken), patch("builtins.print"):
+            monitor.probe("primary", PRIMARY)
+            monitor.probe("primary", PRIMARY)
+        self.assertEqual(monitor.state("primary"), "down")
+
+    def test_probe_delay_stays_within_the_jitter_band(self) -> None:
+        monitor = webserver._VibeVoiceHealthMonitor(interval=10.0, jitter=0.2)
+
+        delays = [monitor.next_delay() for _ in range(200)]
+
+        self.assertTrue(all(8.0 <= delay <= 12.0 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+        self.assertFalse(webserver._VibeVoiceHealthMonitor(interval=0, jitter=0.2).start())
+
+    def test_submission_skips_a_primary_the_monitor_has_marked_down(self) -> None:
+        monitor = webserver._get_vibevoice_health_monitor()
+        with patch("builtins.print"):
+            for _ in range(webserver.VIBEVOICE_HEALTH_DOWN_AFTER):
+                monitor.record("primary", False, 5000.0, "VibeVoice service unavailable: timed out")
+        monitor.record("fallback", True, 40.0)
+
+        with patch(
+            "src.webserver._fetch_vibevoice_json", return_value={"job_id": "azv-1", "status": "queued"}
+        ) as fetch_json:
+            payload, error, status = webserver._build_vibevoice_job_payload({"text": "Blessed is the man"})
+
+        self.assertIsNone(error)
+        self.assertEqual(status, webserver.HTTPStatus.ACCEPTED)
+        self.assertEqual(payload["proxy_route"], "fallback")
+        fetch_json.assert_called_once()
+        self.assertEqual(fetch_json.call_args.kwargs["base_url"], FALLBACK)
+
+    def test_submission_outcomes_feed_the_monitor(self) -> None:
+        responses = [ValueError("VibeVoice service unavailable: refused"), {"job_id": "azv-2", "status": "queued"}]
+        with patch("src.webserver._fetch_vibevoice_json", side_effect=responses):
+            payload, _error, _status = webserver._build_vibevoice_job_payload({"text": "Wisdom crieth without"})
+
+        self.assertEqual(payload["proxy_route"], "fallback")
+        routes = webserver._get_vibevoice_health_monitor().snapshot()["routes"]
+        self.assertEqual(routes["primary"]["consecutive_failures"], 1)
+        self.assertEqual(routes["fallback"]["state"], "up")
+        self.assertIsNotNone(routes["fallback"]["last_ok_at"])
+
+    def test_health_payload_is_served_from_memory(self) -> None:
+        webserver._get_vibevoice_health_monitor().record("primary", True, 12.5)
+
+        with patch("src.webserver._upstream_request") as upstream:
+            payload = webserver._build_vibevoice_health_payload()
+
+        upstream.assert_not_called()
+        self.assertEqual(payload["primary"]["state"], "up")
+        self.assertEqual(payload["fallback"]["state"], "unknown")
+        self.assertEqual(payload["monitor"]["routes"]["primary"]["avg_latency_ms"], 12.5)
+        self.assertNotIn(PRIMARY, repr(payload))
+
+
+if __name__ == "__main__":
+    unittest.main()
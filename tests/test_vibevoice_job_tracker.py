@@ -0,0 +1,113 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src import webserver
+
+
+class VibeVoiceJobTrackerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {
+                webserver.VIBEVOICE_JOB_POLL_MS_ENV: "20",
+                webserver.VIBEVOICE_AUDIO_CACHE_DIR_ENV: self.tmpdir.name,
+            },
+            clear=False,
+        )
+        self.env.start()
+        webserver._reset_vibevoice_audio_cache()
+        webserver._reset_vibevoice_job_tracker()
+
+    def tearDown(self) -> None:
+        webserver._reset_vibevoice_job_tracker()
+        webserver._reset_vibevoice_audio_cache()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_many_listeners_share_one_upstream_poll_loop(self) -> None:
+        statuses = iter(["queued", "running", "running", "completed"])
+
+        def upstream(job_id):
+            status = next(statuses, "completed")
+            payload = {"job_id": job_id, "status": status}
+            if status == "completed":
+                payload["audio_url"] = "/files/audio/vibevoice/job-1.wav"
+            return payload, None, webserver.HTTPStatus.OK
+
+        results = []
+
+        def listen() -> None:
+            payload = {"status": "queued"}
+            while payload["status"] != "completed":
+                payload, _error, _status = webserver._build_tracked_vibevoice_job_payload(
+                    "job-1", {"wait": ["5"], "since": [payload["status"]]}
+                )
+            results.append(payload)
+
+        with patch("src.webserver._build_vibevoice_job_status_payload", side_effect=upstream) as polled:
+            webserver._get_vibevoice_job_tracker().track({"job_id": "job-1", "status": "queued"})
+            listeners = [threading.Thread(target=listen) for _ in range(8)]
+            for listener in listeners:
+                listener.start()
+            for listener in listeners:
+                listener.join(10)
+
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result["audio_url"].endswith("job-1.wav") for result in results))
+        self.assertEqual(polled.call_count, 4)
+        self.assertEqual(webserver._get_vibevoice_job_tracker().stats()["upstream_polls"], 4)
+
+    def test_wait_returns_the_current_status_when_nothing_changes(self) -> None:
+        with patch(
+            "src.webserver._build_vibevoice_job_status_payload",
+            return_value=({"job_id": "job-2", "status": "running"}, None, webserver.HTTPStatus.OK),
+        ) as polled:
+            started = time.monotonic()
+            payload, error, status = webserver._build_tracked_vibevoice_job_payload(
+                "job-2", {"wait": ["0.2"], "since": ["running"]}
+            )
+
+        self.assertIsNone(error)
+        self.assertEqual(status, webserver.HTTPStatus.OK)
+        self.assertEqual(payload["status"], "running")
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertGreaterEqual(polled.call_count, 2)
+
+    def test_plain_status_reads_are_served_from_the_tracker(self) -> None:
+        webserver._get_vibevoice_job_tracker().track({"job_id": "job-3", "status": "running"})
+
+        with patch("src.webserver._build_vibevoice_job_status_payload") as polled:
+            payload, _error, _status = webserver._build_tracked_vibevoice_job_payload("job-3", {})
+
+        self.assertEqual(payload["status"], "running")
+        polled.assert_not_called()
+
+    def test_unknown_job_is_reported_as_failed_to_waiting_listeners(self) -> None:
+        webserver._get_vibevoice_job_tracker().track({"job_id": "job-4", "status": "queued"})
+
+        with patch(
+            "src.webserver._build_vibevoice_job_status_payload",
+            return_value=(None, "VibeVoice request failed (404).", webserver.HTTPStatus.NOT_FOUND),
+        ):
+            payload, _error, _status = webserver._build_tracked_vibevoice_job_payload(
+                "job-4", {"wait": ["5"], "since": ["queued"]}
+            )
+
+        self.assertEqual(payload["status"], "failed")
+        self.assertIn("404", payload["detail"])
+
+    def test_invalid_wait_is_rejected(self) -> None:
+        payload, error, status = webserver._build_tracked_vibevoice_job_payload("job-5", {"wait": ["soon"]})
+
+        self.assertIsNone(payload)
+        self.assertEqual(status, webserver.HTTPStatus.BAD_REQUEST)
+        self.assertIn("wait", error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 import os
+import tempfile
 import unittest
 from http import HTTPStatus
 from unittest.mock import patch
 
+from src import webserver
 from src.webserver import (
     _annotate_vibevoice_response,
     _build_vibevoice_health_payload,
@@ -11,6 +13,17 @@ from src.webserver import (
 
 
 class VibeVoiceObservabilityTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {webserver.VIBEVOICE_AUDIO_CACHE_DIR_ENV: self.tmpdir.name}, clear=False)
+        self.env.start()
+        webserver._reset_vibevoice_audio_cache()
+
+    def tearDown(self) -> None:
+        webserver._reset_vibevoice_audio_cache()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
     def test_health_payload_exposes_configuration_without_token_value(self) -> None:
         with patch.dict(
             os.environ,
@@ -47,6 +60,19 @@ class VibeVoiceObservabilityTests(unittest.TestCase):
         self.assertEqual(payload["status"], "configured")
         self.assertFalse(payload["token_configured"])
 
+    def test_public_health_payload_hides_cache_path_and_timezones(self) -> None:
+        with patch.dict(os.environ, {webserver.TTS_PRESYNTH_TIMEZONES_ENV: "Europe/Athens"}, clear=False):
+            public = _build_vibevoice_health_payload()
+            detailed = _build_vibevoice_health_payload(detailed=True)
+
+        self.assertEqual(public["audio_cache"]["entries"], 0)
+        self.assertTrue(public["audio_cache"]["healthy"])
+        self.assertEqual(public["presynthesis"]["timezones"], 1)
+        self.assertNotIn(self.tmpdir.name, repr(public))
+        self.assertNotIn("Europe/Athens", repr(public))
+        self.assertEqual(detailed["audio_cache"]["path"], self.tmpdir.name)
+        self.assertEqual(detailed["presynthesis"]["timezones"], ["Europe/Athens"])
+
     def test_job_annotation_infers_fallback_engine_and_proxy_audio_url(self) -> None:
         payload = _annotate_vibevoice_response(
             {
@@ -531,6 +531,8 @@ let historySyncPendingTimer = null;
 let historySyncLastSerializedState = "";
 let historySyncNeedsFlush = false;
 let historySyncScopeKey = "";
+let historySyncCursor = null;
+let historySyncAckedEntries = {};
 let pericopeSessionSyncTimer = null;
 let pericopeSessionSyncInFlight = null;
 let pericopeSessionSyncQueued = false;
@@ -631,6 +633,8 @@ const BOOK_PARTIAL_API_ENDPOINT = "/api/pericope/book-partial";
 const CLIENT_ERRORS_API_ENDPOINT = "/api/client-errors";
 const VIBEVOICE_TTS_JOBS_API_ENDPOINT = "/api/vibevoice/tts/jobs";
 const VIBEVOICE_HEALTH_API_ENDPOINT = "/api/vibevoice/health";
+const VIBEVOICE_JOB_WAIT_SECONDS = 25;
+const VIBEVOICE_JOB_TIMEOUT_MS = 240000;
 const CLOCK_STATIC_DATA_VERSION = "20260620-spirit-brass1";
 const ENABLE_REMOTE_SCRIPTURE_FETCH = true;
 const CLIENT_ERROR_DEDUPE_WINDOW_MS = 90_000;
@@ -6316,7 +6320,32 @@ async function fetchHistorySyncState(access) {
   }
 
   const payload = await response.json();
-  return normalizeDailyActionState(payload?.state || {});
+  const remoteState = normalizeDailyActionState(payload?.state || {});
+  resetHistorySyncCursor(payload?.cursor, remoteState);
+  return remoteState;
+}
+
+function serializeHistorySyncEntry(entry) {
+  return JSON.stringify(normalizeDailyActionEntry(entry));
+}
+
+function resetHistorySyncCursor(cursor = null, ackedState = {}) {
+  historySyncCursor = Number.isInteger(cursor) ? cursor : null;
+  historySyncAckedEntries = {};
+  Object.entries(ackedState).forEach(([dateKey, entry]) => {
+    historySyncAckedEntries[dateKey] = serializeHistorySyncEntry(entry);
+  });
+}
+
+function collectHistorySyncChanges(state) {
+  // Only days that differ from what the server last acknowledged travel in a delta sync.
+  const changes = {};
+  Object.entries(normalizeDailyActionState(state)).forEach(([dateKey, entry]) => {
+    if (historySyncCursor === null || historySyncAckedEntries[dateKey] !== serializeHistorySyncEntry(entry)) {
+      changes[dateKey] = entry;
+    }
+  });
+  return changes;
 }
 
 async function pushHistorySyncState(access, state) {
@@ -6324,6 +6353,7 @@ async function pushHistorySyncState(access, state) {
     return null;
   }
 
+  const changes = collectHistorySyncChanges(state);
   let response;
   try {
     response = await window.fetch(HISTORY_SYNC_API_PATH, {
@@ -6333,7 +6363,7 @@ async function pushHistorySyncState(access, state) {
         ...access.headers,
       },
       credentials: "same-origin",
-      body: JSON.stringify({ state: normalizeDailyActionState(state) }),
+      body: JSON.stringify({ cursor: historySyncCursor, changes }),
     });
   } catch (error) {
     reportClientError("history_sync_post_fetch_error", {
@@ -6353,7 +6383,19 @@ async function pushHistorySyncState(access, state) {
   }
 
   const payload = await response.json();
-  return normalizeDailyActionState(payload?.state || {});
+  const remoteChanges = normalizeDailyActionState(payload?.changes || {});
+  if (payload?.reset) {
+    resetHistorySyncCursor(payload?.cursor, remoteChanges);
+  } else {
+    historySyncCursor = Number.isInteger(payload?.cursor) ? payload.cursor : null;
+    Object.entries(changes).forEach(([dateKey, entry]) => {
+      historySyncAckedEntries[dateKey] = serializeHistorySyncEntry(entry);
+    });
+    Object.entries(remoteChanges).forEach(([dateKey, entry]) => {
+      historySyncAckedEntries[dateKey] = serializeHistorySyncEntry(entry);
+    });
+  }
+  return remoteChanges;
 }
 
 async function flushHistorySync() {
@@ -6362,6 +6404,9 @@ async function flushHistorySync() {
     return;
   }
 
+  if (historySyncScopeKey !== access.scopeKey) {
+    resetHistorySyncCursor();
+  }
   historySyncScopeKey = access.scopeKey;
   const serialized = serializeDailyActionState(loadDailyActionState());
   if (historySyncReady && serialized === historySyncLastSerializedState) {
@@ -8640,7 +8685,7 @@ async function speakDrawerMeditation() {
     }
     setDrawerSpeechStatus(`Playing ${getDrawerTabLabel(uiState.drawerTab)} meditation via ${audioResult.engineLabel}.`, { sticky: true });
     renderDrawerAudioControls();
-    await playVibeVoiceAudioUrl(audioResult.audioUrl, token, "reader");
+    await playVibeVoiceAudioResult(audioResult, token, "reader");
     if (token !== scriptureReaderSpeechToken) {
       return;
     }
@@ -8718,6 +8763,43 @@ function buildVibeVoiceAudioResult(job, audioUrl) {
   };
 }
 
+function getVibeVoiceChunkAudioUrl(job, index) {
+  const chunk = Array.isArray(job?.chunks) ? job.chunks[index] : null;
+  if (!chunk) {
+    return "";
+  }
+  if (chunk.status === "failed") {
+    throw new Error(chunk.detail || "VibeVoice audio generation failed.");
+  }
+  return chunk.status === "completed" ? String(chunk.proxy_audio_url || chunk.audio_url || "").trim() : "";
+}
+
+async function waitForVibeVoiceJob(jobId, initialJob, { token, tokenType, isReady }) {
+  let job = initialJob;
+  const deadline = Date.now() + VIBEVOICE_JOB_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    const activeToken = tokenType === "bundle" ? bundleSpeechToken : scriptureReaderSpeechToken;
+    if (token !== activeToken) {
+      return null;
+    }
+    if (isReady(job)) {
+      return job;
+    }
+    if (job.status === "failed") {
+      throw new Error(job.detail || "VibeVoice audio generation failed.");
+    }
+    // The server holds this request until the job moves on, so listeners share one upstream poll.
+    const previousRevision = String(job.revision || job.status || "");
+    const params = new URLSearchParams({ wait: String(VIBEVOICE_JOB_WAIT_SECONDS), since: previousRevision });
+    job = await fetchVibeVoiceJson(`${VIBEVOICE_TTS_JOBS_API_ENDPOINT}/${encodeURIComponent(jobId)}?${params}`);
+    if (String(job.revision || job.status || "") === previousRevision) {
+      await waitForVibeVoicePoll(250);
+    }
+  }
+
+  throw new Error("VibeVoice audio generation timed out.");
+}
+
 async function requestVibeVoiceAudio({ speechText, token, tokenType }) {
   const createPayload = await fetchVibeVoiceJson(VIBEVOICE_TTS_JOBS_API_ENDPOINT, {
     method: "POST",
@@ -8733,27 +8815,44 @@ async function requestVibeVoiceAudio({ speechText, token, tokenType }) {
     throw new Error("VibeVoice did not return a job id.");
   }
 
-  let job = createPayload;
-  for (let attempt = 0; attempt < 80; attempt += 1) {
-    const activeToken = tokenType === "bundle" ? bundleSpeechToken : scriptureReaderSpeechToken;
-    if (token !== activeToken) {
+  if (!Array.isArray(createPayload.chunks)) {
+    const job = await waitForVibeVoiceJob(jobId, createPayload, {
+      token,
+      tokenType,
+      isReady: (candidate) => candidate.status === "completed",
+    });
+    if (!job) {
       return null;
     }
-    if (job.status === "completed") {
-      const audioUrl = String(job.proxy_audio_url || job.audio_url || "").trim();
-      if (!audioUrl) {
-        throw new Error("VibeVoice completed without an audio URL.");
-      }
-      return buildVibeVoiceAudioResult(job, audioUrl);
+    const audioUrl = String(job.proxy_audio_url || job.audio_url || "").trim();
+    if (!audioUrl) {
+      throw new Error("VibeVoice completed without an audio URL.");
     }
-    if (job.status === "failed") {
-      throw new Error(job.detail || "VibeVoice audio generation failed.");
-    }
-    await waitForVibeVoicePoll(3000);
-    job = await fetchVibeVoiceJson(`${VIBEVOICE_TTS_JOBS_API_ENDPOINT}/${encodeURIComponent(jobId)}`);
+    return buildVibeVoiceAudioResult(job, audioUrl);
   }
 
-  throw new Error("VibeVoice audio generation timed out.");
+  // Long text is synthesized in chunks; playback starts with the first one.
+  let job = await waitForVibeVoiceJob(jobId, createPayload, {
+    token,
+    tokenType,
+    isReady: (candidate) => Boolean(getVibeVoiceChunkAudioUrl(candidate, 0)),
+  });
+  if (!job) {
+    return null;
+  }
+  const result = buildVibeVoiceAudioResult(job, getVibeVoiceChunkAudioUrl(job, 0));
+  result.nextAudioUrl = async (index) => {
+    if (!job || index >= job.chunks.length) {
+      return "";
+    }
+    job = await waitForVibeVoiceJob(jobId, job, {
+      token,
+      tokenType,
+      isReady: (candidate) => Boolean(getVibeVoiceChunkAudioUrl(candidate, index)),
+    });
+    return job ? getVibeVoiceChunkAudioUrl(job, index) : "";
+  };
+  return result;
 }
 
 async function playVibeVoiceAudioUrl(audioUrl, token, tokenType) {
@@ -8782,6 +8881,23 @@ async function playVibeVoiceAudioUrl(audioUrl, token, tokenType) {
   return true;
 }
 
+async function playVibeVoiceAudioResult(audioResult, token, tokenType) {
+  let audioUrl = audioResult.audioUrl;
+  for (let index = 1; audioUrl; index += 1) {
+    // Look up the next chunk while this one plays.
+    const nextAudioUrl = typeof audioResult.nextAudioUrl === "function"
+      ? audioResult.nextAudioUrl(index)
+      : Promise.resolve("");
+    nextAudioUrl.catch(() => {});
+    const played = await playVibeVoiceAudioUrl(audioUrl, token, tokenType);
+    if (!played) {
+      return false;
+    }
+    audioUrl = await nextAudioUrl;
+  }
+  return true;
+}
+
 function getBundleAudioContent(kind) {
   const elements = getBundleCardElements(kind);
   if (!elements?.ref || !elements?.text) {
@@ -8866,7 +8982,7 @@ async function speakBundlePassage(kind) {
     }
     setScriptureReaderStatus(`Generated ${kind} speech via ${audioResult.engineLabel}.`);
     renderBundleAudioControls();
-    await playVibeVoiceAudioUrl(audioResult.audioUrl, token, "bundle");
+    await playVibeVoiceAudioResult(audioResult, token, "bundle");
     if (token !== bundleSpeechToken) {
       return;
     }
@@ -9109,7 +9225,7 @@ async function speakScriptureReaderPassage() {
     }
     setScriptureReaderStatus(`Playing ${display.reference} via ${audioResult.engineLabel}.`);
     renderScriptureReader(true);
-    await playVibeVoiceAudioUrl(audioResult.audioUrl, token, "reader");
+    await playVibeVoiceAudioResult(audioResult, token, "reader");
     if (token !== scriptureReaderSpeechToken) {
       return;
     }